@@ -0,0 +1,327 @@
+import fnmatch
+import operator
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import time
+from collections import deque
+
+OPERATORS = {'>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le}
+KINDS = ('value', 'rate', 'avg', 'max', 'min')
+
+# Правила по умолчанию: перегрузка держится дольше указанного времени.
+# clear - уровень, ниже которого (для '>') тревога снимается, чтобы
+# значение около порога не включало и не выключало ее на каждом тике.
+DEFAULT_RULES = [
+    {'name': 'cpu_high', 'metric': 'cpu', 'op': '>', 'threshold': 90, 'clear': 80, 'for': 300,
+     'message': "Загрузка CPU выше 90% дольше 5 минут"},
+    {'name': 'mem_high', 'metric': 'mem', 'op': '>', 'threshold': 90, 'clear': 85, 'for': 60,
+     'message': "Использование памяти выше 90%"},
+    {'name': 'disk_full', 'metric': 'disk', 'op': '>', 'threshold': 95, 'clear': 93,
+     'message': "Диск заполнен более чем на 95%"},
+    {'name': 'temp_high', 'metric': 'temp', 'op': '>', 'threshold': 85, 'clear': 80, 'for': 30,
+     'message': "Температура выше 85°C"},
+    {'name': 'disk_busy', 'metric': 'disks.*.util', 'kind': 'avg', 'window': 60, 'op': '>',
+     'threshold': 90, 'clear': 70, 'for': 120,
+     'message': "Диск загружен более чем на 90%"},
+]
+
+
+def flatten_sample(sample, prefix=''):
+    # Вложенные словари показаний (sensors, nics, disks) разворачиваются в
+    # поля с именами вида "nics.eth0.rx_bytes", к которым привязываются
+    # правила.
+    flat = {}
+    for name, value in sample.items():
+        if isinstance(value, dict):
+            flat.update(flatten_sample(value, f"{prefix}{name}."))
+        else:
+            flat[f"{prefix}{name}"] = value
+    return flat
+
+
+class SlidingWindow:
+    # Агрегаты по окну последних window секунд за O(1) на значение
+    # (амортизированно): сумма обновляется при добавлении и вытеснении,
+    # максимум и минимум хранятся в монотонных очередях.
+    __slots__ = ('window', 'values', 'total', 'maxima', 'minima')
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self.total = 0.0
+        self.maxima = deque()
+        self.minima = deque()
+
+    def add(self, timestamp, value):
+        self.values.append((timestamp, value))
+        self.total += value
+        while self.maxima and self.maxima[-1][1] <= value:
+            self.maxima.pop()
+        self.maxima.append((timestamp, value))
+        while self.minima and self.minima[-1][1] >= value:
+            self.minima.pop()
+        self.minima.append((timestamp, value))
+
+        cutoff = timestamp - self.window
+        values = self.values
+        while values and values[0][0] <= cutoff:
+            self.total -= values.popleft()[1]
+        while self.maxima and self.maxima[0][0] <= cutoff:
+            self.maxima.popleft()
+        while self.minima and self.minima[0][0] <= cutoff:
+            self.minima.popleft()
+
+    def avg(self):
+        return self.total / len(self.values)
+
+    def max(self):
+        return self.maxima[0][1]
+
+    def min(self):
+        return self.minima[0][1]
+
+
+class AlertRule:
+    # Условие "metric op threshold" над значением, скоростью изменения в
+    # секунду (rate) или агрегатом за window секунд (avg/max/min), которое
+    # должно выполняться не меньше for_seconds. metric может быть шаблоном
+    # ("disks.*.util") - тогда состояние ведется для каждого поля отдельно.
+    def __init__(self, name, metric, threshold, op='>', clear=None, for_seconds=0,
+                 kind='value', window=60, message=None, hook=None):
+        if op not in OPERATORS:
+            raise ValueError(f"{name}: неизвестный оператор {op!r}")
+        if kind not in KINDS:
+            raise ValueError(f"{name}: неизвестный тип правила {kind!r}")
+        if kind in ('avg', 'max', 'min') and not window > 0:
+            raise ValueError(f"{name}: окно должно быть больше 0 секунд, указано {window!r}")
+        self.name = name
+        self.metric = metric
+        self.op = op
+        self.threshold = float(threshold)
+        self.clear = float(clear) if clear is not None else self.threshold
+        self.for_seconds = for_seconds
+        self.kind = kind
+        self.window = window
+        self.message = message
+        self.hook = hook
+        self.compare = OPERATORS[op]
+        self.pattern = any(char in metric for char in '*?[')
+
+    @classmethod
+    def from_dict(cls, config):
+        return cls(
+            config['name'],
+            config['metric'],
+            config['threshold'],
+            op=config.get('op', '>'),
+            clear=config.get('clear'),
+            for_seconds=config.get('for', 0),
+            kind=config.get('kind', 'value'),
+            window=config.get('window', 60),
+            message=config.get('message'),
+            hook=config.get('hook'),
+        )
+
+    def matches(self, field):
+        return fnmatch.fnmatchcase(field, self.metric) if self.pattern else field == self.metric
+
+
+class RuleState:
+    __slots__ = ('rule', 'field', 'window', 'last_time', 'last_value', 'pending_since', 'firing', 'value')
+
+    def __init__(self, rule, field):
+        self.rule = rule
+        self.field = field
+        self.window = SlidingWindow(rule.window) if rule.kind in ('avg', 'max', 'min') else None
+        self.last_time = None
+        self.last_value = None
+        self.pending_since = None
+        self.firing = False
+        self.value = None
+
+
+class AlertEvent:
+    __slots__ = ('rule', 'field', 'state', 'value', 'time')
+
+    def __init__(self, rule, field, state, value, timestamp):
+        self.rule = rule
+        self.field = field
+        self.state = state
+        self.value = value
+        self.time = timestamp
+
+    @property
+    def firing(self):
+        return self.state == 'firing'
+
+    def summary(self):
+        text = self.rule.message or f"{self.field} {self.rule.op} {self.rule.threshold:g}"
+        if self.rule.pattern:
+            text += f" ({self.field})"
+        status = "⚠" if self.firing else "✅ снято:"
+        return f"{status} {text}, значение {self.value:.1f}"
+
+
+class AlertEngine:
+    # Правила проверяются на каждом опубликованном показании (подписчик
+    # MetricsCollector). Все состояние правила - несколько чисел и окно
+    # агрегата, поэтому проверка не зависит от длины истории. Привязка
+    # правил к полям пересчитывается, только когда меняется набор полей.
+    def __init__(self, rules=()):
+        self.rules = list(rules)
+        self.listeners = []
+        self.states = []
+        self.by_key = {}
+        self._fields = None
+
+    def subscribe(self, callback):
+        if callback not in self.listeners:
+            self.listeners.append(callback)
+
+    @property
+    def active(self):
+        return [state for state in self.states if state.firing]
+
+    def bind(self, fields):
+        # Возвращает состояния, чьих полей больше нет в показании.
+        states = []
+        for rule in self.rules:
+            for field in fields:
+                if rule.matches(field):
+                    key = (rule.name, field)
+                    state = self.by_key.get(key) or RuleState(rule, field)
+                    states.append(state)
+        by_key = {(state.rule.name, state.field): state for state in states}
+        dropped = [state for key, state in self.by_key.items() if key not in by_key]
+        self.states = states
+        self.by_key = by_key
+        self._fields = fields
+        return dropped
+
+    def evaluate(self, sample):
+        flat = flatten_sample(sample)
+        now = flat.get('time') or time.time()
+        events = []
+        if flat.keys() != self._fields:
+            # Поле пропало (отключен интерфейс, исчез датчик) - сработавшие
+            # по нему тревоги снимаются, иначе они остались бы открытыми.
+            for state in self.bind(flat.keys()):
+                if state.firing:
+                    state.firing = False
+                    events.append(AlertEvent(state.rule, state.field, 'resolved', state.value, now))
+        for state in self.states:
+            value = flat.get(state.field)
+            if value is None or value != value:
+                continue
+            rule = state.rule
+
+            kind = rule.kind
+            if kind == 'value':
+                measured = value
+            elif kind == 'rate':
+                last_time = state.last_time
+                state.last_time = now
+                previous, state.last_value = state.last_value, value
+                if last_time is None or now <= last_time:
+                    continue
+                measured = (value - previous) / (now - last_time)
+            else:
+                window = state.window
+                window.add(now, value)
+                measured = window.avg() if kind == 'avg' else window.max() if kind == 'max' else window.min()
+            state.value = measured
+
+            if state.firing:
+                # Тревога снимается только по другую сторону уровня clear.
+                if not rule.compare(measured, rule.clear):
+                    state.firing = False
+                    state.pending_since = None
+                    events.append(AlertEvent(rule, state.field, 'resolved', measured, now))
+            elif rule.compare(measured, rule.threshold):
+                if state.pending_since is None:
+                    state.pending_since = now
+                if now - state.pending_since >= rule.for_seconds:
+                    state.firing = True
+                    events.append(AlertEvent(rule, state.field, 'firing', measured, now))
+            else:
+                state.pending_since = None
+
+        for event in events:
+            for callback in self.listeners:
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"Ошибка обработчика уведомлений: {e}")
+        return events
+
+
+def notification_command(title, text):
+    # Команда уведомления рабочего стола для текущей системы или None.
+    if sys.platform == 'darwin':
+        script = f"display notification {quote_applescript(text)} with title {quote_applescript(title)}"
+        return ['osascript', '-e', script]
+    if sys.platform.startswith('win'):
+        return None
+    if shutil.which('notify-send'):
+        return ['notify-send', '--app-name=System Monitor', title, text]
+    return None
+
+
+def quote_applescript(text):
+    return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+class AlertNotifier:
+    # Доставка событий AlertEngine: уведомление рабочего стола и локальный
+    # обработчик (hook правила или общий). Команды запускаются без ожидания
+    # завершения, чтобы не задерживать поток сборщика; завершившиеся
+    # процессы собираются при следующих событиях. Данные события
+    # передаются обработчику в переменных окружения ALERT_*.
+    def __init__(self, hook=None, desktop=True, enabled=True):
+        self.hook = hook
+        self.desktop = desktop
+        self.enabled = enabled
+        self.running = []
+
+    def __call__(self, event):
+        if not self.enabled:
+            return
+        self.running = [proc for proc in self.running if proc.poll() is None]
+        text = event.summary()
+        if self.desktop:
+            command = notification_command("System Monitor", text)
+            if command is not None:
+                self.spawn(command)
+        hook = event.rule.hook or self.hook
+        if hook:
+            env = dict(os.environ)
+            env.update({
+                'ALERT_NAME': event.rule.name,
+                'ALERT_METRIC': event.field,
+                'ALERT_STATE': event.state,
+                'ALERT_VALUE': f"{event.value:g}",
+                'ALERT_THRESHOLD': f"{event.rule.threshold:g}",
+                'ALERT_TIME': f"{event.time:.3f}",
+                'ALERT_MESSAGE': text,
+            })
+            self.spawn(shlex.split(hook, posix=os.name != 'nt'), env)
+
+    def spawn(self, command, env=None):
+        try:
+            self.running.append(subprocess.Popen(command, env=env, stdin=subprocess.DEVNULL,
+                                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+        except OSError as e:
+            print(f"Ошибка запуска {command[0]}: {e}")
+
+
+def load_rules(config):
+    rules = []
+    for item in config:
+        try:
+            rules.append(AlertRule.from_dict(item))
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"Ошибка в правиле уведомлений {item}: {e}")
+    return rules
@@ -0,0 +1,141 @@
+import time
+
+import numpy as np
+
+from history import RingBuffer
+
+# Минимальное стандартное отклонение по метрикам: у почти постоянного ряда
+# (заполнение диска) дисперсия близка к нулю, и без нижней границы
+# аномалией оказывалось бы любое изменение.
+DEFAULT_MIN_STD = {'cpu': 2.0, 'mem': 1.0, 'disk': 0.5, 'net': 0.05, 'temp': 1.0, 'io': 0.5}
+
+
+class AnomalyDetector:
+    # Потоковое обнаружение выбросов сразу по всем метрикам: состояние -
+    # несколько массивов NumPy (по элементу на метрику), каждое показание
+    # обновляет их за O(1).
+    #
+    # Базовая линия - экспоненциально взвешенные среднее и дисперсия
+    # (alpha); точка отмечается, если |z| > threshold. Дополнительно
+    # ведутся сезонные базовые линии по часу суток: если для текущего
+    # часа данных достаточно, точка должна выделяться и относительно
+    # него, поэтому регулярные ежедневные всплески (резервное копирование
+    # по ночам) не отмечаются. Влияние выброса на базовую линию
+    # ограничивается threshold стандартными отклонениями.
+    def __init__(self, metrics, capacity=86400, alpha=0.02, threshold=4.0, warmup=60,
+                 season_buckets=24, season_alpha=1e-4, season_warmup=3600, min_std=None,
+                 relative_std=0.05, interval=1.0):
+        self.metrics = tuple(metrics)
+        self.interval = interval
+        count = len(self.metrics)
+        self.alpha = alpha
+        self.threshold = threshold
+        self.warmup = warmup
+        self.season_buckets = season_buckets
+        self.season_alpha = season_alpha
+        self.season_warmup = season_warmup
+        self.relative_std = relative_std
+        floors = dict(DEFAULT_MIN_STD, **(min_std or {}))
+        self.min_std = np.array([floors.get(name, 1e-6) for name in self.metrics], dtype=np.float64)
+
+        self.mean = np.zeros(count)
+        self.var = np.zeros(count)
+        self.count = np.zeros(count, dtype=np.int64)
+        self.season_mean = np.zeros((season_buckets, count))
+        self.season_var = np.zeros((season_buckets, count))
+        self.season_count = np.zeros((season_buckets, count), dtype=np.int64)
+        self.scores = np.zeros(count)
+        self.flags = {name: RingBuffer(capacity, dtype=bool) for name in self.metrics}
+
+    def std(self, mean, var):
+        return np.maximum(np.maximum(np.sqrt(var), self.min_std), np.abs(mean) * self.relative_std)
+
+    def update(self, sample):
+        values = np.array([np.nan if sample.get(name) is None else sample[name] for name in self.metrics],
+                          dtype=np.float64)
+        return self.update_values(sample['time'], values)
+
+    def update_values(self, timestamp, values):
+        finite = np.isfinite(values)
+        x = np.where(finite, values, self.mean)
+        threshold = self.threshold
+
+        std = self.std(self.mean, self.var)
+        z = (x - self.mean) / std
+        flagged = finite & (self.count >= self.warmup) & (np.abs(z) > threshold)
+
+        bucket = time.localtime(timestamp).tm_hour * self.season_buckets // 24
+        season_mean = self.season_mean[bucket]
+        season_var = self.season_var[bucket]
+        season_count = self.season_count[bucket]
+        season_std = self.std(season_mean, season_var)
+        season_z = (x - season_mean) / season_std
+        flagged &= (season_count < self.season_warmup) | (np.abs(season_z) > threshold)
+        self.scores = np.where(finite, z, 0.0)
+
+        # Пока данных мало, alpha = 1/n (обычное среднее), затем - заданная.
+        # Первое значение берется как есть (alpha = 1, без ограничения), иначе
+        # среднее долго подтягивалось бы от нуля шагами по threshold * std.
+        alpha = np.maximum(1.0 / (self.count + 1), self.alpha)
+        diff = np.where(self.count == 0, x - self.mean, np.clip(x - self.mean, -threshold * std, threshold * std))
+        step = alpha * diff
+        self.mean += np.where(finite, step, 0.0)
+        self.var = np.where(finite, (1 - alpha) * (self.var + diff * step), self.var)
+        self.count += finite
+
+        alpha = np.maximum(1.0 / (season_count + 1), self.season_alpha)
+        diff = np.where(season_count == 0, x - season_mean,
+                        np.clip(x - season_mean, -threshold * season_std, threshold * season_std))
+        step = alpha * diff
+        season_mean += np.where(finite, step, 0.0)
+        season_var[:] = np.where(finite, (1 - alpha) * (season_var + diff * step), season_var)
+        season_count += finite
+
+        for name, flag in zip(self.metrics, flagged):
+            self.flags[name].append(flag)
+        return flagged
+
+    def prime(self, history, recent=600, rollup=60):
+        # Разогрев после запуска по загруженной истории (MetricHistory).
+        # Сезонные базовые линии считаются по минутным агрегатам за все
+        # сохраненные дни, затем последние recent показаний проходят через
+        # update_values, чтобы не ждать warmup; отметки выровнены с
+        # историей по концу.
+        with history.lock:
+            tier = next((tier for tier in history.tiers if tier.bucket >= rollup), None)
+            if tier is not None and len(tier):
+                times = np.array(tier.times.view())
+                columns = [np.column_stack([np.array(getattr(tier, kind)[name].view()) for name in self.metrics])
+                           for kind in ('avg', 'min', 'max')]
+                self.seed_seasons(times, *columns, tier.bucket / self.interval)
+            times = history.time_window(recent)
+            values = np.column_stack([history.window(name, recent) for name in self.metrics])
+        for timestamp, row in zip(times, values):
+            self.update_values(timestamp, row)
+
+    def seed_seasons(self, times, avg, low, high, samples_per_row):
+        # Среднее сезонной линии - среднее агрегатов за этот час суток;
+        # дисперсия - разброс агрегатов между собой плюс оценка разброса
+        # внутри агрегата по его min/max ((max - min) / 4 как сигма).
+        buckets = np.array([time.localtime(timestamp).tm_hour for timestamp in times],
+                           dtype=np.intp) * self.season_buckets // 24
+        for bucket in range(self.season_buckets):
+            rows = buckets == bucket
+            if not rows.any():
+                continue
+            values = avg[rows]
+            finite = np.isfinite(values)
+            count = finite.sum(axis=0)
+            known = count > 0
+            total = np.maximum(count, 1)
+            mean = np.where(finite, values, 0.0).sum(axis=0) / total
+            between = np.where(finite, values - mean, 0.0) ** 2
+            spread = np.where(finite, (high[rows] - low[rows]) / 4, 0.0) ** 2
+            var = (between.sum(axis=0) + spread.sum(axis=0)) / total
+            self.season_mean[bucket] = np.where(known, mean, self.season_mean[bucket])
+            self.season_var[bucket] = np.where(known, var, self.season_var[bucket])
+            self.season_count[bucket] = np.where(known, (count * samples_per_row).astype(np.int64),
+                                                 self.season_count[bucket])
+
+    def window(self, name, n=None):
+        return self.flags[name].view(n).copy()
@@ -0,0 +1,115 @@
+import argparse
+import time
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from charts import BlitRenderer, FullRedrawRenderer
+from history import MetricHistory
+
+METRICS = ('cpu', 'mem', 'disk', 'net', 'temp', 'io')
+
+
+def make_canvas(use_tk):
+    fig = Figure(figsize=(10, 8), dpi=100, facecolor='#2c3e50')
+    fig.subplots_adjust(hspace=0.4, wspace=0.3)
+    axes = {name: fig.add_subplot(321 + i) for i, name in enumerate(METRICS)}
+
+    if use_tk:
+        import tkinter as tk
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        root = tk.Tk()
+        canvas = FigureCanvasTkAgg(fig, root)
+        canvas.get_tk_widget().pack(fill='both', expand=True)
+        root.update()
+        return canvas, axes, root
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    return FigureCanvasAgg(fig), axes, None
+
+
+def fill_history(history, count, rng):
+    now = time.time()
+    for i in range(count):
+        history.append({
+            'time': now + i,
+            'cpu': rng.uniform(0, 100),
+            'mem': rng.uniform(40, 60),
+            'disk': 70.0,
+            'net': 100 + i * 0.01,
+            'temp': rng.uniform(40, 70),
+            'io': rng.uniform(0, 50),
+        })
+
+
+def run(renderer_cls, frames, window, use_tk):
+    rng = np.random.default_rng(0)
+    history = MetricHistory(METRICS, capacity=max(window * 2, 1000))
+    fill_history(history, window, rng)
+
+    canvas, axes, root = make_canvas(use_tk)
+    renderer = renderer_cls(canvas, axes, window=window)
+    renderer.update(history)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for _ in range(frames):
+        fill_history(history, 1, rng)
+        renderer.update(history)
+        if root is not None:
+            root.update_idletasks()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    if root is not None:
+        root.destroy()
+    return frames / wall, cpu / frames * 1000
+
+
+def run_range(frames, span, use_tk):
+    rng = np.random.default_rng(0)
+    history = MetricHistory(METRICS)
+    end = time.time()
+    times = np.arange(end - span, end, 1.0)
+    columns = {'time': times}
+    for name in METRICS:
+        columns[name] = rng.uniform(0, 100, len(times))
+    history.backfill(columns)
+
+    canvas, axes, root = make_canvas(use_tk)
+    renderer = BlitRenderer(canvas, axes)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for _ in range(frames):
+        series = history.range(end - span, end, renderer.pixel_width('cpu'))
+        renderer.show_range(series, end - span, end)
+        if root is not None:
+            root.update_idletasks()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    if root is not None:
+        root.destroy()
+    return frames / wall, cpu / frames * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Сравнение полной перерисовки графиков и блиттинга")
+    parser.add_argument('--frames', type=int, default=200)
+    parser.add_argument('--window', type=int, default=300)
+    parser.add_argument('--tk', action='store_true', help="рисовать в окне Tk (нужен дисплей)")
+    args = parser.parse_args(argv)
+
+    print(f"{'Режим':<14}{'FPS':>10}{'CPU мс/кадр':>14}")
+    for label, renderer_cls in (('full redraw', FullRedrawRenderer), ('blit', BlitRenderer)):
+        fps, cpu_ms = run(renderer_cls, args.frames, args.window, args.tk)
+        print(f"{label:<14}{fps:>10.1f}{cpu_ms:>14.2f}")
+
+    for label, span in (('range 1 h', 3600), ('range 7 d', 7 * 86400)):
+        fps, cpu_ms = run_range(max(args.frames // 10, 1), span, args.tk)
+        print(f"{label:<14}{fps:>10.1f}{cpu_ms:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
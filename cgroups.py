@@ -0,0 +1,145 @@
+import os
+import time
+
+CGROUP_ROOTS = ('/sys/fs/cgroup', '/sys/fs/cgroup/unified')
+
+
+def find_cgroup_root(candidates=CGROUP_ROOTS):
+    # cgroup v2: в корне единой иерархии есть cgroup.controllers. В
+    # гибридном режиме (systemd) она смонтирована в /sys/fs/cgroup/unified.
+    for root in candidates:
+        if os.path.exists(os.path.join(root, 'cgroup.controllers')):
+            return root
+    return None
+
+
+def read_int(path):
+    try:
+        with open(path, 'rb') as f:
+            return int(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def read_keyed(path):
+    # cpu.stat: строки "ключ значение".
+    values = {}
+    try:
+        with open(path, 'rb') as f:
+            for line in f:
+                key, _, value = line.partition(b' ')
+                values[key] = int(value)
+    except (OSError, ValueError):
+        return None
+    return values
+
+
+def read_io_stat(path):
+    # io.stat: строка на устройство, "8:0 rbytes=... wbytes=... rios=... wios=...".
+    rbytes = wbytes = 0
+    try:
+        with open(path, 'rb') as f:
+            for line in f:
+                for item in line.split()[1:]:
+                    key, _, value = item.partition(b'=')
+                    if key == b'rbytes':
+                        rbytes += int(value)
+                    elif key == b'wbytes':
+                        wbytes += int(value)
+    except (OSError, ValueError):
+        return None
+    return rbytes, wbytes
+
+
+class CgroupStats:
+    __slots__ = ('path', 'cpu_usec', 'io_bytes', 'memory', 'pids', 'cpu', 'io_read', 'io_write')
+
+    def __init__(self, path, cpu_usec, io_bytes, memory, pids):
+        self.path = path
+        self.cpu_usec = cpu_usec
+        self.io_bytes = io_bytes
+        self.memory = memory
+        self.pids = pids
+        self.cpu = None
+        self.io_read = None
+        self.io_write = None
+
+    @property
+    def name(self):
+        return os.path.basename(self.path) or '/'
+
+    @property
+    def parent(self):
+        if self.path == '/':
+            return None
+        return os.path.dirname(self.path)
+
+
+class CgroupCollector:
+    # Обход дерева cgroup v2 с чтением cpu.stat, memory.current, io.stat и
+    # pids.current каждой группы. Ядро уже суммирует их по поддереву, так
+    # что складывать значения процессов не нужно. Скорости (CPU%, чтение и
+    # запись в байтах/с) считаются по разнице с предыдущим проходом.
+    def __init__(self, root=None):
+        self.root = root if root is not None else find_cgroup_root()
+        self.previous = {}
+        self.sampled_at = None
+
+    @property
+    def available(self):
+        return self.root is not None
+
+    def walk(self):
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            yield directory
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except OSError:
+                continue
+
+    def read_group(self, directory):
+        relative = '/' + os.path.relpath(directory, self.root).replace(os.sep, '/')
+        if relative == '/.':
+            relative = '/'
+        cpu = read_keyed(os.path.join(directory, 'cpu.stat'))
+        return CgroupStats(
+            relative,
+            cpu.get(b'usage_usec') if cpu else None,
+            read_io_stat(os.path.join(directory, 'io.stat')),
+            read_int(os.path.join(directory, 'memory.current')),
+            read_int(os.path.join(directory, 'pids.current')),
+        )
+
+    def sample(self):
+        if self.root is None:
+            return {}
+        now = time.monotonic()
+        elapsed = now - self.sampled_at if self.sampled_at is not None else None
+        groups = {}
+        for directory in self.walk():
+            stats = self.read_group(directory)
+            old = self.previous.get(stats.path)
+            if old is not None and elapsed:
+                if stats.cpu_usec is not None and old.cpu_usec is not None:
+                    stats.cpu = max(stats.cpu_usec - old.cpu_usec, 0) / (elapsed * 1e6) * 100
+                if stats.io_bytes is not None and old.io_bytes is not None:
+                    stats.io_read = max(stats.io_bytes[0] - old.io_bytes[0], 0) / elapsed
+                    stats.io_write = max(stats.io_bytes[1] - old.io_bytes[1], 0) / elapsed
+            groups[stats.path] = stats
+
+        self.previous = groups
+        self.sampled_at = now
+        return groups
+
+    def processes(self, path):
+        procs = os.path.join(self.root, path.lstrip('/'), 'cgroup.procs')
+        try:
+            with open(procs, 'rb') as f:
+                return [int(line) for line in f if line.strip()]
+        except (OSError, ValueError):
+            return []
@@ -0,0 +1,166 @@
+import numpy as np
+
+from history import lttb
+
+CHART_SERIES = (
+    ('cpu', 'Использование CPU (%)', 'r-', (0, 100)),
+    ('mem', 'Использование памяти (%)', 'b-', (0, 100)),
+    ('disk', 'Использование диска (%)', 'g-', (0, 100)),
+    ('net', 'Сетевой трафик (MB/s)', 'm-', None),
+    ('temp', 'Температура (°C)', 'y-', None),
+    ('io', 'Диск I/O (MB/s)', 'c-', None),
+)
+
+AXES_BG = '#34495e'
+SPINE_COLOR = '#7f8c8d'
+GRID_STYLE = {'color': '#7f8c8d', 'linestyle': '--', 'alpha': 0.3}
+ANOMALY_STYLE = {'linestyle': 'none', 'marker': 'o', 'markersize': 6, 'markerfacecolor': 'none',
+                 'markeredgecolor': '#f1c40f', 'markeredgewidth': 1.5}
+
+
+def style_axes(ax):
+    ax.set_facecolor(AXES_BG)
+    ax.tick_params(colors='white')
+    for spine in ax.spines.values():
+        spine.set_color(SPINE_COLOR)
+    ax.title.set_color('white')
+    ax.xaxis.label.set_color('white')
+    ax.yaxis.label.set_color('white')
+
+
+class FullRedrawRenderer:
+    # Прежний способ отрисовки: очистка осей и полная перерисовка холста на
+    # каждом тике. Оставлен для сравнения в bench_charts.py.
+    def __init__(self, canvas, axes, window=50):
+        self.canvas = canvas
+        self.axes = axes
+        self.window = window
+
+    def update(self, history):
+        for name, title, fmt, limits in CHART_SERIES:
+            ax = self.axes[name]
+            ax.clear()
+            style_axes(ax)
+            ax.plot(history.window(name, self.window), fmt, linewidth=2)
+            ax.set_title(title)
+            ax.grid(True, **GRID_STYLE)
+            if limits is not None:
+                ax.set_ylim(*limits)
+
+        self.canvas.draw()
+
+
+class BlitRenderer:
+    def __init__(self, canvas, axes, window=300):
+        self.canvas = canvas
+        self.figure = canvas.figure
+        self.axes = axes
+        self.lines = {}
+        self.markers = {}
+        self.fixed_limits = {}
+        self.background = None
+        self.set_window(window)
+
+        for name, title, fmt, limits in CHART_SERIES:
+            ax = self.axes[name]
+            style_axes(ax)
+            ax.set_title(title)
+            ax.grid(True, **GRID_STYLE)
+            ax.set_xlim(0, self.window - 1)
+            ax.set_ylim(*(limits or (0, 1)))
+            line, = ax.plot([], [], fmt, linewidth=2, animated=True)
+            self.lines[name] = line
+            self.markers[name], = ax.plot([], [], animated=True, **ANOMALY_STYLE)
+            self.fixed_limits[name] = limits is not None
+
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
+    def set_window(self, window):
+        self.window = max(int(window), 2)
+        self._x = np.arange(self.window, dtype=np.float64)
+        self.background = None
+        for ax in self.axes.values():
+            ax.set_xlim(0, self.window - 1)
+
+    def pixel_width(self, name):
+        return max(int(self.axes[name].bbox.width), 3)
+
+    def artists(self):
+        yield from self.lines.values()
+        yield from self.markers.values()
+
+    def on_draw(self, event=None):
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        for line in self.artists():
+            line.axes.draw_artist(line)
+
+    def rescale(self, name, values):
+        if self.fixed_limits[name] or not len(values):
+            return False
+
+        low = np.nanmin(values) if np.isfinite(values).any() else 0.0
+        high = np.nanmax(values) if np.isfinite(values).any() else 1.0
+        ax = self.axes[name]
+        bottom, top = ax.get_ylim()
+
+        if low >= bottom and high <= top and (top <= 1 or high >= bottom + (top - bottom) * 0.25):
+            return False
+
+        span = max(high - low, abs(high) * 0.1, 1.0)
+        ax.set_ylim(min(0.0, low - span * 0.1), high + span * 0.2)
+        return True
+
+    def update(self, history, anomalies=None):
+        # anomalies - AnomalyDetector: отмеченные точки рисуются маркерами
+        # по исходным (не прореженным) значениям, чтобы LTTB их не потерял.
+        # Значения и отметки читаются под одной блокировкой истории, под
+        # которой они и дописываются, чтобы отметки не сдвигались на тик.
+        redraw = self.background is None
+        with history.lock:
+            windows = {name: (history.window(name, self.window),
+                              anomalies.window(name, self.window) if anomalies is not None else None)
+                       for name in self.lines}
+        for name, line in self.lines.items():
+            values, flags = windows[name]
+            x = self._x[:len(values)]
+            if flags is not None:
+                offset = len(values) - len(flags)
+                flagged = np.flatnonzero(flags) + offset
+                self.markers[name].set_data(x[flagged], values[flagged])
+            if len(values) > self.pixel_width(name):
+                x, values = lttb(x, values, self.pixel_width(name))
+            line.set_data(x, values)
+            if self.rescale(name, values):
+                redraw = True
+
+        self.present(redraw)
+
+    def present(self, redraw):
+        # Полная перерисовка (и новый кэш фона в on_draw) - только при смене
+        # осей; иначе поверх фона перерисовываются одни линии.
+        if redraw or self.background is None:
+            self.canvas.draw()
+            return
+
+        self.canvas.restore_region(self.background)
+        for line in self.artists():
+            line.axes.draw_artist(line)
+        for ax in self.axes.values():
+            self.canvas.blit(ax.bbox)
+
+    def show_range(self, series, start, end):
+        # График за прошедший период: ось X - секунды до end, поэтому при
+        # обновлении того же периода оси не меняются и работает блиттинг.
+        redraw = False
+        limits = (start - end, 0)
+        for name, line in self.lines.items():
+            times, values = series.get(name, (np.empty(0), np.empty(0)))
+            line.set_data(times - end, values)
+            self.markers[name].set_data([], [])
+            ax = self.axes[name]
+            if not np.allclose(ax.get_xlim(), limits):
+                ax.set_xlim(*limits)
+                redraw = True
+            if self.rescale(name, values):
+                redraw = True
+        self.present(redraw)
@@ -0,0 +1,98 @@
+import os
+
+from scanner import ParallelWalker
+
+
+def temp_directories():
+    dirs = [
+        os.environ.get('TEMP', ''),
+        os.environ.get('TMP', ''),
+        '/tmp',
+        '/var/tmp',
+        os.path.expanduser('~/AppData/Local/Temp')
+    ]
+    return unique_existing(dirs)
+
+
+def history_locations():
+    if os.name == 'nt':
+        paths = [
+            os.path.expanduser('~\\AppData\\Local\\Microsoft\\Windows\\History'),
+            os.path.expanduser('~\\AppData\\Local\\Google\\Chrome\\User Data\\Default\\History'),
+            os.path.expanduser('~\\AppData\\Roaming\\Mozilla\\Firefox\\Profiles')
+        ]
+    else:
+        paths = [
+            os.path.expanduser('~/.config/google-chrome/Default/History'),
+            os.path.expanduser('~/.mozilla/firefox')
+        ]
+    return unique_existing(paths)
+
+
+def unique_existing(paths):
+    # TEMP и TMP часто указывают на один каталог - он не должен
+    # обходиться дважды.
+    seen = set()
+    result = []
+    for path in paths:
+        if not path or not os.path.exists(path):
+            continue
+        real = os.path.realpath(path)
+        if real not in seen:
+            seen.add(real)
+            result.append(path)
+    return result
+
+
+def is_history_file(name):
+    name = name.lower()
+    return 'history' in name or 'cache' in name
+
+
+class CleanupJob(ParallelWalker):
+    # Удаление файлов (или, при dry_run, только подсчет того, что было бы
+    # удалено) параллельно по каталогам. match(name) отбирает файлы по
+    # имени; None - все файлы. Файл, переданный как корень, обрабатывается
+    # сам по себе.
+    def __init__(self, roots, match=None, dry_run=False, workers=4, **options):
+        super().__init__(roots, workers=workers, **options)
+        self.match = match
+        self.dry_run = dry_run
+
+    def remove(self, path, size):
+        if not self.dry_run:
+            os.remove(path)
+        return size
+
+    def visit(self, path, device):
+        files = 0
+        total = 0
+        errors = 0
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if self._cancel.is_set():
+                        break
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            self.descend(entry, device)
+                        elif self.match is None or self.match(entry.name):
+                            total += self.remove(entry.path, entry.stat(follow_symlinks=False).st_size)
+                            files += 1
+                    except OSError:
+                        errors += 1
+        except NotADirectoryError:
+            try:
+                if self.match is None or self.match(os.path.basename(path)):
+                    total += self.remove(path, os.stat(path, follow_symlinks=False).st_size)
+                    files += 1
+            except OSError:
+                errors += 1
+        except OSError:
+            errors += 1
+
+        with self._lock:
+            self.stats.dirs += 1
+            self.stats.files += files
+            self.stats.bytes += total
+            self.stats.errors += errors
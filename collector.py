@@ -0,0 +1,286 @@
+import heapq
+import importlib
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import psutil
+
+from diskio import DiskIORates
+from network import InterfaceRates
+from sensors import SensorReader
+
+
+def probe_cpu():
+    return {'cpu': psutil.cpu_percent()}
+
+
+def probe_memory():
+    return {'mem': psutil.virtual_memory().percent}
+
+
+def probe_disk():
+    return {'disk': psutil.disk_usage('/').percent}
+
+
+class Probe:
+    # interval=None - опрашивать на каждом тике публикации. threaded=True -
+    # выполнять в пуле потоков с ограничением по времени (timeout), чтобы
+    # медленный датчик не задерживал остальные. budget - допустимое время
+    # одного опроса: при превышении интервал опроса временно удваивается.
+    def __init__(self, name, func, interval=None, timeout=5.0, budget=0.05, threaded=False):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.timeout = timeout
+        self.budget = budget
+        self.threaded = threaded
+        self.backoff = 1
+        self.runs = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.skipped = 0
+        self.last_duration = 0.0
+        self.total_duration = 0.0
+        self.started_at = None
+        self.future = None
+
+    def effective_interval(self, tick):
+        return (self.interval or tick) * self.backoff
+
+    def record(self, duration):
+        self.runs += 1
+        self.last_duration = duration
+        self.total_duration += duration
+        if self.budget and duration > self.budget:
+            self.backoff = min(self.backoff * 2, 16)
+        elif self.backoff > 1:
+            self.backoff //= 2
+
+    def stats(self):
+        return {
+            'runs': self.runs,
+            'errors': self.errors,
+            'timeouts': self.timeouts,
+            'skipped': self.skipped,
+            'last_duration': self.last_duration,
+            'avg_duration': self.total_duration / self.runs if self.runs else 0.0,
+            'backoff': self.backoff,
+        }
+
+
+class CollectorRegistry:
+    def __init__(self):
+        self.probes = {}
+
+    def __iter__(self):
+        return iter(self.probes.values())
+
+    def __contains__(self, name):
+        return name in self.probes
+
+    def register(self, name, func, **options):
+        probe = Probe(name, func, **options)
+        self.probes[name] = probe
+        return probe
+
+    def unregister(self, name):
+        self.probes.pop(name, None)
+
+    def configure(self, name, **options):
+        probe = self.probes[name]
+        for key, value in options.items():
+            setattr(probe, key, value)
+
+
+def register_builtin_probes(registry, sensors=None):
+    # Датчики температуры читаются из sysfs напрямую и достаточно дешевы
+    # для опроса в основном потоке; GPUtil запускает nvidia-smi, поэтому
+    # GPU опрашивается реже и в пуле потоков, и только если он найден.
+    sensors = sensors if sensors is not None else SensorReader()
+    registry.register('cpu', probe_cpu)
+    registry.register('mem', probe_memory)
+    registry.register('net', InterfaceRates().probe)
+    registry.register('disk', probe_disk, interval=5.0)
+    registry.register('io', DiskIORates().probe)
+    registry.register('temp', sensors.probe, interval=2.0)
+    if sensors.gpu_available:
+        registry.register('gpu', sensors.probe_gpu, interval=10.0, timeout=5.0, budget=1.0, threaded=True)
+    return registry
+
+
+def load_plugins(registry, modules):
+    # Модуль плагина должен объявить функцию register(registry) и
+    # зарегистрировать в ней свои датчики через registry.register(...).
+    for name in modules:
+        try:
+            module = importlib.import_module(name)
+            module.register(registry)
+        except Exception as e:
+            print(f"Ошибка загрузки плагина {name}: {e}")
+
+
+def default_registry(plugins=(), intervals=None, sensors=None):
+    registry = register_builtin_probes(CollectorRegistry(), sensors)
+    load_plugins(registry, plugins)
+    for name, interval in (intervals or {}).items():
+        if name in registry:
+            registry.configure(name, interval=interval)
+    return registry
+
+
+class MetricsCollector:
+    # Планировщик на куче таймеров: у каждого датчика свой срок следующего
+    # опроса, а отдельная задача публикации раз в interval секунд рассылает
+    # подписчикам последние значения всех датчиков.
+    PROBE, PUBLISH = 0, 1
+
+    def __init__(self, interval=1.0, registry=None, workers=2):
+        self.interval = interval
+        self.registry = registry if registry is not None else default_registry()
+        self.subscribers = []
+        self.latest = None
+        self.values = {}
+        self.running = False
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._executor = None
+        self._heap = []
+        self._seq = itertools.count()
+
+    def subscribe(self, callback):
+        with self._lock:
+            if callback not in self.subscribers:
+                self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self.subscribers:
+                self.subscribers.remove(callback)
+
+    def run_probe(self, probe):
+        started = time.perf_counter()
+        try:
+            values = probe.func()
+        except Exception as e:
+            probe.errors += 1
+            print(f"Ошибка датчика {probe.name}: {e}")
+            values = None
+        probe.record(time.perf_counter() - started)
+        return values
+
+    def store_values(self, values):
+        if values:
+            with self._lock:
+                self.values.update(values)
+
+    def poll_threaded(self, probe):
+        if probe.future is not None:
+            if probe.future.done():
+                probe.future = None
+            elif time.perf_counter() - probe.started_at > probe.timeout:
+                # Зависший опрос нельзя прервать, но его результат будет
+                # отброшен, а новый опрос не запустится, пока он не завершится.
+                probe.timeouts += 1
+                probe.backoff = min(probe.backoff * 2, 16)
+                return
+            else:
+                probe.skipped += 1
+                return
+
+        started_at = time.perf_counter()
+        probe.started_at = started_at
+
+        def finished(future):
+            if future.cancelled() or time.perf_counter() - started_at > probe.timeout:
+                return
+            self.store_values(future.result())
+
+        probe.future = self._executor.submit(self.run_probe, probe)
+        probe.future.add_done_callback(finished)
+
+    def snapshot(self):
+        with self._lock:
+            sample = dict(self.values)
+        sample['time'] = time.time()
+        return sample
+
+    def publish(self, sample):
+        with self._lock:
+            subscribers = list(self.subscribers)
+
+        for callback in subscribers:
+            try:
+                callback(sample)
+            except Exception as e:
+                print(f"Ошибка подписчика: {e}")
+
+    def schedule(self, due, kind, probe=None):
+        heapq.heappush(self._heap, (due, kind, next(self._seq), probe))
+
+    def run(self):
+        # Медленные датчики запускаются заранее, чтобы их значения по
+        # возможности попали уже в первую публикацию.
+        first_runs = []
+        for probe in self.registry:
+            if probe.threaded:
+                self.poll_threaded(probe)
+                first_runs.append(probe.future)
+        if first_runs:
+            wait(first_runs, timeout=self.interval)
+
+        now = time.monotonic()
+        self._heap = []
+        for probe in self.registry:
+            first_due = now + probe.effective_interval(self.interval) if probe.threaded else now
+            self.schedule(first_due, self.PROBE, probe)
+        self.schedule(now, self.PUBLISH)
+
+        while self.running and self._heap:
+            due, kind, _, probe = self._heap[0]
+            delay = due - time.monotonic()
+            if delay > 0 and self._stop_event.wait(delay):
+                break
+            heapq.heappop(self._heap)
+
+            if kind == self.PUBLISH:
+                sample = self.snapshot()
+                self.latest = sample
+                self.publish(sample)
+                next_due = due + self.interval
+            else:
+                if probe.threaded:
+                    self.poll_threaded(probe)
+                else:
+                    self.store_values(self.run_probe(probe))
+                next_due = due + probe.effective_interval(self.interval)
+
+            now = time.monotonic()
+            if next_due < now:
+                next_due = now
+            self.schedule(next_due, kind, probe)
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self._stop_event.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='probe')
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self.running = False
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self):
+        return {probe.name: probe.stats() for probe in self.registry}
@@ -0,0 +1,205 @@
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_INDEX_PATH = "system_monitor_diskindex.db"
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    ino INTEGER,
+    mtime_ns INTEGER,
+    own_bytes INTEGER,
+    own_files INTEGER,
+    total_bytes INTEGER,
+    total_files INTEGER,
+    subdirs TEXT
+)
+'''
+
+
+class DirRecord:
+    __slots__ = ('ino', 'mtime_ns', 'own_bytes', 'own_files', 'total_bytes', 'total_files', 'subdirs')
+
+    def __init__(self, ino, mtime_ns, own_bytes, own_files, total_bytes, total_files, subdirs):
+        self.ino = ino
+        self.mtime_ns = mtime_ns
+        self.own_bytes = own_bytes
+        self.own_files = own_files
+        self.total_bytes = total_bytes
+        self.total_files = total_files
+        self.subdirs = subdirs
+
+    def row(self, path):
+        return (path, self.ino, self.mtime_ns, self.own_bytes, self.own_files,
+                self.total_bytes, self.total_files, '\0'.join(self.subdirs))
+
+
+class IndexStats:
+    __slots__ = ('dirs', 'listed', 'reused', 'errors', 'started', 'finished', 'cancelled')
+
+    def __init__(self):
+        self.dirs = 0
+        self.listed = 0
+        self.reused = 0
+        self.errors = 0
+        self.started = time.monotonic()
+        self.finished = None
+        self.cancelled = False
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.monotonic()) - self.started
+
+
+class DiskUsageIndex:
+    # Размеры каталогов, сохраняемые между запусками. Запись каталога
+    # действительна, пока совпадают его inode и mtime: тогда список файлов
+    # не читается заново, берутся сохраненные сумма размеров и список
+    # подкаталогов, а для подкаталогов делается только stat. Повторный
+    # анализ стоит один stat на каталог вместо stat на каждый файл.
+    # Изменение размера существующего файла без создания/удаления файлов
+    # mtime каталога не меняет и при повторном анализе не видно.
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.records = {}
+        self._dirty = set()
+        self._removed = set()
+        self.load()
+
+    def load(self):
+        try:
+            db = sqlite3.connect(self.path)
+            try:
+                db.execute(SCHEMA)
+                for row in db.execute('SELECT * FROM dirs'):
+                    path, *values, subdirs = row
+                    self.records[path] = DirRecord(*values, tuple(subdirs.split('\0')) if subdirs else ())
+            finally:
+                db.close()
+        except sqlite3.Error as e:
+            print(f"Ошибка чтения индекса диска: {e}")
+            self.records = {}
+
+    def save(self):
+        with self.lock:
+            rows = [self.records[path].row(path) for path in self._dirty if path in self.records]
+            removed = [(path,) for path in self._removed]
+            self._dirty.clear()
+            self._removed.clear()
+        db = sqlite3.connect(self.path)
+        try:
+            with db:
+                db.execute(SCHEMA)
+                db.executemany('DELETE FROM dirs WHERE path = ?', removed)
+                db.executemany('INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        finally:
+            db.close()
+
+    def get(self, path):
+        return self.records.get(path)
+
+    def children(self, path):
+        record = self.records.get(path)
+        if record is None:
+            return []
+        children = []
+        for name in record.subdirs:
+            child = os.path.join(path, name)
+            if child in self.records:
+                children.append((child, self.records[child]))
+        children.sort(key=lambda item: item[1].total_bytes, reverse=True)
+        return children
+
+    def forget(self, path):
+        record = self.records.pop(path, None)
+        if record is None:
+            return
+        self._removed.add(path)
+        self._dirty.discard(path)
+        for name in record.subdirs:
+            self.forget(os.path.join(path, name))
+
+    def list_directory(self, path, device):
+        own_bytes = own_files = 0
+        subdirs = []
+        errors = 0
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if device is None or entry.stat(follow_symlinks=False).st_dev == device:
+                            subdirs.append(entry.name)
+                    elif entry.is_file(follow_symlinks=False):
+                        own_bytes += entry.stat(follow_symlinks=False).st_size
+                        own_files += 1
+                except OSError:
+                    errors += 1
+        return own_bytes, own_files, tuple(sorted(subdirs)), errors
+
+    def scan(self, root, cancel=None, progress=None, progress_interval=0.5):
+        # Обход в глубину с явным стеком: каталог обрабатывается при
+        # первом посещении, а итоговые размеры считаются после того, как
+        # посчитаны все его подкаталоги.
+        stats = IndexStats()
+        device = os.stat(root).st_dev if os.name != 'nt' else None
+        stack = [(root, False)]
+        last_report = time.monotonic()
+
+        while stack:
+            if cancel is not None and cancel.is_set():
+                stats.cancelled = True
+                break
+
+            path, expanded = stack.pop()
+            record = self.records.get(path)
+            if expanded:
+                if record is not None:
+                    total_bytes, total_files = record.own_bytes, record.own_files
+                    for name in record.subdirs:
+                        child = self.records.get(os.path.join(path, name))
+                        if child is not None:
+                            total_bytes += child.total_bytes
+                            total_files += child.total_files
+                    if (total_bytes, total_files) != (record.total_bytes, record.total_files):
+                        record.total_bytes, record.total_files = total_bytes, total_files
+                        self._dirty.add(path)
+                continue
+
+            stats.dirs += 1
+            try:
+                st = os.stat(path, follow_symlinks=False)
+                if record is not None and (record.ino, record.mtime_ns) == (st.st_ino, st.st_mtime_ns):
+                    stats.reused += 1
+                else:
+                    own_bytes, own_files, subdirs, errors = self.list_directory(path, device)
+                    stats.listed += 1
+                    stats.errors += errors
+                    with self.lock:
+                        if record is not None:
+                            for name in set(record.subdirs) - set(subdirs):
+                                self.forget(os.path.join(path, name))
+                        record = DirRecord(st.st_ino, st.st_mtime_ns, own_bytes, own_files,
+                                           0, 0, subdirs)
+                        self.records[path] = record
+                        self._dirty.add(path)
+            except OSError:
+                stats.errors += 1
+                with self.lock:
+                    self.forget(path)
+                continue
+
+            stack.append((path, True))
+            for name in record.subdirs:
+                stack.append((os.path.join(path, name), False))
+
+            if progress is not None and time.monotonic() - last_report >= progress_interval:
+                last_report = time.monotonic()
+                progress(stats)
+
+        stats.finished = time.monotonic()
+        if progress is not None:
+            progress(stats)
+        return stats
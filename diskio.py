@@ -0,0 +1,101 @@
+import os
+import time
+
+import psutil
+
+from network import counter_delta
+
+SYS_BLOCK = '/sys/block'
+VIRTUAL_PREFIXES = ('loop', 'ram', 'zram', 'fd')
+
+
+def block_devices(root=SYS_BLOCK):
+    # На Linux perdisk отдает и разделы (sda1), и целые диски: показываются
+    # только устройства из /sys/block, без loop/ram.
+    try:
+        names = os.listdir(root)
+    except OSError:
+        return None
+    return {name for name in names if not name.startswith(VIRTUAL_PREFIXES)}
+
+
+def physical_disks(root=SYS_BLOCK):
+    # Устройства для сумм: составные (dm-*, md*) с непустым slaves/
+    # пропускаются - их операции уже учтены на дисках под ними, иначе на
+    # LVM и RAID суммы удваиваются.
+    devices = block_devices(root)
+    if devices is None:
+        return None
+    return {name for name in devices if not has_slaves(os.path.join(root, name))}
+
+
+def has_slaves(device):
+    try:
+        return bool(os.listdir(os.path.join(device, 'slaves')))
+    except OSError:
+        return False
+
+
+class DiskIORates:
+    # IOPS, MB/s, средняя задержка операции и оценка загрузки устройства
+    # из разницы счетчиков psutil.disk_io_counters(perdisk=True).
+    def __init__(self, counters=None):
+        self.counters = counters or (lambda: psutil.disk_io_counters(perdisk=True) or {})
+        self.devices = block_devices()
+        self.disks = physical_disks()
+        self.previous = {}
+        self.rates = {}
+
+    def sample(self, now=None):
+        now = time.monotonic() if now is None else now
+        counters = self.counters()
+        if counters.keys() != self.previous.keys():
+            self.devices = block_devices()
+            self.disks = physical_disks()
+
+        current = {}
+        rates = {}
+        for name, io in counters.items():
+            if self.devices is not None and name not in self.devices:
+                continue
+            values = (io.read_count, io.write_count, io.read_bytes, io.write_bytes,
+                      io.read_time, io.write_time, getattr(io, 'busy_time', None))
+            current[name] = (now, values)
+            if name not in self.previous:
+                continue
+
+            then, old = self.previous[name]
+            elapsed = now - then
+            if elapsed <= 0:
+                continue
+            reads, writes, read_bytes, write_bytes, read_ms, write_ms = (
+                counter_delta(new, prev) for new, prev in zip(values[:6], old[:6]))
+            ops = reads + writes
+            # busy_time есть только на Linux; иначе загрузка оценивается по
+            # суммарному времени операций (завышена при параллельных запросах).
+            busy_ms = counter_delta(values[6], old[6]) if values[6] is not None else read_ms + write_ms
+            rates[name] = {
+                'read_iops': reads / elapsed,
+                'write_iops': writes / elapsed,
+                'read_mb': read_bytes / elapsed / 1024 / 1024,
+                'write_mb': write_bytes / elapsed / 1024 / 1024,
+                'latency': (read_ms + write_ms) / ops if ops else 0.0,
+                'util': min(busy_ms / (elapsed * 1000) * 100, 100.0),
+            }
+
+        self.previous = current
+        self.rates = rates
+        return rates
+
+    def probe(self):
+        rates = self.sample()
+        totals = [r for name, r in rates.items() if self.disks is None or name in self.disks]
+        read = sum(r['read_mb'] for r in totals)
+        write = sum(r['write_mb'] for r in totals)
+        return {
+            'io': read + write,
+            'io_read': read,
+            'io_write': write,
+            'io_util': max((r['util'] for r in rates.values()), default=0.0),
+            'disks': rates,
+        }
@@ -0,0 +1,216 @@
+import bz2
+import csv
+import gzip
+import json
+import lzma
+import math
+import struct
+
+import numpy as np
+
+EXPORT_FORMATS = ('jsonl', 'csv', 'columnar')
+FORMAT_SUFFIXES = {'.jsonl': 'jsonl', '.json': 'jsonl', '.csv': 'csv', '.smtc': 'columnar'}
+COMPRESSIONS = {'gz': gzip.open, 'xz': lzma.open, 'bz2': bz2.open}
+
+COLUMNAR_MAGIC = b'SMTC'
+COLUMNAR_VERSION = 1
+COLUMNAR_HEADER = struct.Struct('<4sHI')
+BATCH_HEADER = struct.Struct('<I')
+
+PROCESS_COLUMNS = ('pid', 'name', 'cpu', 'memory', 'status', 'user', 'cmdline')
+CONNECTION_COLUMNS = ('group', 'count', 'ports', 'states')
+
+
+def detect_format(path):
+    # "history.csv.gz" -> ('csv', 'gz'); формат по умолчанию - jsonl.
+    name = str(path).lower()
+    compression = None
+    for suffix in COMPRESSIONS:
+        if name.endswith('.' + suffix):
+            compression = suffix
+            name = name[:-len(suffix) - 1]
+            break
+    for suffix, fmt in FORMAT_SUFFIXES.items():
+        if name.endswith(suffix):
+            return fmt, compression
+    return 'jsonl', compression
+
+
+def open_output(path, compression=None, binary=False):
+    mode = 'wb' if binary else 'wt'
+    if compression is None:
+        return open(path, mode) if binary else open(path, mode, encoding='utf-8', newline='')
+    opener = COMPRESSIONS[compression]
+    return opener(path, mode) if binary else opener(path, mode, encoding='utf-8', newline='')
+
+
+def as_list(values):
+    return values.tolist() if isinstance(values, np.ndarray) else list(values)
+
+
+def is_missing(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def has_missing(columns, names):
+    # Проверка пропусков по массивам целиком, чтобы в частом случае без
+    # NaN не проверять каждое значение в Python.
+    for name in names:
+        values = columns[name]
+        if isinstance(values, np.ndarray):
+            if values.dtype.kind == 'f' and np.isnan(values).any():
+                return True
+        elif any(value is None for value in values):
+            return True
+    return False
+
+
+class JsonLinesWriter:
+    binary = False
+
+    def __init__(self, f, names):
+        self.f = f
+        self.names = tuple(names)
+
+    def write(self, columns):
+        data = [as_list(columns[name]) for name in self.names]
+        dumps = json.JSONEncoder(ensure_ascii=False).encode
+        if has_missing(columns, self.names):
+            lines = [dumps({name: value for name, value in zip(self.names, row) if not is_missing(value)})
+                     for row in zip(*data)]
+        else:
+            lines = [dumps(dict(zip(self.names, row))) for row in zip(*data)]
+        if lines:
+            self.f.write('\n'.join(lines) + '\n')
+
+    def close(self):
+        pass
+
+
+class CsvWriter:
+    binary = False
+
+    def __init__(self, f, names):
+        self.names = tuple(names)
+        self.writer = csv.writer(f)
+        self.writer.writerow(self.names)
+
+    def write(self, columns):
+        data = [as_list(columns[name]) for name in self.names]
+        if has_missing(columns, self.names):
+            self.writer.writerows(
+                ['' if is_missing(value) else value for value in row] for row in zip(*data))
+        else:
+            self.writer.writerows(zip(*data))
+
+    def close(self):
+        pass
+
+
+class ColumnarWriter:
+    # Заголовок (magic, версия, длина схемы) и схема в JSON со списком
+    # колонок, затем пакеты: число строк и данные колонок подряд.
+    # Числовые колонки пишутся как массивы <f8 / <i8, строковые - как
+    # смещения <i8 (rows + 1) и байты UTF-8. Пакет читается без разбора
+    # отдельных строк, см. read_columnar().
+    binary = True
+
+    def __init__(self, f, names):
+        self.f = f
+        self.names = tuple(names)
+        schema = json.dumps({'columns': self.names}).encode('utf-8')
+        f.write(COLUMNAR_HEADER.pack(COLUMNAR_MAGIC, COLUMNAR_VERSION, len(schema)))
+        f.write(schema)
+
+    def write(self, columns):
+        rows = len(columns[self.names[0]]) if self.names else 0
+        if not rows:
+            return
+        self.f.write(BATCH_HEADER.pack(rows))
+        for name in self.names:
+            values = columns[name]
+            array = values if isinstance(values, np.ndarray) else None
+            if array is None:
+                try:
+                    array = np.asarray(values)
+                except ValueError:
+                    array = np.asarray([str(value) for value in values])
+            if array.dtype.kind in 'iub':
+                self.f.write(b'i')
+                self.f.write(np.ascontiguousarray(array, dtype='<i8').tobytes())
+            elif array.dtype.kind == 'f':
+                self.f.write(b'f')
+                self.f.write(np.ascontiguousarray(array, dtype='<f8').tobytes())
+            else:
+                encoded = [str(value).encode('utf-8') for value in as_list(values)]
+                offsets = np.zeros(rows + 1, dtype='<i8')
+                np.cumsum([len(item) for item in encoded], out=offsets[1:])
+                self.f.write(b's')
+                self.f.write(offsets.tobytes())
+                self.f.write(b''.join(encoded))
+
+    def close(self):
+        pass
+
+
+WRITERS = {'jsonl': JsonLinesWriter, 'csv': CsvWriter, 'columnar': ColumnarWriter}
+
+
+def export_batches(path, names, batches, fmt=None, compression=None):
+    # batches - итератор словарей {колонка: массив или список}; в памяти
+    # одновременно находится только один пакет.
+    detected, detected_compression = detect_format(path)
+    fmt = fmt or detected
+    compression = compression if compression is not None else detected_compression
+    writer_cls = WRITERS[fmt]
+    rows = 0
+    with open_output(path, compression, writer_cls.binary) as f:
+        writer = writer_cls(f, names)
+        for batch in batches:
+            writer.write(batch)
+            rows += len(batch[names[0]])
+        writer.close()
+    return rows
+
+
+def read_columnar(path, compression=None):
+    if compression is None:
+        compression = detect_format(path)[1]
+    opener = COMPRESSIONS[compression] if compression else open
+    with opener(path, 'rb') as f:
+        magic, version, schema_size = COLUMNAR_HEADER.unpack(f.read(COLUMNAR_HEADER.size))
+        if magic != COLUMNAR_MAGIC or version != COLUMNAR_VERSION:
+            raise ValueError(f"{path}: неизвестный формат файла")
+        names = json.loads(f.read(schema_size))['columns']
+        while True:
+            header = f.read(BATCH_HEADER.size)
+            if len(header) < BATCH_HEADER.size:
+                return
+            rows, = BATCH_HEADER.unpack(header)
+            batch = {}
+            for name in names:
+                kind = f.read(1)
+                if kind in (b'f', b'i'):
+                    batch[name] = np.frombuffer(f.read(rows * 8), '<f8' if kind == b'f' else '<i8')
+                else:
+                    offsets = np.frombuffer(f.read((rows + 1) * 8), '<i8')
+                    blob = f.read(int(offsets[-1]))
+                    batch[name] = [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(rows)]
+            yield batch
+
+
+def export_history(store, path, start=None, end=None, fmt=None, compression=None, chunk_size=65536):
+    names = ['time'] + store.fields(start, end)
+    return export_batches(path, names, store.iter_chunks(start, end, names[1:], chunk_size), fmt, compression)
+
+
+def export_processes(snapshot, path, fmt=None, compression=None):
+    batch = {name: getattr(snapshot, name) for name in PROCESS_COLUMNS}
+    return export_batches(path, PROCESS_COLUMNS, [batch], fmt, compression)
+
+
+def export_connections(rows, path, fmt=None, compression=None):
+    # rows - строки ConnectionCollector.collect(): (ключ, группа, число,
+    # порты, состояния).
+    batch = {name: [row[i + 1] for row in rows] for i, name in enumerate(CONNECTION_COLUMNS)}
+    return export_batches(path, CONNECTION_COLUMNS, [batch], fmt, compression)
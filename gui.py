@@ -0,0 +1,1748 @@
+import json
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext
+import psutil
+import time
+import threading
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import os
+import sys
+import webbrowser
+from datetime import datetime
+import GPUtil
+from screeninfo import get_monitors
+import platform
+
+from alerts import DEFAULT_RULES, AlertEngine, AlertNotifier, load_rules
+from anomaly import AnomalyDetector
+from charts import BlitRenderer
+from cgroups import CgroupCollector
+from cleanup import CleanupJob, history_locations, is_history_file, temp_directories
+from collector import MetricsCollector, default_registry
+from diskindex import DEFAULT_INDEX_PATH, DiskUsageIndex
+from export import export_connections, export_history, export_processes
+from headless import (DEFAULT_HISTORY_DIR, NET_TOP_GROUPS, SETTINGS_FILE, format_network, format_status,
+                      format_temperature, open_store, read_settings, start_exporter)
+from history import MetricHistory
+from network import TCP_STATES, ConnectionCollector
+from processes import ProcessCache, ProcessSnapshot, ProcessTableModel
+from scanner import LargeFileScanner, scan_roots
+from sensors import SensorReader
+from treeview_sync import TreeviewReconciler
+from ui_queue import TkUpdatePump, UIUpdateQueue
+from virtual_table import VirtualTable
+
+DISK_TREE_LIMIT = 200
+CGROUP_PROCESS_LIMIT = 500
+ANOMALY_PRIME = 600
+
+
+class SystemMonitor:
+    def __init__(self, root, interval=1.0, plugins=(), prometheus=None):
+        self.start_time = time.time()
+        self.root = root
+        self.root.title("🚀 System Monitoring Tool v1.0.0")
+        self.root.geometry("1400x900")
+
+        self.settings = self.load_settings()
+        self.theme_mode = self.settings.get('theme', 'dark')
+        self.button_style = self.settings.get('button_style', 'modern')
+
+        self.themes = {
+            'dark': {
+                'bg': '#2c3e50',
+                'card': '#34495e',
+                'text': 'white',
+                'primary': '#3498db',
+                'secondary': '#e74c3c',
+                'accent': '#9b59b6'
+            },
+            'light': {
+                'bg': '#ecf0f1',
+                'card': '#ffffff',
+                'text': '#2c3e50',
+                'primary': '#2980b9',
+                'secondary': '#c0392b',
+                'accent': '#8e44ad'
+            }
+        }
+
+        self.button_styles = {
+            'modern': {'relief': 'flat', 'borderwidth': 2},
+            'classic': {'relief': 'raised', 'borderwidth': 4},
+            'minimal': {'relief': 'flat', 'borderwidth': 1}
+        }
+
+        self.current_theme = self.themes[self.theme_mode]
+        self.root.configure(bg=self.current_theme['bg'])
+        self.setup_styles()
+
+        self.running = True
+        self.history = MetricHistory(('cpu', 'mem', 'disk', 'net', 'temp', 'io'),
+                                     capacity=self.settings.get('history_capacity', 86400))
+        self.chart_window = self.settings.get('chart_window', 300)
+        self.chart_range = None
+        self.chart_range_drawn = 0
+        self.anomalies = AnomalyDetector(self.history.metrics, capacity=self.history.capacity,
+                                         alpha=self.settings.get('anomaly_alpha', 0.02),
+                                         threshold=self.settings.get('anomaly_threshold', 4.0),
+                                         min_std=self.settings.get('anomaly_min_std'),
+                                         interval=interval) \
+            if self.settings.get('anomaly_detection', True) else None
+        self.store = open_store(self.settings.get('history_dir', DEFAULT_HISTORY_DIR),
+                                self.settings.get('history_retention_days', 7)) \
+            if self.settings.get('history_store', True) else None
+        self.sensors = SensorReader()
+        self.large_file_scan = None
+        self.disk_index = None
+        self.disk_index_thread = None
+        self.disk_index_cancel = threading.Event()
+        self.disk_usage_window = None
+        self.cleanup_jobs = {}
+        self.connection_collector = ConnectionCollector()
+        self.net_refresh_thread = None
+        self.cgroup_collector = CgroupCollector()
+        self.cgroup_refresh_thread = None
+        self.cgroup_groups = {}
+        self.cgroup_sort = ('cpu', True)
+        self.alerts = AlertEngine(load_rules(self.settings.get('alert_rules', DEFAULT_RULES)))
+        self.alert_notifier = AlertNotifier(self.settings.get('alert_hook'),
+                                            enabled=self.settings.get('notifications', True))
+        self.alerts.subscribe(self.alert_notifier)
+        self.alerts.subscribe(self.on_alert)
+
+        self.ui_queue = UIUpdateQueue()
+        self.ui_pump = TkUpdatePump(self.root, self.ui_queue)
+        self.process_refresh_interval = self.settings.get('process_refresh_interval', 3000)
+        self.process_refresh_thread = None
+        self.process_cache = ProcessCache()
+        self.process_search_after = None
+        self.process_search_delay = self.settings.get('process_search_delay', 150)
+
+        self.setup_ui()
+        self.ui_pump.start()
+
+        if self.store is not None:
+            self.load_stored_history()
+
+        registry = default_registry(self.settings.get('collector_plugins', []) + list(plugins),
+                                    self.settings.get('collector_intervals'), self.sensors)
+        self.collector = MetricsCollector(interval=interval, registry=registry)
+        self.collector.subscribe(self.alerts.evaluate)
+        self.collector.subscribe(self.update_data)
+        if self.store is not None:
+            self.collector.subscribe(self.store.append)
+        self.exporter = start_exporter(*prometheus) if prometheus is not None else None
+        if self.exporter is not None:
+            self.collector.subscribe(self.exporter.update)
+        self.collector.start()
+
+    def load_settings(self):
+        return read_settings()
+
+    def save_settings(self):
+        self.settings.update({
+            'theme': self.theme_mode,
+            'button_style': self.button_style
+        })
+        with open(SETTINGS_FILE, 'w') as f:
+            json.dump(self.settings, f, indent=4)
+
+    def setup_styles(self):
+        self.style = ttk.Style()
+        self.style.theme_use('clam')
+
+        self.style.configure('TFrame', background=self.current_theme['bg'])
+        self.style.configure('TLabel', background=self.current_theme['bg'],
+                             foreground=self.current_theme['text'])
+        self.style.configure('TButton', background=self.current_theme['primary'],
+                             foreground=self.current_theme['text'], **self.button_styles[self.button_style])
+        self.style.configure('Header.TLabel', font=('Arial', 14, 'bold'),
+                             foreground=self.current_theme['primary'])
+        self.style.configure('Title.TLabel', font=('Arial', 18, 'bold'),
+                             foreground=self.current_theme['secondary'])
+        self.style.configure('Card.TFrame', background=self.current_theme['card'],
+                             relief='raised', borderwidth=1)
+
+        self.style.configure('TNotebook', background=self.current_theme['bg'])
+        self.style.configure('TNotebook.Tab', background=self.current_theme['card'],
+                             foreground=self.current_theme['text'], padding=[15, 5])
+        self.style.map('TNotebook.Tab', background=[('selected', self.current_theme['primary'])])
+
+    def setup_ui(self):
+        self.setup_menu()
+
+        notebook = ttk.Notebook(self.root)
+        notebook.pack(fill='both', expand=True, padx=10, pady=10)
+
+        monitor_frame = ttk.Frame(notebook)
+        notebook.add(monitor_frame, text="📊 Мониторинг")
+        self.setup_monitor_tab(monitor_frame)
+
+        process_frame = ttk.Frame(notebook)
+        notebook.add(process_frame, text="⚙️ Процессы")
+        self.setup_process_tab(process_frame)
+
+        cgroup_frame = ttk.Frame(notebook)
+        notebook.add(cgroup_frame, text="📦 Контейнеры")
+        self.setup_cgroup_tab(cgroup_frame)
+
+        system_frame = ttk.Frame(notebook)
+        notebook.add(system_frame, text="💻 Система")
+        self.setup_system_tab(system_frame)
+
+        network_frame = ttk.Frame(notebook)
+        notebook.add(network_frame, text="🌐 Сеть")
+        self.setup_network_tab(network_frame)
+
+        startup_frame = ttk.Frame(notebook)
+        notebook.add(startup_frame, text="🚀 Автозагрузка")
+        self.setup_startup_tab(startup_frame)
+
+        clean_frame = ttk.Frame(notebook)
+        notebook.add(clean_frame, text="🧹 Очистка")
+        self.setup_clean_tab(clean_frame)
+
+        about_frame = ttk.Frame(notebook)
+        notebook.add(about_frame, text="ℹ️ О программе")
+        self.setup_about_tab(about_frame)
+
+        settings_frame = ttk.Frame(notebook)
+        notebook.add(settings_frame, text="⚙️ Настройки")
+        self.setup_settings_tab(settings_frame)
+
+        self.status_var = tk.StringVar()
+        status_bar = ttk.Label(self.root, textvariable=self.status_var, relief='sunken', padding=5)
+        status_bar.pack(side='bottom', fill='x')
+
+        self.status_var.set("🟢 Готов к работе")
+        self.setup_quick_access()
+
+    def setup_menu(self):
+        menubar = tk.Menu(self.root)
+        self.root.config(menu=menubar)
+
+        file_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Файл", menu=file_menu)
+        file_menu.add_command(label="Экспорт отчета", command=self.export_reports)
+        file_menu.add_separator()
+        file_menu.add_command(label="Выход", command=self.root.quit)
+
+        view_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Вид", menu=view_menu)
+
+        theme_menu = tk.Menu(view_menu, tearoff=0)
+        view_menu.add_cascade(label="Тема", menu=theme_menu)
+        theme_menu.add_command(label="Темная", command=lambda: self.change_theme('dark'))
+        theme_menu.add_command(label="Светлая", command=lambda: self.change_theme('light'))
+
+        style_menu = tk.Menu(view_menu, tearoff=0)
+        view_menu.add_cascade(label="Стиль кнопок", menu=style_menu)
+        style_menu.add_command(label="Современный", command=lambda: self.change_button_style('modern'))
+        style_menu.add_command(label="Классический", command=lambda: self.change_button_style('classic'))
+        style_menu.add_command(label="Минималистичный", command=lambda: self.change_button_style('minimal'))
+
+        help_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Помощь", menu=help_menu)
+        help_menu.add_command(label="О программе", command=self.show_about)
+        help_menu.add_command(label="Проверить обновления", command=self.check_updates)
+
+    def setup_settings_tab(self, parent):
+        main_frame = ttk.Frame(parent)
+        main_frame.pack(fill='both', expand=True, padx=20, pady=20)
+
+        theme_frame = ttk.LabelFrame(main_frame, text="🎨 Настройки темы", padding=15)
+        theme_frame.pack(fill='x', pady=(0, 15))
+
+        ttk.Label(theme_frame, text="Выберите тему интерфейса:",
+                  font=('Arial', 11)).pack(anchor='w', pady=(0, 10))
+
+        theme_var = tk.StringVar(value=self.theme_mode)
+        theme_frame_inner = ttk.Frame(theme_frame)
+        theme_frame_inner.pack(fill='x')
+
+        ttk.Radiobutton(theme_frame_inner, text="🌙 Темная тема", variable=theme_var,
+                        value='dark', command=lambda: self.change_theme('dark')).pack(side='left', padx=10)
+        ttk.Radiobutton(theme_frame_inner, text="☀️ Светлая тема", variable=theme_var,
+                        value='light', command=lambda: self.change_theme('light')).pack(side='left', padx=10)
+
+        style_frame = ttk.LabelFrame(main_frame, text="🔘 Стиль кнопок", padding=15)
+        style_frame.pack(fill='x', pady=(0, 15))
+
+        ttk.Label(style_frame, text="Выберите стиль кнопок:",
+                  font=('Arial', 11)).pack(anchor='w', pady=(0, 10))
+
+        style_var = tk.StringVar(value=self.button_style)
+        style_frame_inner = ttk.Frame(style_frame)
+        style_frame_inner.pack(fill='x')
+
+        ttk.Radiobutton(style_frame_inner, text="🔄 Современный", variable=style_var,
+                        value='modern', command=lambda: self.change_button_style('modern')).pack(side='left', padx=10)
+        ttk.Radiobutton(style_frame_inner, text="🏛️ Классический", variable=style_var,
+                        value='classic', command=lambda: self.change_button_style('classic')).pack(side='left', padx=10)
+        ttk.Radiobutton(style_frame_inner, text="⚪ Минималистичный", variable=style_var,
+                        value='minimal', command=lambda: self.change_button_style('minimal')).pack(side='left', padx=10)
+
+        demo_frame = ttk.LabelFrame(main_frame, text="👀 Предпросмотр", padding=15)
+        demo_frame.pack(fill='x', pady=(0, 15))
+
+        ttk.Label(demo_frame, text="Пример кнопок в выбранном стиле:",
+                  font=('Arial', 11)).pack(anchor='w', pady=(0, 10))
+
+        demo_buttons = ttk.Frame(demo_frame)
+        demo_buttons.pack(fill='x')
+
+        for i, text in enumerate(["Основная", "Дополнительная", "Успех", "Ошибка"]):
+            btn = ttk.Button(demo_buttons, text=text, width=15)
+            btn.pack(side='left', padx=5)
+
+        advanced_frame = ttk.LabelFrame(main_frame, text="⚙️ Дополнительно", padding=15)
+        advanced_frame.pack(fill='x', pady=(0, 15))
+
+        autostart_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(advanced_frame, text="Запускать при старте системы",
+                        variable=autostart_var).pack(anchor='w', pady=2)
+
+        self.notifications_var = tk.BooleanVar(value=self.alert_notifier.enabled)
+        ttk.Checkbutton(advanced_frame, text="Включить уведомления",
+                        variable=self.notifications_var,
+                        command=self.toggle_notifications).pack(anchor='w', pady=2)
+
+        minimal_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(advanced_frame, text="Минималистичный режим",
+                        variable=minimal_var).pack(anchor='w', pady=2)
+
+        control_frame = ttk.Frame(main_frame)
+        control_frame.pack(fill='x', pady=15)
+
+        ttk.Button(control_frame, text="💾 Сохранить настройки",
+                   command=self.save_settings, width=20).pack(side='left', padx=5)
+        ttk.Button(control_frame, text="🔄 Сбросить настройки",
+                   command=self.reset_settings, width=20).pack(side='left', padx=5)
+        ttk.Button(control_frame, text="🚀 Применить",
+                   command=self.apply_settings, width=20).pack(side='right', padx=5)
+
+    def toggle_notifications(self):
+        self.alert_notifier.enabled = self.notifications_var.get()
+        self.settings['notifications'] = self.alert_notifier.enabled
+        self.save_settings()
+
+    def on_alert(self, event):
+        print(f"{datetime.fromtimestamp(event.time).strftime('%Y-%m-%d %H:%M:%S')} {event.summary()}")
+
+    def change_theme(self, theme):
+        self.theme_mode = theme
+        self.current_theme = self.themes[theme]
+        self.setup_styles()
+        self.update_ui_colors()
+
+    def change_button_style(self, style):
+        self.button_style = style
+        self.setup_styles()
+        self.save_settings()
+
+    def update_ui_colors(self):
+        self.root.configure(bg=self.current_theme['bg'])
+        for widget in self.root.winfo_children():
+            if isinstance(widget, ttk.Frame):
+                widget.configure(style='TFrame')
+        self.save_settings()
+
+    def reset_settings(self):
+        if messagebox.askyesno("Сброс настроек", "Вы уверены, что хотите сбросить все настройки?"):
+            self.theme_mode = 'dark'
+            self.button_style = 'modern'
+            self.current_theme = self.themes[self.theme_mode]
+            self.setup_styles()
+            self.update_ui_colors()
+            messagebox.showinfo("Успех", "Настройки сброшены к значениям по умолчанию")
+
+    def apply_settings(self):
+        self.setup_styles()
+        self.update_ui_colors()
+        messagebox.showinfo("Успех", "Настройки применены")
+
+    def setup_quick_access(self):
+        quick_frame = ttk.Frame(self.root, height=50, style='Card.TFrame')
+        quick_frame.pack(side='top', fill='x', padx=10, pady=5)
+        quick_frame.pack_propagate(False)
+
+        actions = [
+            ("🔄 Обновить все", self.update_all, self.current_theme['primary']),
+            ("📊 CPU", lambda: self.show_resource("CPU"), "#e74c3c"),
+            ("💾 Память", lambda: self.show_resource("Memory"), "#3498db"),
+            ("📁 Диск", lambda: self.show_resource("Disk"), "#2ecc71"),
+            ("🌐 Сеть", lambda: self.show_resource("Network"), "#9b59b6"),
+            ("⚙️ Настройки", lambda: self.show_resource("Settings"), "#f39c12")
+        ]
+
+        for text, command, color in actions:
+            style_params = self.button_styles[self.button_style].copy()
+            if 'relief' in style_params:
+                del style_params['relief']
+
+            btn = tk.Button(quick_frame, text=text, font=('Arial', 10, 'bold'),
+                            bg=color, fg='white', relief='flat', cursor='hand2',
+                            command=command, **style_params)
+            btn.pack(side='left', padx=3, ipadx=8, ipady=3)
+
+    def setup_monitor_tab(self, parent):
+        main_frame = ttk.Frame(parent)
+        main_frame.pack(fill='both', expand=True, padx=10, pady=10)
+
+        left_frame = ttk.Frame(main_frame)
+        left_frame.pack(side='left', fill='both', expand=True)
+
+        fig = Figure(figsize=(10, 8), dpi=100, facecolor='#2c3e50')
+        fig.subplots_adjust(hspace=0.4, wspace=0.3)
+
+        self.ax_cpu = fig.add_subplot(321)
+        self.ax_mem = fig.add_subplot(322)
+        self.ax_disk = fig.add_subplot(323)
+        self.ax_net = fig.add_subplot(324)
+        self.ax_temp = fig.add_subplot(325)
+        self.ax_io = fig.add_subplot(326)
+
+        self.canvas = FigureCanvasTkAgg(fig, left_frame)
+        self.canvas.get_tk_widget().pack(fill='both', expand=True)
+
+        self.chart_renderer = BlitRenderer(self.canvas, {
+            'cpu': self.ax_cpu,
+            'mem': self.ax_mem,
+            'disk': self.ax_disk,
+            'net': self.ax_net,
+            'temp': self.ax_temp,
+            'io': self.ax_io
+        }, window=self.chart_window)
+
+        right_frame = ttk.Frame(main_frame, width=250)
+        right_frame.pack(side='right', fill='y', padx=(10, 0))
+        right_frame.pack_propagate(False)
+
+        ttk.Label(right_frame, text="📈 Показатели в реальном времени",
+                  style='Header.TLabel').pack(pady=(0, 15))
+
+        self.cpu_var = tk.StringVar(value="Загрузка CPU: 0%")
+        self.mem_var = tk.StringVar(value="Исп. памяти: 0%")
+        self.disk_var = tk.StringVar(value="Исп. диска: 0%")
+        self.net_var = tk.StringVar(value="Сетевой трафик: 0 MB/s")
+        self.temp_var = tk.StringVar(value="Температура: N/A")
+        self.io_var = tk.StringVar(value="Диск I/O: 0 MB/s")
+
+        self.create_metric_card(right_frame, "💻 Процессор", self.cpu_var)
+        self.create_metric_card(right_frame, "💾 Память", self.mem_var)
+        self.create_metric_card(right_frame, "📁 Диск", self.disk_var)
+        self.create_metric_card(right_frame, "🌐 Сеть", self.net_var)
+        self.create_metric_card(right_frame, "🌡️ Температура", self.temp_var)
+        self.create_metric_card(right_frame, "💽 Диск I/O", self.io_var)
+
+        range_frame = ttk.Frame(right_frame, style='Card.TFrame', padding=12)
+        range_frame.pack(fill='x', pady=4)
+
+        ttk.Label(range_frame, text="📅 Период", font=('Arial', 11, 'bold'),
+                  foreground=self.current_theme['primary'],
+                  background=self.current_theme['card']).pack(anchor='w', pady=(0, 8))
+
+        self.chart_ranges = {
+            "Реальное время": None,
+            "Последний час": 3600,
+            "6 часов": 6 * 3600,
+            "24 часа": 86400,
+            "7 дней": 7 * 86400
+        }
+        self.chart_range_var = tk.StringVar(value="Реальное время")
+        range_box = ttk.Combobox(range_frame, textvariable=self.chart_range_var, state='readonly',
+                                 values=list(self.chart_ranges))
+        range_box.pack(fill='x')
+        range_box.bind('<<ComboboxSelected>>', self.change_chart_range)
+
+    def create_metric_card(self, parent, title, variable):
+        card = ttk.Frame(parent, style='Card.TFrame', padding=12)
+        card.pack(fill='x', pady=4)
+
+        header_frame = ttk.Frame(card)
+        header_frame.pack(fill='x', pady=(0, 8))
+
+        ttk.Label(header_frame, text=title, font=('Arial', 11, 'bold'),
+                  foreground=self.current_theme['primary'],
+                  background=self.current_theme['card']).pack(side='left')
+
+        value_label = ttk.Label(card, textvariable=variable, font=('Arial', 13, 'bold'),
+                                foreground=self.current_theme['secondary'],
+                                background=self.current_theme['card'])
+        value_label.pack(anchor='w')
+
+    def setup_process_tab(self, parent):
+        main_frame = ttk.Frame(parent)
+        main_frame.pack(fill='both', expand=True, padx=10, pady=10)
+
+        filter_frame = ttk.Frame(main_frame)
+        filter_frame.pack(fill='x', pady=(0, 10))
+
+        ttk.Label(filter_frame, text="Поиск:").pack(side='left', padx=(0, 5))
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(filter_frame, textvariable=self.search_var, width=40)
+        search_entry.pack(side='left', padx=(0, 10))
+        search_entry.bind('<KeyRelease>', self.filter_processes)
+
+        ttk.Button(filter_frame, text="🔄 Обновить", command=self.update_processes).pack(side='left', padx=5)
+        ttk.Button(filter_frame, text="❌ Завершить", command=self.kill_process).pack(side='left', padx=5)
+        ttk.Button(filter_frame, text="📊 Детали", command=self.show_process_details).pack(side='left', padx=5)
+        ttk.Button(filter_frame, text="🧹 Очистить", command=self.clear_process_filter).pack(side='left', padx=5)
+
+        self.process_auto_var = tk.BooleanVar(value=self.settings.get('process_auto_refresh', True))
+        ttk.Checkbutton(filter_frame, text="Автообновление",
+                        variable=self.process_auto_var).pack(side='left', padx=5)
+
+        columns = ProcessTableModel.COLUMNS
+        self.process_model = ProcessTableModel(self.settings.get('process_sort', [('cpu', True)]))
+        self.process_view = VirtualTable(main_frame, self.process_model, columns, height=20)
+        self.tree = self.process_view.tree
+
+        self.process_headings = {
+            'pid': 'PID',
+            'name': 'Имя процесса',
+            'cpu': 'CPU %',
+            'memory': 'Память (MB)',
+            'status': 'Статус',
+            'user': 'Пользователь'
+        }
+        for column in columns:
+            self.tree.heading(column, command=lambda c=column: self.sort_treeview(c))
+        self.tree.bind('<Shift-Button-1>', self.on_process_heading_shift_click)
+        self.update_process_headings()
+
+        self.tree.column('pid', width=80, anchor='center')
+        self.tree.column('name', width=200)
+        self.tree.column('cpu', width=80, anchor='center')
+        self.tree.column('memory', width=100, anchor='center')
+        self.tree.column('status', width=100, anchor='center')
+        self.tree.column('user', width=120)
+
+        self.tree.pack(side='left', fill='both', expand=True)
+        self.process_view.scrollbar.pack(side='right', fill='y')
+
+        self.setup_treeview_context_menu()
+        self.update_processes()
+        self.root.after(self.process_refresh_interval, self.auto_refresh_processes)
+
+    def setup_treeview_context_menu(self):
+        self.context_menu = tk.Menu(self.tree, tearoff=0)
+        self.context_menu.add_command(label="Завершить процесс", command=self.kill_process)
+        self.context_menu.add_command(label="Подробности", command=self.show_process_details)
+        self.context_menu.add_separator()
+        self.context_menu.add_command(label="Обновить", command=self.update_processes)
+
+        self.tree.bind("<Button-3>", self.show_context_menu)
+
+    def show_context_menu(self, event):
+        item = self.tree.identify_row(event.y)
+        if item:
+            self.process_view.select_row(item)
+            self.context_menu.post(event.x_root, event.y_root)
+
+    def setup_cgroup_tab(self, parent):
+        main_frame = ttk.Frame(parent)
+        main_frame.pack(fill='both', expand=True, padx=10, pady=10)
+
+        top_frame = ttk.Frame(main_frame)
+        top_frame.pack(fill='x', pady=(0, 10))
+        ttk.Button(top_frame, text="🔄 Обновить", command=self.update_cgroups).pack(side='left')
+        self.cgroup_status_var = tk.StringVar(value="")
+        ttk.Label(top_frame, textvariable=self.cgroup_status_var).pack(side='left', padx=10)
+
+        columns = ('cpu', 'memory', 'io_read', 'io_write', 'pids')
+        self.cgroup_tree = ttk.Treeview(main_frame, columns=columns, height=20)
+        self.cgroup_tree.column('#0', width=380)
+        for column, text, width in (('cpu', 'CPU %', 80), ('memory', 'Память (MB)', 110),
+                                    ('io_read', 'Чтение (MB/s)', 110), ('io_write', 'Запись (MB/s)', 110),
+                                    ('pids', 'Процессов', 90)):
+            self.cgroup_tree.column(column, width=width, anchor='e')
+        self.update_cgroup_headings()
+
+        scrollbar = ttk.Scrollbar(main_frame, orient='vertical', command=self.cgroup_tree.yview)
+        self.cgroup_tree.configure(yscrollcommand=scrollbar.set)
+        self.cgroup_tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        self.cgroup_tree.bind('<<TreeviewOpen>>', lambda e: self.show_cgroup_processes(self.cgroup_tree.focus()))
+
+        if not self.cgroup_collector.available:
+            self.cgroup_status_var.set("cgroup v2 не найдена")
+            return
+        self.update_cgroups()
+        self.root.after(self.process_refresh_interval, self.auto_refresh_cgroups)
+
+    def update_cgroup_headings(self):
+        titles = {'#0': 'Группа', 'cpu': 'CPU %', 'memory': 'Память (MB)', 'io_read': 'Чтение (MB/s)',
+                  'io_write': 'Запись (MB/s)', 'pids': 'Процессов'}
+        column, reverse = self.cgroup_sort
+        for name, title in titles.items():
+            arrow = (' ▼' if reverse else ' ▲') if name == column else ''
+            self.cgroup_tree.heading(name, text=title + arrow,
+                                     command=lambda c=name: self.sort_cgroups(c))
+
+    def sort_cgroups(self, column):
+        current, reverse = self.cgroup_sort
+        self.cgroup_sort = (column, not reverse if column == current else column != '#0')
+        self.update_cgroup_headings()
+        if self.cgroup_groups:
+            self.apply_cgroups(self.cgroup_groups)
+
+    def auto_refresh_cgroups(self):
+        if not self.running:
+            return
+        # Дерево обновляется, только пока вкладка открыта.
+        if self.process_auto_var.get() and self.cgroup_tree.winfo_ismapped():
+            self.update_cgroups()
+        self.root.after(self.process_refresh_interval, self.auto_refresh_cgroups)
+
+    def update_cgroups(self):
+        if self.cgroup_refresh_thread is not None and self.cgroup_refresh_thread.is_alive():
+            return
+        self.cgroup_refresh_thread = threading.Thread(target=self.collect_cgroups, daemon=True)
+        self.cgroup_refresh_thread.start()
+
+    def collect_cgroups(self):
+        try:
+            groups = self.cgroup_collector.sample()
+        except Exception as e:
+            print(f"Ошибка чтения cgroup: {e}")
+            return
+        self.ui_queue.put('cgroup_tree', self.apply_cgroups, groups)
+
+    def cgroup_sort_key(self, stats):
+        column, _ = self.cgroup_sort
+        if column == '#0':
+            return stats.name
+        value = getattr(stats, column)
+        return -1 if value is None else value
+
+    def apply_cgroups(self, groups):
+        # Дерево обновляется на месте (iid - путь группы): раскрытые узлы,
+        # выделение и прокрутка сохраняются.
+        self.cgroup_groups = groups
+        tree = self.cgroup_tree
+        children = {}
+        for stats in groups.values():
+            children.setdefault(stats.parent, []).append(stats)
+        _, reverse = self.cgroup_sort
+        for siblings in children.values():
+            siblings.sort(key=self.cgroup_sort_key, reverse=reverse)
+
+        for item in [item for item in self.iter_cgroup_items('') if item not in groups]:
+            if tree.exists(item):
+                tree.delete(item)
+
+        stack = [(None, '')]
+        while stack:
+            path, parent = stack.pop()
+            for index, stats in enumerate(children.get(path, ())):
+                values = format_cgroup(stats)
+                if tree.exists(stats.path):
+                    tree.item(stats.path, values=values)
+                    if tree.parent(stats.path) != parent or tree.index(stats.path) != index:
+                        tree.move(stats.path, parent, index)
+                else:
+                    tree.insert(parent, index, iid=stats.path, text=stats.name, values=values)
+                stack.append((stats.path, stats.path))
+
+        for item in self.iter_cgroup_items(''):
+            if tree.item(item, 'open'):
+                self.show_cgroup_processes(item)
+
+        total = groups.get('/')
+        self.cgroup_status_var.set(f"Групп: {len(groups)}" +
+                                   (f", процессов: {total.pids}" if total is not None and total.pids else ""))
+
+    def iter_cgroup_items(self, parent):
+        for item in self.cgroup_tree.get_children(parent):
+            if not item.startswith('pid:'):
+                yield item
+                yield from self.iter_cgroup_items(item)
+
+    def show_cgroup_processes(self, path):
+        # Процессы группы (из cgroup.procs) показываются дочерними строками
+        # раскрытого узла после подгрупп.
+        if not path or path.startswith('pid:'):
+            return
+        tree = self.cgroup_tree
+        for item in tree.get_children(path):
+            if item.startswith('pid:'):
+                tree.delete(item)
+        for pid in self.cgroup_collector.processes(path)[:CGROUP_PROCESS_LIMIT]:
+            entry = self.process_cache.get(pid)
+            if entry is not None:
+                values = (f"{entry.cpu_percent:.1f}", f"{entry.memory_rss / 1024 / 1024:.1f}", '', '', '')
+                text = f"{entry.name} ({pid})"
+            else:
+                values = ('', '', '', '', '')
+                text = f"PID {pid}"
+            tree.insert(path, 'end', iid=f"pid:{path}:{pid}", text=text, values=values)
+
+    def setup_system_tab(self, parent):
+        main_frame = ttk.Frame(parent)
+        main_frame.pack(fill='both', expand=True, padx=10, pady=10)
+
+        sys_notebook = ttk.Notebook(main_frame)
+        sys_notebook.pack(fill='both', expand=True)
+
+        general_frame = ttk.Frame(sys_notebook)
+        sys_notebook.add(general_frame, text="Общая информация")
+
+        general_info = scrolledtext.ScrolledText(general_frame, width=80, height=20,
+                                                 bg='#34495e', fg='white', font=('Consolas', 10))
+        general_info.pack(fill='both', expand=True, padx=10, pady=10)
+
+        info = self.get_system_info()
+        general_info.insert('1.0', info)
+        general_info.config(state='disabled')
+
+        hardware_frame = ttk.Frame(sys_notebook)
+        sys_notebook.add(hardware_frame, text="Аппаратное обеспечение")
+
+        hardware_info = scrolledtext.ScrolledText(hardware_frame, width=80, height=20,
+                                                  bg='#34495e', fg='white', font=('Consolas', 10))
+        hardware_info.pack(fill='both', expand=True, padx=10, pady=10)
+
+        hw_info = self.get_hardware_info()
+        hardware_info.insert('1.0', hw_info)
+        hardware_info.config(state='disabled')
+
+    def setup_network_tab(self, parent):
+        main_frame = ttk.Frame(parent)
+        main_frame.pack(fill='both', expand=True, padx=10, pady=10)
+
+        filter_frame = ttk.Frame(main_frame)
+        filter_frame.pack(fill='x', pady=(0, 10))
+
+        ttk.Label(filter_frame, text="Группировка:").pack(side='left')
+        self.net_groupings = {
+            "Удаленный хост": 'host',
+            "Процесс": 'process',
+            "Хост и процесс": 'host_process'
+        }
+        self.net_group_var = tk.StringVar(value="Удаленный хост")
+        group_box = ttk.Combobox(filter_frame, textvariable=self.net_group_var, state='readonly',
+                                 values=list(self.net_groupings), width=16)
+        group_box.pack(side='left', padx=(5, 15))
+        group_box.bind('<<ComboboxSelected>>', lambda e: self.update_network_connections())
+
+        ttk.Label(filter_frame, text="Состояние:").pack(side='left')
+        self.net_state_var = tk.StringVar(value='ESTABLISHED')
+        state_box = ttk.Combobox(filter_frame, textvariable=self.net_state_var, state='readonly',
+                                 values=['Все'] + list(TCP_STATES.values()), width=14)
+        state_box.pack(side='left', padx=(5, 15))
+        state_box.bind('<<ComboboxSelected>>', lambda e: self.update_network_connections())
+
+        ttk.Label(filter_frame, text="Порт:").pack(side='left')
+        self.net_port_var = tk.StringVar()
+        port_entry = ttk.Entry(filter_frame, textvariable=self.net_port_var, width=8)
+        port_entry.pack(side='left', padx=5)
+        port_entry.bind('<Return>', lambda e: self.update_network_connections())
+
+        columns = ('group', 'count', 'ports', 'states')
+        self.net_tree = ttk.Treeview(main_frame, columns=columns, show='headings', height=20)
+
+        self.net_tree.heading('group', text='Группа')
+        self.net_tree.heading('count', text='Соединений')
+        self.net_tree.heading('ports', text='Порты')
+        self.net_tree.heading('states', text='Состояния')
+
+        self.net_tree.column('group', width=300)
+        self.net_tree.column('count', width=100, anchor='e')
+        self.net_tree.column('ports', width=150)
+        self.net_tree.column('states', width=200)
+
+        scrollbar = ttk.Scrollbar(main_frame, orient='vertical', command=self.net_tree.yview)
+        self.net_tree.configure(yscrollcommand=scrollbar.set)
+
+        btn_frame = ttk.Frame(main_frame)
+        btn_frame.pack(side='bottom', fill='x', pady=(10, 0))
+
+        self.net_tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+
+        ttk.Button(btn_frame, text="🔄 Обновить", command=self.update_network_connections).pack(side='left')
+        self.net_summary_var = tk.StringVar(value="")
+        ttk.Label(btn_frame, textvariable=self.net_summary_var).pack(side='left', padx=10)
+
+        self.net_reconciler = TreeviewReconciler(self.net_tree, columns)
+        self.update_network_connections()
+
+    def setup_startup_tab(self, parent):
+        main_frame = ttk.Frame(parent)
+        main_frame.pack(fill='both', expand=True, padx=10, pady=10)
+
+        columns = ('name', 'path', 'status')
+        self.startup_tree = ttk.Treeview(main_frame, columns=columns, show='headings', height=20)
+
+        self.startup_tree.heading('name', text='Название')
+        self.startup_tree.heading('path', text='Путь')
+        self.startup_tree.heading('status', text='Статус')
+
+        self.startup_tree.column('name', width=200)
+        self.startup_tree.column('path', width=400)
+        self.startup_tree.column('status', width=100)
+
+        scrollbar = ttk.Scrollbar(main_frame, orient='vertical', command=self.startup_tree.yview)
+        self.startup_tree.configure(yscrollcommand=scrollbar.set)
+
+        self.startup_tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+
+        btn_frame = ttk.Frame(main_frame)
+        btn_frame.pack(fill='x', pady=(10, 0))
+
+        ttk.Button(btn_frame, text="🔄 Обновить", command=self.update_startup_programs).pack(side='left', padx=5)
+        ttk.Button(btn_frame, text="✅ Включить", command=self.enable_startup).pack(side='left', padx=5)
+        ttk.Button(btn_frame, text="❌ Отключить", command=self.disable_startup).pack(side='left', padx=5)
+
+        self.update_startup_programs()
+
+    def setup_clean_tab(self, parent):
+        main_frame = ttk.Frame(parent)
+        main_frame.pack(fill='both', expand=True, padx=10, pady=10)
+
+        left_frame = ttk.Frame(main_frame, width=300)
+        left_frame.pack(side='left', fill='y', padx=(0, 10))
+        left_frame.pack_propagate(False)
+
+        ttk.Label(left_frame, text="🧹 Инструменты очистки", style='Header.TLabel').pack(pady=(0, 15))
+
+        clean_actions = [
+            ("🧽 Очистить кэш", self.clean_temp_files),
+            ("🗑️ Очистить корзину", self.clean_recycle_bin),
+            ("📊 Анализ диска", self.analyze_disk),
+            ("🔍 Поиск больших файлов", self.find_large_files),
+            ("📋 Очистить историю", self.clear_history)
+        ]
+
+        for text, command in clean_actions:
+            btn = ttk.Button(left_frame, text=text, command=command, width=25)
+            btn.pack(pady=5)
+
+        self.cleanup_dry_run_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(left_frame, text="Только оценка (без удаления)",
+                        variable=self.cleanup_dry_run_var).pack(pady=(10, 5))
+
+        right_frame = ttk.Frame(main_frame)
+        right_frame.pack(side='right', fill='both', expand=True)
+
+        ttk.Label(right_frame, text="📋 Результаты очистки", style='Header.TLabel').pack(pady=(0, 10))
+
+        self.clean_result = scrolledtext.ScrolledText(right_frame, width=60, height=20,
+                                                      bg='#34495e', fg='white', font=('Consolas', 10))
+        self.clean_result.pack(fill='both', expand=True)
+        self.clean_result.insert('1.0', "Здесь будут отображаться результаты очистки...\n")
+        self.clean_result.config(state='disabled')
+
+    def setup_about_tab(self, parent):
+        main_frame = ttk.Frame(parent)
+        main_frame.pack(fill='both', expand=True, padx=20, pady=20)
+
+        canvas = tk.Canvas(main_frame, bg=self.current_theme['bg'], highlightthickness=0)
+        scrollbar = ttk.Scrollbar(main_frame, orient='vertical', command=canvas.yview)
+        scrollable_frame = ttk.Frame(canvas)
+
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+
+        canvas.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+
+        header_frame = ttk.Frame(scrollable_frame)
+        header_frame.pack(fill='x', pady=(0, 20))
+
+        icon_label = ttk.Label(header_frame, text="🚀", font=('Arial', 48))
+        icon_label.pack(side='left', padx=(0, 20))
+
+        title_frame = ttk.Frame(header_frame)
+        title_frame.pack(side='left', fill='y')
+
+        ttk.Label(title_frame, text="System Monitoring Tool v1.0.0",
+                  font=('Arial', 24, 'bold'), foreground='#3498db').pack(anchor='w')
+        ttk.Label(title_frame, text="Мощный мониторинг системы",
+                  font=('Arial', 12), foreground='#7f8c8d').pack(anchor='w')
+        ttk.Label(title_frame, text=f"Версия 1.0.0 | Сборка {datetime.now().strftime('%Y%m%d')}",
+                  font=('Arial', 10), foreground='#95a5a6').pack(anchor='w')
+
+        info_card = ttk.Frame(scrollable_frame, style='Card.TFrame', padding=20)
+        info_card.pack(fill='x', pady=(0, 20))
+
+        info_text = """
+    System Monitoring Tool - это комплексное решение для мониторинга и управления 
+    системными ресурсами вашего компьютера. Программа сочетает в себе мощный 
+    функционал и современный интерфейс для максимального удобства использования.
+
+    Ключевые возможности:
+    • Реальный мониторинг CPU, памяти, диска и сети
+    • Полный контроль над процессами и службами
+    • Мониторинг температуры компонентов
+    • Анализ сетевых соединений
+    • Управление автозагрузкой приложений
+    • Интеллектуальная очистка системы
+    • Современный адаптивный интерфейс
+    • Поддержка Windows, Linux и macOS
+        """
+
+        info_label = ttk.Label(info_card, text=info_text, font=('Arial', 11),
+                               justify='left', background='#34495e', foreground='white')
+        info_label.pack(anchor='w')
+
+        sys_info_card = ttk.Frame(scrollable_frame, style='Card.TFrame', padding=20)
+        sys_info_card.pack(fill='x', pady=(0, 20))
+
+        ttk.Label(sys_info_card, text="📋 Системная информация",
+                  font=('Arial', 14, 'bold'), foreground='#3498db').pack(anchor='w', pady=(0, 15))
+
+        sys_grid = ttk.Frame(sys_info_card)
+        sys_grid.pack(fill='x')
+
+        sys_data = [
+            ("💻 Система", f"{platform.system()} {platform.release()}"),
+            ("🏗️ Архитектура", platform.architecture()[0]),
+            ("🐍 Python", sys.version.split()[0]),
+            ("🚀 Процессор", platform.processor() or "Не определен"),
+            ("💾 Память", f"{psutil.virtual_memory().total // 1024 // 1024} MB"),
+            ("📦 Версия", "1.0.0 (Stable)"),
+            ("📅 Сборка", datetime.now().strftime("%Y-%m-%d %H:%M")),
+            ("👤 Пользователь", os.getlogin())
+        ]
+
+        for i, (label, value) in enumerate(sys_data):
+            row = i // 2
+            col = i % 2 * 2
+
+            ttk.Label(sys_grid, text=label, font=('Arial', 10, 'bold'),
+                      foreground='#bdc3c7').grid(row=row, column=col, sticky='w', padx=(0, 10), pady=2)
+            ttk.Label(sys_grid, text=value, font=('Arial', 10),
+                      foreground='#ecf0f1').grid(row=row, column=col + 1, sticky='w', pady=2)
+
+        dev_card = ttk.Frame(scrollable_frame, style='Card.TFrame', padding=20)
+        dev_card.pack(fill='x', pady=(0, 20))
+
+        ttk.Label(dev_card, text="👨‍💻 Разработчик",
+                  font=('Arial', 14, 'bold'), foreground='#3498db').pack(anchor='w', pady=(0, 15))
+
+        dev_info = """
+    Enderiarti 
+
+    Контакты:
+    • Email: dimakokulov3@gmail.com
+    • GitHub: github.com/Enderiarti
+    • Telegram: @Diforo4ka
+        """
+
+        ttk.Label(dev_card, text=dev_info, font=('Arial', 11),
+                  justify='left', background='#34495e', foreground='white').pack(anchor='w', pady=(0, 15))
+
+        social_frame = ttk.Frame(dev_card)
+        social_frame.pack(fill='x', pady=(0, 15))
+
+        social_buttons = [
+            ("GitHub", "https://github.com/Enderiarti", "#6cc644"),
+            ("Telegram", "https://t.me/lowinolo", "#0088cc")
+        ]
+
+        for platform_name, url, color in social_buttons:
+            btn = tk.Button(social_frame, text=platform_name, font=('Arial', 10, 'bold'),
+                            bg=color, fg='white', relief='flat', cursor='hand2',
+                            command=lambda u=url: webbrowser.open(u))
+            btn.pack(side='left', padx=(0, 10), ipadx=10, ipady=5)
+
+        license_card = ttk.Frame(scrollable_frame, style='Card.TFrame', padding=20)
+        license_card.pack(fill='x', pady=(0, 20))
+
+        ttk.Label(license_card, text="📝 Лицензия",
+                  font=('Arial', 14, 'bold'), foreground='#3498db').pack(anchor='w', pady=(0, 15))
+
+        license_text = """
+    MIT License
+
+    Copyright (c) 2025 Enderiarti
+
+    Разрешается бесплатное использование, копирование, модификация, объединение, 
+    публикация, распространение, сублицензирование и/или продажа копий Программного 
+    обеспечения, а также лицам, которым предоставляется Программное обеспечение, 
+    при соблюдении следующих условий:
+
+    Указанное выше уведомление об авторском праве и данное уведомление о разрешении 
+    должны быть включены во все копии или существенные части Программного обеспечения.
+        """
+
+        license_label = ttk.Label(license_card, text=license_text, font=('Arial', 10),
+                                  justify='left', background='#34495e', foreground='#bdc3c7')
+        license_label.pack(anchor='w')
+
+        action_frame = ttk.Frame(scrollable_frame)
+        action_frame.pack(fill='x', pady=(0, 20))
+
+        actions = [
+            ("📖 Документация", "https://github.com/Enderiarti/system-monitoring-system", "#27ae60"),
+            ("🐛 Сообщить об ошибке", "https://github.com/Enderiarti/system-monitoring-system", "#e74c3c"),
+            ("⭐ Оценить на GitHub", "https://github.com/Enderiarti/system-monitoring-system/stargazers", "#f39c12"),
+            ("🔄 Проверить обновления", self.check_updates, "#3498db"),
+            ("📦 Экспорт отчетов", self.export_reports, "#9b59b6"),
+            ("⚙️ Настройки программы", self.open_settings, "#34495e")
+        ]
+
+        for i, (text, action, color) in enumerate(actions):
+            row = i // 3
+            col = i % 3
+
+            if isinstance(action, str):
+                cmd = lambda url=action: webbrowser.open(url)
+            else:
+                cmd = action
+
+            btn = tk.Button(action_frame, text=text, font=('Arial', 10, 'bold'),
+                            bg=color, fg='white', relief='flat', cursor='hand2',
+                            command=cmd)
+            btn.grid(row=row, column=col, padx=5, pady=5, sticky='ew')
+            action_frame.columnconfigure(col, weight=1)
+
+        stats_card = ttk.Frame(scrollable_frame, style='Card.TFrame', padding=20)
+        stats_card.pack(fill='x', pady=(0, 20))
+
+        ttk.Label(stats_card, text="📈 Статистика",
+                  font=('Arial', 14, 'bold'), foreground='#3498db').pack(anchor='w', pady=(0, 15))
+
+        stats_text = f"""
+    • Время работы: {time.strftime('%H:%M:%S', time.gmtime(time.time() - self.start_time))}
+    • Памяти использовано: {psutil.virtual_memory().used // 1024 // 1024} MB
+    • Сетевой трафик: {(psutil.net_io_counters().bytes_sent + psutil.net_io_counters().bytes_recv) // 1024 // 1024} MB
+    • Ошибок: 0
+        """
+
+        ttk.Label(stats_card, text=stats_text, font=('Arial', 11),
+                  justify='left', background='#34495e', foreground='white').pack(anchor='w')
+
+        footer_frame = ttk.Frame(scrollable_frame)
+        footer_frame.pack(fill='x', pady=(20, 0))
+
+        footer_text = f"© 2025 Lowinolo | System Monitoring Tool v1.0.0 | {platform.system()} {platform.release()}"
+        ttk.Label(footer_frame, text=footer_text, font=('Arial', 9),
+                  foreground='#7f8c8d').pack(anchor='center')
+
+        self.start_time = time.time()
+
+    def check_updates(self):
+        messagebox.showinfo("Проверка обновлений",
+                            "Проверяем наличие обновлений...\n\nВерсия 1.0.0 актуальна!")
+
+    def export_reports(self):
+        try:
+            stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = f"system_report_{stamp}.txt"
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(self.get_system_info())
+                f.write("\n\n" + self.get_hardware_info())
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось экспортировать отчет: {e}")
+            return
+
+        # История, процессы и соединения выгружаются в фоне: запись
+        # недельной истории может занять несколько секунд.
+        threading.Thread(target=self.export_structured, args=(stamp, filename), daemon=True).start()
+
+    def export_structured(self, stamp, report):
+        fmt = self.settings.get('export_format', 'csv')
+        compression = self.settings.get('export_compression', 'gz')
+        suffix = {'jsonl': '.jsonl', 'csv': '.csv', 'columnar': '.smtc'}[fmt] + (f".{compression}" if compression else "")
+        files = [report]
+        try:
+            if self.store is not None:
+                path = f"system_history_{stamp}{suffix}"
+                export_history(self.store, path, fmt=fmt, compression=compression)
+                files.append(path)
+
+            path = f"system_processes_{stamp}{suffix}"
+            export_processes(self.process_model.snapshot, path, fmt=fmt, compression=compression)
+            files.append(path)
+
+            path = f"system_connections_{stamp}{suffix}"
+            _, _, rows = self.connection_collector.collect(states=None, top=NET_TOP_GROUPS)
+            export_connections(rows, path, fmt=fmt, compression=compression)
+            files.append(path)
+        except Exception as e:
+            self.ui_queue.put('export', messagebox.showerror, "Ошибка", f"Не удалось экспортировать данные: {e}")
+            return
+
+        self.ui_queue.put('export', messagebox.showinfo, "Экспорт отчетов",
+                          "Отчеты успешно экспортированы в файлы:\n" + "\n".join(files))
+
+    def open_settings(self):
+        messagebox.showinfo("Настройки", "Открываем настройки программы...")
+
+    def update_data(self, sample):
+        cpu_percent = sample.get('cpu', 0.0)
+        mem_percent = sample.get('mem', 0.0)
+        disk_percent = sample.get('disk', 0.0)
+
+        with self.history.lock:
+            self.history.append(sample)
+            if self.anomalies is not None:
+                self.anomalies.update(sample)
+
+        self.ui_queue.put('charts', self.update_charts)
+        self.ui_queue.put('cpu_var', self.cpu_var.set, f"Загрузка CPU: {cpu_percent}%")
+        self.ui_queue.put('mem_var', self.mem_var.set, f"Исп. памяти: {mem_percent}%")
+        self.ui_queue.put('disk_var', self.disk_var.set, f"Исп. диска: {disk_percent}%")
+        self.ui_queue.put('net_var', self.net_var.set, f"Сетевой трафик: {format_network(sample)}")
+        self.ui_queue.put('temp_var', self.temp_var.set, f"Температура: {format_temperature(sample)}")
+        self.ui_queue.put('io_var', self.io_var.set, f"Диск I/O: {format_disk_io(sample)}")
+        self.ui_queue.put('status_var', self.status_var.set, format_status(sample) + format_alerts(self.alerts.active))
+
+    def load_stored_history(self):
+        try:
+            self.history.backfill(self.store.query(fields=self.history.metrics))
+            if self.anomalies is not None:
+                self.anomalies.prime(self.history, ANOMALY_PRIME)
+        except Exception as e:
+            print(f"Ошибка загрузки истории: {e}")
+
+    def update_charts(self):
+        if self.chart_range is None:
+            self.chart_renderer.update(self.history, self.anomalies)
+        elif time.monotonic() - self.chart_range_drawn >= 10:
+            self.draw_chart_range()
+
+    def change_chart_range(self, event=None):
+        self.chart_range = self.chart_ranges.get(self.chart_range_var.get())
+        if self.chart_range is None:
+            self.chart_renderer.set_window(self.chart_window)
+            self.chart_renderer.update(self.history, self.anomalies)
+            return
+
+        self.draw_chart_range()
+
+    def draw_chart_range(self):
+        end = time.time()
+        start = end - self.chart_range
+        series = self.history.range(start, end, self.chart_renderer.pixel_width('cpu'))
+        self.chart_renderer.show_range(series, start, end)
+        self.chart_range_drawn = time.monotonic()
+
+    def get_system_info(self):
+        info = "=== ИНФОРМАЦИЯ О СИСТЕМЕ ===\n\n"
+
+        info += f"Система: {platform.system()} {platform.release()}\n"
+        info += f"Версия: {platform.version()}\n"
+        info += f"Архитектура: {platform.architecture()[0]}\n"
+        info += f"Имя компьютера: {platform.node()}\n\n"
+
+        info += "=== ПРОЦЕССОР ===\n"
+        info += f"Процессор: {platform.processor()}\n"
+        info += f"Ядер: {psutil.cpu_count()} (логических: {psutil.cpu_count(logical=True)})\n"
+        info += f"Тактовая частота: {psutil.cpu_freq().current if psutil.cpu_freq() else 'N/A'} MHz\n\n"
+
+        mem = psutil.virtual_memory()
+        info += "=== ПАМЯТЬ ===\n"
+        info += f"ОЗУ: {mem.total // 1024 // 1024} MB total\n"
+        info += f"Доступно: {mem.available // 1024 // 1024} MB\n"
+        info += f"Использовано: {mem.used // 1024 // 1024} MB\n"
+        info += f"Процент использования: {mem.percent}%\n\n"
+
+        info += "=== ДИСКИ ===\n"
+        for part in psutil.disk_partitions():
+            try:
+                usage = psutil.disk_usage(part.mountpoint)
+                info += f"{part.device} ({part.fstype}): {usage.total // 1024 // 1024 // 1024} GB total, {usage.free // 1024 // 1024 // 1024} GB free\n"
+            except:
+                continue
+
+        return info
+
+    def get_hardware_info(self):
+        info = "=== АППАРАТНОЕ ОБЕСПЕЧЕНИЕ ===\n\n"
+
+        try:
+            info += "=== ГРАФИЧЕСКИЙ ПРОЦЕССОР ===\n"
+            try:
+                gpus = GPUtil.getGPUs() if self.sensors.gpu_available else []
+                if not gpus:
+                    info += "Информация о GPU недоступна\n"
+                for i, gpu in enumerate(gpus):
+                    info += f"GPU {i}: {gpu.name}\n"
+                    info += f"  Память: {gpu.memoryTotal} MB\n"
+                    info += f"  Загрузка: {gpu.load * 100}%\n"
+                    info += f"  Температура: {gpu.temperature}°C\n"
+            except:
+                info += "Информация о GPU недоступна\n"
+
+            info += "\n=== ДАТЧИКИ ТЕМПЕРАТУРЫ ===\n"
+            readings = self.sensors.read_temperatures()
+            for name, value in readings.items():
+                info += f"{name}: {value:.1f}°C\n"
+            if not readings:
+                info += "Датчики температуры не найдены\n"
+
+            info += "\n=== МОНИТОРЫ ===\n"
+            try:
+                monitors = get_monitors()
+                for i, m in enumerate(monitors):
+                    info += f"Монитор {i}: {m.width}x{m.height} @ {m.x},{m.y}\n"
+            except:
+                info += "Информация о мониторах недоступна\n"
+
+            info += "\n=== БАТАРЕЯ ===\n"
+            try:
+                battery = psutil.sensors_battery()
+                if battery:
+                    info += f"Заряд: {battery.percent}%\n"
+                    info += f"Статус: {'Заряжается' if battery.power_plugged else 'Разряжается'}\n"
+                    if battery.secsleft != psutil.POWER_TIME_UNLIMITED:
+                        info += f"Осталось: {battery.secsleft // 3600} ч. {(battery.secsleft % 3600) // 60} мин.\n"
+                else:
+                    info += "Батарея не обнаружена\n"
+            except:
+                info += "Информация о батарее недоступна\n"
+
+        except Exception as e:
+            info += f"Ошибка получения информации об аппаратном обеспечении: {e}\n"
+
+        return info
+
+    def update_processes(self):
+        if self.process_refresh_thread is not None and self.process_refresh_thread.is_alive():
+            return
+
+        self.process_refresh_thread = threading.Thread(target=self.collect_processes, daemon=True)
+        self.process_refresh_thread.start()
+
+    def collect_processes(self):
+        try:
+            snapshot = ProcessSnapshot.from_entries(self.process_cache.refresh())
+        except Exception as e:
+            print(f"Ошибка получения процессов: {e}")
+            return
+        self.ui_queue.put('process_table', self.apply_process_snapshot, snapshot)
+
+    def apply_process_snapshot(self, snapshot):
+        self.process_model.load(snapshot)
+        self.process_view.refresh()
+
+    def auto_refresh_processes(self):
+        if not self.running:
+            return
+        if self.process_auto_var.get():
+            self.update_processes()
+        self.root.after(self.process_refresh_interval, self.auto_refresh_processes)
+
+    def filter_processes(self, event=None):
+        if self.process_search_after is not None:
+            self.root.after_cancel(self.process_search_after)
+        self.process_search_after = self.root.after(self.process_search_delay, self.apply_process_filter)
+
+    def apply_process_filter(self):
+        self.process_search_after = None
+        text = self.search_var.get()
+        if text.strip() != self.process_model.filter_text:
+            self.process_model.set_filter(text)
+            self.process_view.refresh()
+
+    def clear_process_filter(self):
+        self.search_var.set("")
+        self.apply_process_filter()
+
+    def sort_treeview(self, column, append=False):
+        self.process_model.toggle_sort(column, append)
+        self.settings['process_sort'] = self.process_model.sort_order
+        self.update_process_headings()
+        self.process_view.refresh()
+
+    def on_process_heading_shift_click(self, event):
+        if self.tree.identify_region(event.x, event.y) != 'heading':
+            return None
+        column = self.tree.identify_column(event.x)
+        index = int(column.lstrip('#') or 0) - 1
+        if 0 <= index < len(self.process_model.COLUMNS):
+            self.sort_treeview(self.process_model.COLUMNS[index], append=True)
+        return 'break'
+
+    def update_process_headings(self):
+        multi = len(self.process_model.sort_order) > 1
+        for column, text in self.process_headings.items():
+            direction = self.process_model.sort_direction(column)
+            if direction is not None:
+                priority, reverse = direction
+                text += " ▼" if reverse else " ▲"
+                if multi:
+                    text += str(priority + 1)
+            self.tree.heading(column, text=text)
+
+    def selected_process(self):
+        key = self.process_view.selected_key
+        if key is None:
+            return None
+        position = self.process_model.position(key)
+        if position is None:
+            return None
+        return self.process_model.row(position)
+
+    def kill_process(self):
+        row = self.selected_process()
+        if row is None:
+            messagebox.showwarning("Внимание", "Выберите процесс для завершения")
+            return
+
+        pid = row[0]
+        name = row[1]
+
+        if messagebox.askyesno("Подтверждение", f"Вы уверены, что хотите завершить процесс {name} (PID: {pid})?"):
+            try:
+                process = psutil.Process(pid)
+                process.terminate()
+                messagebox.showinfo("Успех", f"Процесс {name} завершен")
+                self.update_processes()
+            except Exception as e:
+                messagebox.showerror("Ошибка", f"Не удалось завершить процесс: {e}")
+
+    def show_process_details(self):
+        row = self.selected_process()
+        if row is None:
+            messagebox.showwarning("Внимание", "Выберите процесс для просмотра")
+            return
+
+        pid = row[0]
+
+        try:
+            entry = self.process_cache.get(pid)
+            process = entry.proc if entry is not None else psutil.Process(pid)
+            with process.oneshot():
+                details = f"""
+Детальная информация о процессе:
+PID: {pid}
+Имя: {process.name()}
+Статус: {process.status()}
+CPU: {entry.cpu_percent if entry is not None else process.cpu_percent():.1f}%
+Память: {process.memory_info().rss // 1024 // 1024} MB
+Пользователь: {process.username()}
+Создан: {time.ctime(process.create_time())}
+Путь: {process.exe() if process.exe() else 'N/A'}
+Рабочая директория: {process.cwd()}
+Кол-во потоков: {process.num_threads()}
+Приоритет: {process.nice()}
+                """
+            messagebox.showinfo("Детали процесса", details)
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось получить информацию: {e}")
+
+    def update_network_connections(self):
+        if self.net_refresh_thread is not None and self.net_refresh_thread.is_alive():
+            return
+
+        state = self.net_state_var.get()
+        port = self.net_port_var.get().strip()
+        try:
+            port = int(port) if port else None
+        except ValueError:
+            messagebox.showwarning("Внимание", "Порт должен быть числом")
+            return
+
+        self.net_refresh_thread = threading.Thread(
+            target=self.collect_connections, daemon=True,
+            args=(self.net_groupings[self.net_group_var.get()], None if state == 'Все' else (state,), port))
+        self.net_refresh_thread.start()
+
+    def collect_connections(self, group, states, port):
+        try:
+            total, groups, rows = self.connection_collector.collect(group, states, port, NET_TOP_GROUPS)
+        except Exception as e:
+            print(f"Ошибка получения соединений: {e}")
+            return
+        self.ui_queue.put('net_table', self.apply_connections, group, total, groups, rows)
+
+    def apply_connections(self, group, total, groups, rows):
+        # Ключи групп зависят от группировки, поэтому строки с разных
+        # группировок не смешиваются: ключ дополняется ее названием.
+        self.net_reconciler.reconcile({(group, key): values for key, *values in rows}, ordered=True)
+        shown = f", показаны первые {len(rows)}" if groups > len(rows) else ""
+        self.net_summary_var.set(f"Соединений: {total}, групп: {groups}{shown}")
+
+    def update_startup_programs(self):
+        for item in self.startup_tree.get_children():
+            self.startup_tree.delete(item)
+
+        if os.name == 'nt':
+            try:
+                import winreg
+                keys = [
+                    (winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Run"),
+                    (winreg.HKEY_LOCAL_MACHINE, r"Software\Microsoft\Windows\CurrentVersion\Run")
+                ]
+
+                for hive, key_path in keys:
+                    try:
+                        key = winreg.OpenKey(hive, key_path)
+                        i = 0
+                        while True:
+                            try:
+                                name, value, _ = winreg.EnumValue(key, i)
+                                self.startup_tree.insert('', 'end', values=(name, value, "Включено"))
+                                i += 1
+                            except WindowsError:
+                                break
+                    except:
+                        pass
+            except:
+                pass
+        else:
+            try:
+                autostart_dirs = [
+                    "/etc/xdg/autostart",
+                    os.path.expanduser("~/.config/autostart")
+                ]
+
+                for autostart_dir in autostart_dirs:
+                    if os.path.exists(autostart_dir):
+                        for file in os.listdir(autostart_dir):
+                            if file.endswith('.desktop'):
+                                self.startup_tree.insert('', 'end', values=(
+                                    file,
+                                    os.path.join(autostart_dir, file),
+                                    "Включено"
+                                ))
+            except:
+                pass
+
+    def enable_startup(self):
+        selected = self.startup_tree.selection()
+        if not selected:
+            messagebox.showwarning("Внимание", "Выберите программу для включения")
+            return
+
+        messagebox.showinfo("Инфо", "Функция включения автозагрузки в разработке")
+
+    def disable_startup(self):
+        selected = self.startup_tree.selection()
+        if not selected:
+            messagebox.showwarning("Внимание", "Выберите программу для отключения")
+            return
+
+        messagebox.showinfo("Инфо", "Функция отключения автозагрузки в разработке")
+
+    def clean_temp_files(self):
+        self.run_cleanup('temp', "ВРЕМЕННЫЕ ФАЙЛЫ", temp_directories())
+
+    def run_cleanup(self, name, title, roots, match=None):
+        # Повторное нажатие во время очистки останавливает ее.
+        job = self.cleanup_jobs.get(name)
+        if job is not None and job.running:
+            job.cancel()
+            return
+
+        dry_run = self.cleanup_dry_run_var.get()
+        header = f"=== {title}{' (оценка)' if dry_run else ''} ===\n"
+        self.start_result_block(name, header)
+        self.cleanup_jobs[name] = CleanupJob(
+            roots, match=match, dry_run=dry_run,
+            on_update=lambda stats: self.ui_queue.put(f"cleanup_{name}", self.show_cleanup, name, dry_run, stats)
+        ).start()
+
+    def show_cleanup(self, name, dry_run, stats):
+        if stats.finished is None:
+            state = "идет очистка (нажмите еще раз, чтобы остановить)"
+        elif stats.cancelled:
+            state = "остановлено"
+        else:
+            state = "готово"
+        verb = "Можно удалить" if dry_run else "Удалено"
+        text = (f"{state}, {stats.elapsed:.1f} с\n"
+                f"{verb} {stats.files} файлов, {stats.bytes // 1024 // 1024} MB "
+                f"({stats.dirs} каталогов, ошибок: {stats.errors})\n")
+        self.set_result_block(name, text)
+        if stats.finished is not None and not stats.cancelled:
+            messagebox.showinfo("Успех", text)
+
+    def start_result_block(self, name, header):
+        # Блок результатов между двумя метками: фоновая задача переписывает
+        # его целиком, не затрагивая остальной текст.
+        self.clean_result.config(state='normal')
+        self.clean_result.insert('end', header)
+        self.clean_result.mark_set(f"{name}_start", 'end-1c')
+        self.clean_result.mark_gravity(f"{name}_start", 'left')
+        self.clean_result.mark_set(f"{name}_end", 'end-1c')
+        self.clean_result.mark_gravity(f"{name}_end", 'right')
+        self.clean_result.insert('end', "\n")
+        self.clean_result.see('end')
+        self.clean_result.config(state='disabled')
+
+    def set_result_block(self, name, text):
+        self.clean_result.config(state='normal')
+        self.clean_result.delete(f"{name}_start", f"{name}_end")
+        self.clean_result.insert(f"{name}_start", text)
+        self.clean_result.config(state='disabled')
+
+    def clean_recycle_bin(self):
+        try:
+            if os.name == 'nt':
+                import winshell
+                winshell.recycle_bin().empty(confirm=False)
+                messagebox.showinfo("Успех", "Корзина очищена")
+
+                self.clean_result.config(state='normal')
+                self.clean_result.insert('end', "Корзина очищена\n")
+                self.clean_result.see('end')
+                self.clean_result.config(state='disabled')
+            else:
+                messagebox.showinfo("Инфо", "Очистка корзины доступна только на Windows")
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось очистить корзину: {e}")
+
+    def analyze_disk(self):
+        try:
+            disk_info = "=== АНАЛИЗ ДИСКА ===\n\n"
+            for part in psutil.disk_partitions():
+                try:
+                    usage = psutil.disk_usage(part.mountpoint)
+                    disk_info += f"{part.device} ({part.fstype}):\n"
+                    disk_info += f"  Всего: {usage.total // 1024 // 1024 // 1024} GB\n"
+                    disk_info += f"  Использовано: {usage.used // 1024 // 1024 // 1024} GB\n"
+                    disk_info += f"  Свободно: {usage.free // 1024 // 1024 // 1024} GB\n"
+                    disk_info += f"  Заполнение: {usage.percent}%\n\n"
+                except:
+                    continue
+
+            self.clean_result.config(state='normal')
+            self.clean_result.insert('end', disk_info + "\n")
+            self.clean_result.see('end')
+            self.clean_result.config(state='disabled')
+
+            self.show_disk_usage_window()
+
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось проанализировать диск: {e}")
+
+    def show_disk_usage_window(self):
+        if self.disk_usage_window is not None and self.disk_usage_window.winfo_exists():
+            self.disk_usage_window.lift()
+            self.rescan_disk_usage()
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title("Анализ диска")
+        window.geometry("800x600")
+        window.configure(bg=self.current_theme['bg'])
+        self.disk_usage_window = window
+
+        frame = ttk.Frame(window)
+        frame.pack(fill='both', expand=True, padx=10, pady=10)
+
+        tree = ttk.Treeview(frame, columns=('size', 'files', 'share'), height=25)
+        tree.heading('#0', text='Каталог')
+        tree.heading('size', text='Размер (MB)')
+        tree.heading('files', text='Файлов')
+        tree.heading('share', text='Доля')
+        tree.column('#0', width=420)
+        tree.column('size', width=120, anchor='e')
+        tree.column('files', width=100, anchor='e')
+        tree.column('share', width=80, anchor='e')
+        scrollbar = ttk.Scrollbar(frame, orient='vertical', command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        tree.bind('<<TreeviewOpen>>', self.on_disk_tree_open)
+        self.disk_tree = tree
+
+        bottom = ttk.Frame(window)
+        bottom.pack(fill='x', padx=10, pady=(0, 10))
+        self.disk_index_var = tk.StringVar(value="")
+        ttk.Label(bottom, textvariable=self.disk_index_var).pack(side='left')
+        ttk.Button(bottom, text="🔄 Пересканировать", command=self.rescan_disk_usage).pack(side='right')
+
+        self.rescan_disk_usage()
+
+    def rescan_disk_usage(self):
+        if self.disk_index_thread is not None and self.disk_index_thread.is_alive():
+            return
+        self.disk_index_cancel.clear()
+        self.disk_index_thread = threading.Thread(target=self.scan_disk_usage, daemon=True)
+        self.disk_index_thread.start()
+
+    def scan_disk_usage(self):
+        if self.disk_index is None:
+            self.disk_index = DiskUsageIndex(self.settings.get('disk_index_path', DEFAULT_INDEX_PATH))
+        self.ui_queue.put('disk_index_tree', self.populate_disk_tree)
+
+        roots = scan_roots()
+        for root in roots:
+            try:
+                self.disk_index.scan(root, self.disk_index_cancel, lambda stats, root=root: self.ui_queue.put(
+                    'disk_index_var', self.show_disk_index_progress, root, stats))
+            except OSError as e:
+                print(f"Ошибка анализа {root}: {e}")
+            if self.disk_index_cancel.is_set():
+                break
+
+        try:
+            self.disk_index.save()
+        except Exception as e:
+            print(f"Ошибка сохранения индекса диска: {e}")
+        self.ui_queue.put('disk_index_tree', self.populate_disk_tree)
+
+    def show_disk_index_progress(self, root, stats):
+        if self.disk_usage_window is None or not self.disk_usage_window.winfo_exists():
+            return
+        state = "готово" if stats.finished is not None else "анализ"
+        self.disk_index_var.set(f"{root}: {state}, {stats.dirs} каталогов "
+                                f"(прочитано {stats.listed}, из индекса {stats.reused}), "
+                                f"{stats.elapsed:.1f} с")
+
+    def populate_disk_tree(self):
+        if self.disk_usage_window is None or not self.disk_usage_window.winfo_exists():
+            return
+        tree = self.disk_tree
+        opened = {item for item in self.iter_disk_tree() if tree.item(item, 'open')}
+        tree.delete(*tree.get_children())
+        for root in scan_roots():
+            record = self.disk_index.get(root)
+            if record is not None:
+                self.insert_disk_node('', root, root, record, record.total_bytes)
+        for item in sorted(opened, key=len):
+            if tree.exists(item):
+                tree.item(item, open=True)
+                self.fill_disk_node(item)
+
+    def iter_disk_tree(self, parent=''):
+        for item in self.disk_tree.get_children(parent):
+            yield item
+            yield from self.iter_disk_tree(item)
+
+    def insert_disk_node(self, parent, path, text, record, parent_bytes):
+        share = record.total_bytes / parent_bytes * 100 if parent_bytes else 100.0
+        self.disk_tree.insert(parent, 'end', iid=path, text=text, values=(
+            f"{record.total_bytes / 1024 / 1024:,.1f}", f"{record.total_files:,}", f"{share:.1f}%"))
+        if record.subdirs:
+            # Заглушка, чтобы у узла был значок раскрытия; дети подгружаются
+            # из индекса при открытии.
+            self.disk_tree.insert(path, 'end', iid=path + '\n...', text='...')
+
+    def fill_disk_node(self, path):
+        tree = self.disk_tree
+        record = self.disk_index.get(path)
+        tree.delete(*tree.get_children(path))
+        if record is None:
+            return
+        children = self.disk_index.children(path)
+        for child_path, child in children[:DISK_TREE_LIMIT]:
+            self.insert_disk_node(path, child_path, os.path.basename(child_path), child, record.total_bytes)
+        if len(children) > DISK_TREE_LIMIT:
+            tree.insert(path, 'end', iid=path + '\n...', text=f"... еще {len(children) - DISK_TREE_LIMIT} каталогов")
+
+    def on_disk_tree_open(self, event=None):
+        path = self.disk_tree.focus()
+        if path and self.disk_index is not None:
+            self.fill_disk_node(path)
+
+    def find_large_files(self):
+        # Повторное нажатие во время поиска останавливает его.
+        if self.large_file_scan is not None and self.large_file_scan.running:
+            self.large_file_scan.cancel()
+            return
+
+        self.start_result_block('large_files', "=== БОЛЬШИЕ ФАЙЛЫ (>100 MB) ===\n")
+
+        self.large_file_scan = LargeFileScanner(
+            scan_roots(), on_update=lambda stats, top: self.ui_queue.put(
+                'large_files', self.show_large_files, stats, top)
+        ).start()
+
+    def show_large_files(self, stats, top):
+        if stats.finished is None:
+            state = "идет поиск (нажмите еще раз, чтобы остановить)"
+        elif stats.cancelled:
+            state = "остановлено"
+        else:
+            state = "готово"
+        text = (f"{state}: {stats.dirs} каталогов, {stats.files} файлов, "
+                f"{stats.bytes / 1024 ** 3:.1f} GB, {stats.elapsed:.1f} с\n")
+        for size, path in top:
+            text += f"  {path} - {size // 1024 // 1024} MB\n"
+        if stats.finished is not None and not top:
+            text += "  Файлы больше 100 MB не найдены\n"
+
+        self.set_result_block('large_files', text)
+
+    def clear_history(self):
+        self.run_cleanup('history', "ИСТОРИЯ БРАУЗЕРОВ", history_locations(), match=is_history_file)
+
+    def update_all(self):
+        self.update_processes()
+        self.update_network_connections()
+        self.update_startup_programs()
+        self.status_var.set("✅ Все данные обновлены")
+
+    def show_resource(self, resource):
+        tabs = {
+            "CPU": 0,
+            "Memory": 0,
+            "Disk": 0,
+            "Network": 4
+        }
+
+        if resource in tabs:
+            notebook = self.root.winfo_children()[0].winfo_children()[0]
+            notebook.select(tabs[resource])
+
+    def show_about(self):
+        about_text = f"""
+        System Monitoring Tool v2.0
+
+        Тема: {'Темная' if self.theme_mode == 'dark' else 'Светлая'}
+        Стиль кнопок: {self.button_style}
+
+        Мощный мониторинг системы с современным интерфейсом
+        """
+        messagebox.showinfo("О программе", about_text)
+
+    def on_closing(self):
+        self.running = False
+        self.collector.stop(timeout=2)
+        if self.exporter is not None:
+            self.exporter.stop()
+        self.sensors.close()
+        if self.large_file_scan is not None:
+            self.large_file_scan.cancel()
+        self.disk_index_cancel.set()
+        for job in self.cleanup_jobs.values():
+            job.cancel()
+        self.ui_pump.stop()
+        if self.store is not None:
+            self.store.close()
+        self.root.destroy()
+
+
+def format_cgroup(stats):
+    def rate(value):
+        return '' if value is None else f"{value / 1024 / 1024:.2f}"
+
+    return (
+        '' if stats.cpu is None else f"{stats.cpu:.1f}",
+        '' if stats.memory is None else f"{stats.memory / 1024 / 1024:.1f}",
+        rate(stats.io_read),
+        rate(stats.io_write),
+        '' if stats.pids is None else stats.pids,
+    )
+
+
+def format_alerts(active):
+    if not active:
+        return ""
+    names = ', '.join(dict.fromkeys(state.rule.name for state in active))
+    return f" | ⚠ {names}"
+
+
+def format_disk_io(sample):
+    text = f"R {sample.get('io_read', 0.0):.1f} W {sample.get('io_write', 0.0):.1f} MB/s"
+    disks = sample.get('disks', {})
+    if disks:
+        name, rates = max(disks.items(), key=lambda item: item[1]['util'])
+        text += f" ({name} {rates['util']:.0f}%, {rates['latency']:.1f} мс)"
+    return text
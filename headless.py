@@ -0,0 +1,142 @@
+import json
+import signal
+import time
+from datetime import datetime
+from pathlib import Path
+
+from alerts import DEFAULT_RULES, AlertEngine, AlertNotifier, load_rules
+from collector import MetricsCollector, default_registry
+from export import export_connections, export_history, export_processes
+from network import ConnectionCollector
+from processes import ProcessCache, ProcessSnapshot
+from prometheus import MetricsExporter
+from storage import TimeSeriesStore
+
+# Режим без интерфейса и выгрузка истории: модуль не импортирует tkinter,
+# matplotlib и другие пакеты интерфейса, поэтому сборщик работает на
+# серверах без дисплея и без этих зависимостей.
+
+DEFAULT_HISTORY_DIR = "system_monitor_history"
+SETTINGS_FILE = "system_monitor_settings.json"
+NET_TOP_GROUPS = 200
+
+
+def format_status(sample):
+    return (
+        f"🟢 CPU: {sample.get('cpu', 0.0)}% | "
+        f"Память: {sample.get('mem', 0.0)}% | "
+        f"Диск: {sample.get('disk', 0.0)}% | "
+        f"I/O: {sample.get('io', 0.0):.1f} MB/s | "
+        f"Сеть: {format_network(sample)} | "
+        f"Температура: {format_temperature(sample)}"
+    )
+
+
+def format_network(sample):
+    text = f"↓ {sample.get('net_rx', 0.0):.2f} ↑ {sample.get('net_tx', 0.0):.2f} MB/s"
+    loaded = [(rates['util'], nic) for nic, rates in sample.get('nics', {}).items() if 'util' in rates]
+    if loaded:
+        util, nic = max(loaded)
+        text += f" ({nic} {util:.0f}%)"
+    return text
+
+
+def format_temperature(sample):
+    text = f"{sample.get('temp', 0)}°C"
+    if sample.get('gpu_temp') is not None:
+        text += f" (GPU {sample['gpu_temp']:.0f}°C)"
+    return text
+
+
+def open_store(directory, retention_days):
+    try:
+        return TimeSeriesStore(directory, retention_days=retention_days)
+    except OSError as e:
+        print(f"Не удалось открыть хранилище истории {directory}: {e}")
+        return None
+
+
+def read_settings(path=SETTINGS_FILE):
+    settings_file = Path(path)
+    if settings_file.exists():
+        try:
+            with open(settings_file, 'r') as f:
+                return json.load(f)
+        except:
+            return {}
+    return {}
+
+
+def start_exporter(host, port, top=10):
+    if not port:
+        return None
+    try:
+        exporter = MetricsExporter(host, port, top).start()
+    except OSError as e:
+        print(f"Не удалось запустить экспорт метрик на {host}:{port}: {e}")
+        return None
+    print(f"Метрики Prometheus: http://{host}:{exporter.address[1]}/metrics")
+    return exporter
+
+
+def run_headless(interval, store_dir=DEFAULT_HISTORY_DIR, retention_days=7, plugins=(), alerts=True,
+                 alert_hook=None, prometheus=None):
+    collector = MetricsCollector(interval=interval, registry=default_registry(plugins))
+    exporter = start_exporter(*prometheus) if prometheus is not None else None
+    if exporter is not None:
+        collector.subscribe(exporter.update)
+    if alerts:
+        # Правила и общий обработчик берутся из файла настроек, как в
+        # графическом режиме; события дополнительно печатаются в stdout.
+        settings = read_settings()
+        engine = AlertEngine(load_rules(settings.get('alert_rules', DEFAULT_RULES)))
+        engine.subscribe(AlertNotifier(alert_hook or settings.get('alert_hook'),
+                                       enabled=settings.get('notifications', True)))
+        engine.subscribe(lambda event: print(
+            f"{datetime.fromtimestamp(event.time).strftime('%Y-%m-%d %H:%M:%S')} {event.summary()}", flush=True))
+        collector.subscribe(engine.evaluate)
+    collector.subscribe(lambda sample: print(
+        f"{datetime.fromtimestamp(sample['time']).strftime('%Y-%m-%d %H:%M:%S')} {format_status(sample)}",
+        flush=True))
+    store = open_store(store_dir, retention_days) if store_dir else None
+    if store is not None:
+        collector.subscribe(store.append)
+    signal.signal(signal.SIGTERM, lambda signum, frame: collector.stop(timeout=2))
+    collector.start()
+
+    try:
+        while collector.running:
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        collector.stop(timeout=2)
+        if exporter is not None:
+            exporter.stop()
+        if store is not None:
+            store.close()
+
+
+def run_export(args):
+    fmt = args.format
+    compression = args.compress
+    end = time.time()
+    start = end - args.since * 3600 if args.since else None
+
+    if args.export_history:
+        store = TimeSeriesStore(args.store, retention_days=args.retention_days)
+        try:
+            rows = export_history(store, args.export_history, start, end, fmt, compression)
+        finally:
+            store.close()
+        print(f"История: {rows} записей -> {args.export_history}")
+
+    if args.export_processes:
+        snapshot = ProcessSnapshot.from_entries(ProcessCache().refresh())
+        rows = export_processes(snapshot, args.export_processes, fmt, compression)
+        print(f"Процессы: {rows} записей -> {args.export_processes}")
+
+    if args.export_connections:
+        _, _, groups = ConnectionCollector().collect(states=None, top=NET_TOP_GROUPS)
+        rows = export_connections(groups, args.export_connections, fmt, compression)
+        print(f"Соединения: {rows} групп -> {args.export_connections}")
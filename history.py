@@ -0,0 +1,303 @@
+import threading
+
+import numpy as np
+
+
+class RingBuffer:
+    # Каждое значение пишется дважды (в i и i + capacity), поэтому последние
+    # n значений всегда лежат подряд и отдаются как срез без копирования.
+    def __init__(self, capacity, dtype=np.float64):
+        if capacity <= 0:
+            raise ValueError("capacity должна быть положительной")
+        self.capacity = int(capacity)
+        self._data = np.zeros(self.capacity * 2, dtype=dtype)
+        self._head = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, value):
+        head = self._head
+        self._data[head] = value
+        self._data[head + self.capacity] = value
+        self._head = (head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self._data.dtype)
+        if len(values) > self.capacity:
+            values = values[-self.capacity:]
+        count = len(values)
+        if not count:
+            return
+
+        head = self._head
+        first = min(count, self.capacity - head)
+        for offset in (0, self.capacity):
+            self._data[offset + head:offset + head + first] = values[:first]
+            self._data[offset:offset + count - first] = values[first:]
+        self._head = (head + count) % self.capacity
+        self._size = min(self._size + count, self.capacity)
+
+    def view(self, n=None):
+        if n is None or n > self._size:
+            n = self._size
+        end = self._head + self.capacity
+        window = self._data[end - n:end]
+        window.flags.writeable = False
+        return window
+
+    def latest(self, default=None):
+        if not self._size:
+            return default
+        return self._data[self._head - 1 + self.capacity].item()
+
+    def clear(self):
+        self._head = 0
+        self._size = 0
+
+
+ROLLUP_TIERS = (
+    (10, 7 * 86400),
+    (60, 30 * 86400),
+    (3600, 365 * 86400),
+)
+
+
+class RollupTier:
+    # Агрегаты min/max/avg по корзинам длиной bucket секунд. Текущая
+    # корзина накапливается в массивах по всем метрикам сразу и попадает
+    # в кольцевые буферы, когда приходит отсчет из следующей корзины.
+    def __init__(self, metrics, bucket, capacity):
+        self.metrics = tuple(metrics)
+        self.bucket = bucket
+        self.times = RingBuffer(capacity)
+        self.min = {name: RingBuffer(capacity) for name in self.metrics}
+        self.max = {name: RingBuffer(capacity) for name in self.metrics}
+        self.avg = {name: RingBuffer(capacity) for name in self.metrics}
+        self._current = None
+        self._reset()
+
+    def __len__(self):
+        return len(self.times)
+
+    def _reset(self):
+        count = len(self.metrics)
+        self._min = np.full(count, np.nan)
+        self._max = np.full(count, np.nan)
+        self._sum = np.zeros(count)
+        self._count = np.zeros(count, dtype=np.int64)
+
+    def _close(self):
+        self.times.append(self._current * self.bucket)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            avg = np.where(self._count > 0, self._sum / np.maximum(self._count, 1), np.nan)
+        for i, name in enumerate(self.metrics):
+            self.min[name].append(self._min[i])
+            self.max[name].append(self._max[i])
+            self.avg[name].append(avg[i])
+        self._reset()
+
+    def add(self, timestamp, values):
+        index = int(timestamp // self.bucket)
+        if self._current is not None and index != self._current:
+            self._close()
+        self._current = index
+
+        finite = ~np.isnan(values)
+        np.fmin(self._min, values, out=self._min)
+        np.fmax(self._max, values, out=self._max)
+        self._sum += np.where(finite, values, 0.0)
+        self._count += finite
+
+    def extend(self, times, values):
+        if not len(times):
+            return
+        index = (times // self.bucket).astype(np.int64)
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(index)) + 1))
+
+        finite = ~np.isnan(values)
+        mins = np.fmin.reduceat(values, starts, axis=0)
+        maxs = np.fmax.reduceat(values, starts, axis=0)
+        sums = np.add.reduceat(np.where(finite, values, 0.0), starts, axis=0)
+        counts = np.add.reduceat(finite.astype(np.int64), starts, axis=0)
+
+        if self._current is not None and index[0] != self._current:
+            self._close()
+        self._current = int(index[0])
+        self._merge(mins[0], maxs[0], sums[0], counts[0])
+        if len(starts) == 1:
+            return
+        self._close()
+
+        middle = slice(1, len(starts) - 1)
+        if len(starts) > 2:
+            self.times.extend(index[starts[middle]] * self.bucket)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                avgs = np.where(counts[middle] > 0, sums[middle] / np.maximum(counts[middle], 1), np.nan)
+            for i, name in enumerate(self.metrics):
+                self.min[name].extend(mins[middle, i])
+                self.max[name].extend(maxs[middle, i])
+                self.avg[name].extend(avgs[:, i])
+
+        self._current = int(index[starts[-1]])
+        self._merge(mins[-1], maxs[-1], sums[-1], counts[-1])
+
+    def _merge(self, mins, maxs, sums, counts):
+        np.fmin(self._min, mins, out=self._min)
+        np.fmax(self._max, maxs, out=self._max)
+        self._sum += sums
+        self._count += counts
+
+    def window(self, name, kind='avg', n=None):
+        return getattr(self, kind)[name].view(n)
+
+
+def lttb(x, y, threshold):
+    # Largest-Triangle-Three-Buckets: оставляет threshold точек, сохраняя
+    # форму ряда (пики и провалы), в отличие от простого прореживания.
+    count = len(y)
+    if threshold >= count or threshold < 3:
+        return x, y
+
+    every = (count - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = count - 1
+    filled = np.where(np.isnan(y), 0.0, y)
+
+    # Границы корзин и средние по корзинам считаются сразу для всех
+    # корзин; в цикле остается только выбор точки с наибольшей площадью.
+    edges = np.minimum((np.arange(threshold) * every).astype(np.intp) + 1, count)
+    lengths = np.diff(edges)
+    starts = np.minimum(edges[:-1], count - 1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_x = np.add.reduceat(x, starts) / lengths
+        avg_y = np.add.reduceat(filled, starts) / lengths
+    empty = lengths == 0
+    avg_x[empty] = x[-1]
+    avg_y[empty] = filled[-1]
+
+    if every <= 32:
+        # Корзины из нескольких точек быстрее перебрать на списках, чем
+        # создавать на каждую корзину маленькие массивы NumPy.
+        return lttb_small(x, y, filled, edges, avg_x, avg_y, threshold)
+
+    a = 0
+    for i in range(threshold - 2):
+        start = edges[i]
+        end = edges[i + 1]
+        next_x = avg_x[i + 1]
+        next_y = avg_y[i + 1]
+        area = np.abs((x[a] - next_x) * (filled[start:end] - filled[a])
+                      - (x[a] - x[start:end]) * (next_y - filled[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return x[selected], y[selected]
+
+
+def lttb_small(x, y, filled, edges, avg_x, avg_y, threshold):
+    xs = x.tolist()
+    ys = filled.tolist()
+    next_xs = avg_x.tolist()
+    next_ys = avg_y.tolist()
+    bounds = edges.tolist()
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        xa = xs[a]
+        ya = ys[a]
+        dx = xa - next_xs[i + 1]
+        dy = next_ys[i + 1] - ya
+        best = -1.0
+        a = bounds[i]
+        for j in range(bounds[i], bounds[i + 1]):
+            area = abs(dx * (ys[j] - ya) - (xa - xs[j]) * dy)
+            if area > best:
+                best = area
+                a = j
+        selected.append(a)
+    selected.append(len(xs) - 1)
+    selected = np.array(selected, dtype=np.intp)
+    return x[selected], y[selected]
+
+
+class MetricHistory:
+    def __init__(self, metrics, capacity=86400, tiers=ROLLUP_TIERS):
+        self.metrics = tuple(metrics)
+        self.capacity = int(capacity)
+        self.lock = threading.RLock()
+        self.times = RingBuffer(self.capacity)
+        self.buffers = {name: RingBuffer(self.capacity) for name in self.metrics}
+        self.tiers = [RollupTier(self.metrics, bucket, max(int(span // bucket), 1))
+                      for bucket, span in tiers]
+
+    def __len__(self):
+        return len(self.times)
+
+    def __getitem__(self, name):
+        return self.buffers[name]
+
+    def append(self, sample):
+        values = np.array([np.nan if sample.get(name) is None else sample[name] for name in self.metrics],
+                          dtype=np.float64)
+        with self.lock:
+            self.times.append(sample['time'])
+            for i, buffer in enumerate(self.buffers.values()):
+                buffer.append(values[i])
+            for tier in self.tiers:
+                tier.add(sample['time'], values)
+
+    def backfill(self, columns):
+        times = np.asarray(columns.get('time', ()), dtype=np.float64)
+        if not len(times):
+            return
+        values = np.column_stack([
+            np.asarray(columns.get(name, np.full(len(times), np.nan)), dtype=np.float64)
+            for name in self.metrics
+        ])
+        with self.lock:
+            self.times.extend(times)
+            for i, buffer in enumerate(self.buffers.values()):
+                buffer.extend(values[:, i])
+            for tier in self.tiers:
+                tier.extend(times, values)
+
+    def window(self, name, n=None):
+        # Копия под блокировкой: поток сборщика дописывает буферы на месте,
+        # и представление без копии могло бы смешать данные разных тиков.
+        with self.lock:
+            return self.buffers[name].view(n).copy()
+
+    def time_window(self, n=None):
+        with self.lock:
+            return self.times.view(n).copy()
+
+    def range(self, start, end, max_points):
+        # Берется самый подробный уровень (сырые данные или агрегаты),
+        # который покрывает начало интервала и дает не больше 4 точек на
+        # пиксель; дальше ряд сжимается LTTB до max_points.
+        with self.lock:
+            sources = [(self.times, self.buffers)] + [(tier.times, tier.avg) for tier in self.tiers]
+            chosen = None
+            for times, buffers in sources:
+                stamps = times.view()
+                if not len(stamps):
+                    continue
+                low = np.searchsorted(stamps, start, side='left')
+                high = np.searchsorted(stamps, end, side='right')
+                chosen = (stamps, buffers, low, high)
+                if stamps[0] <= start and high - low <= max_points * 4:
+                    break
+
+            if chosen is None:
+                return {name: (np.empty(0), np.empty(0)) for name in self.metrics}
+
+            stamps, buffers, low, high = chosen
+            times = np.array(stamps[low:high])
+            data = {name: np.array(buffers[name].view()[low:high]) for name in self.metrics}
+
+        return {name: lttb(times, values, max_points) for name, values in data.items()}
@@ -0,0 +1,291 @@
+import heapq
+import os
+import socket
+import time
+
+import psutil
+
+COUNTER_FIELDS = (
+    ('rx_bytes', 'bytes_recv'),
+    ('tx_bytes', 'bytes_sent'),
+    ('rx_packets', 'packets_recv'),
+    ('tx_packets', 'packets_sent'),
+    ('rx_errors', 'errin'),
+    ('tx_errors', 'errout'),
+    ('rx_drops', 'dropin'),
+    ('tx_drops', 'dropout'),
+)
+
+
+def is_loopback(nic):
+    return nic == 'lo' or nic.lower().startswith('loopback')
+
+
+def counter_delta(current, previous):
+    # Переполнение счетчиков psutil уже учитывает (nowrap=True), поэтому
+    # уменьшение счетчика - это сброс (интерфейс пересоздан): за интервал
+    # берется значение, накопленное с начала нового счета.
+    if current >= previous:
+        return current - previous
+    return current
+
+
+class InterfaceRates:
+    # Скорости по каждому интерфейсу из разницы счетчиков между опросами
+    # (по монотонным часам). Новый интерфейс дает скорости со второго
+    # опроса, исчезнувший удаляется из состояния.
+    def __init__(self, counters=None):
+        self.counters = counters or (lambda: psutil.net_io_counters(pernic=True))
+        self.previous = {}
+        self.speeds = {}
+        self.rates = {}
+
+    def update_speeds(self):
+        try:
+            stats = psutil.net_if_stats()
+        except Exception:
+            stats = {}
+        self.speeds = {nic: st.speed for nic, st in stats.items() if st.speed}
+
+    def sample(self, now=None):
+        now = time.monotonic() if now is None else now
+        counters = self.counters()
+        if counters.keys() != self.previous.keys():
+            self.update_speeds()
+
+        current = {}
+        rates = {}
+        for nic, io in counters.items():
+            values = tuple(getattr(io, field) for _, field in COUNTER_FIELDS)
+            current[nic] = (now, values)
+            if nic not in self.previous:
+                continue
+
+            then, old = self.previous[nic]
+            elapsed = now - then
+            if elapsed <= 0:
+                continue
+            nic_rates = {name: counter_delta(new, prev) / elapsed
+                         for (name, _), new, prev in zip(COUNTER_FIELDS, values, old)}
+            speed = self.speeds.get(nic)
+            if speed:
+                # speed в Мбит/с; загрузка канала по более нагруженному направлению.
+                busiest = max(nic_rates['rx_bytes'], nic_rates['tx_bytes'])
+                nic_rates['util'] = min(busiest * 8 / (speed * 1_000_000) * 100, 100.0)
+            rates[nic] = nic_rates
+
+        self.previous = current
+        self.rates = rates
+        return rates
+
+    def totals(self):
+        rx = tx = 0.0
+        for nic, nic_rates in self.rates.items():
+            if not is_loopback(nic):
+                rx += nic_rates['rx_bytes']
+                tx += nic_rates['tx_bytes']
+        return rx, tx
+
+    def probe(self):
+        rates = self.sample()
+        rx, tx = self.totals()
+        return {
+            'net': (rx + tx) / 1024 / 1024,
+            'net_rx': rx / 1024 / 1024,
+            'net_tx': tx / 1024 / 1024,
+            'nics': rates,
+        }
+
+
+TCP_STATES = {
+    '01': 'ESTABLISHED',
+    '02': 'SYN_SENT',
+    '03': 'SYN_RECV',
+    '04': 'FIN_WAIT1',
+    '05': 'FIN_WAIT2',
+    '06': 'TIME_WAIT',
+    '07': 'CLOSE',
+    '08': 'CLOSE_WAIT',
+    '09': 'LAST_ACK',
+    '0A': 'LISTEN',
+    '0B': 'CLOSING',
+}
+STATE_CODES = {name: code for code, name in TCP_STATES.items()}
+PROC_TCP = ('/proc/net/tcp', '/proc/net/tcp6')
+GROUPINGS = ('host', 'process', 'host_process')
+
+
+def decode_address(address):
+    # В /proc/net/tcp* адрес записан 32-битными словами в порядке байт
+    # хоста (little-endian на x86/ARM).
+    raw = bytes.fromhex(address)
+    words = b''.join(raw[i:i + 4][::-1] for i in range(0, len(raw), 4))
+    family = socket.AF_INET if len(words) == 4 else socket.AF_INET6
+    return socket.inet_ntop(family, words)
+
+
+def iter_proc_connections(states=None, port=None, paths=PROC_TCP):
+    # Файлы читаются построчно; состояние и порт сравниваются по сырым
+    # полям до какого-либо разбора адресов.
+    codes = {STATE_CODES[state] for state in states} if states else None
+    port_hex = f"{port:04X}" if port is not None else None
+    for path in paths:
+        try:
+            with open(path) as f:
+                next(f, None)
+                for line in f:
+                    fields = line.split(None, 10)
+                    if len(fields) < 10:
+                        continue
+                    if codes is not None and fields[3] not in codes:
+                        continue
+                    local, remote = fields[1], fields[2]
+                    if port_hex is not None and local[-4:] != port_hex and remote[-4:] != port_hex:
+                        continue
+                    yield local, remote, fields[3], int(fields[9])
+        except OSError:
+            continue
+
+
+def socket_owners(inodes):
+    # Владелец сокета ищется по ссылкам socket:[inode] в /proc/<pid>/fd;
+    # обход заканчивается, как только найдены все нужные inode.
+    owners = {}
+    wanted = set(inodes)
+    try:
+        pids = [entry.name for entry in os.scandir('/proc') if entry.name.isdigit()]
+    except OSError:
+        return owners
+
+    for pid in pids:
+        try:
+            with os.scandir(f"/proc/{pid}/fd") as fds:
+                for fd in fds:
+                    try:
+                        target = os.readlink(fd.path)
+                    except OSError:
+                        continue
+                    if target.startswith('socket:['):
+                        inode = int(target[8:-1])
+                        if inode in wanted:
+                            owners[inode] = int(pid)
+                            wanted.discard(inode)
+        except OSError:
+            continue
+        if not wanted:
+            break
+    return owners
+
+
+def service_port(local_port, remote_port):
+    # Из двух портов соединения меньший обычно порт сервиса, больший -
+    # эфемерный порт клиента; у LISTEN удаленного порта нет.
+    if not remote_port:
+        return local_port
+    return min(local_port, remote_port)
+
+
+def process_name(pid):
+    if pid is None:
+        return "?"
+    try:
+        return f"{psutil.Process(pid).name()} ({pid})"
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return f"? ({pid})"
+
+
+class ConnectionGroup:
+    __slots__ = ('count', 'ports', 'states')
+
+    def __init__(self):
+        self.count = 0
+        self.ports = {}
+        self.states = {}
+
+    def add(self, port, state):
+        self.count += 1
+        self.ports[port] = self.ports.get(port, 0) + 1
+        self.states[state] = self.states.get(state, 0) + 1
+
+    def top_ports(self, n=5):
+        return ', '.join(str(port) for port, _ in
+                         sorted(self.ports.items(), key=lambda item: item[1], reverse=True)[:n])
+
+    def state_summary(self):
+        return ', '.join(f"{state} {count}" for state, count in
+                         sorted(self.states.items(), key=lambda item: item[1], reverse=True))
+
+
+class ConnectionCollector:
+    # TCP-соединения, сгруппированные по удаленному хосту, процессу или
+    # их паре. На Linux данные читаются из /proc/net/tcp* без создания
+    # объектов на каждое соединение; на остальных системах используется
+    # psutil.net_connections('tcp').
+    def __init__(self, proc_paths=PROC_TCP):
+        self.proc_paths = proc_paths
+        self.use_proc = os.path.exists(proc_paths[0])
+
+    def iter_connections(self, states=None, port=None):
+        if self.use_proc:
+            for local, remote, state, inode in iter_proc_connections(states, port, self.proc_paths):
+                port_used = service_port(int(local[-4:], 16), int(remote[-4:], 16))
+                yield remote[:-5], port_used, TCP_STATES.get(state, state), inode, None
+            return
+
+        wanted = set(states) if states else None
+        for conn in psutil.net_connections('tcp'):
+            if wanted is not None and conn.status not in wanted:
+                continue
+            remote_port = conn.raddr.port if conn.raddr else 0
+            if port is not None and conn.laddr.port != port and remote_port != port:
+                continue
+            yield (conn.raddr.ip if conn.raddr else '', service_port(conn.laddr.port, remote_port),
+                   conn.status, None, conn.pid)
+
+    def collect(self, group='host', states=('ESTABLISHED',), port=None, top=200):
+        by_process = group in ('process', 'host_process')
+        groups = {}
+        pending = []
+        total = 0
+
+        for host, conn_port, state, inode, pid in self.iter_connections(states, port):
+            total += 1
+            if by_process and pid is None:
+                # Владельцев по inode ищем одним проходом по /proc после
+                # разбора таблицы.
+                pending.append((host, conn_port, state, inode))
+                continue
+            key = host if group == 'host' else pid if group == 'process' else (host, pid)
+            groups.setdefault(key, ConnectionGroup()).add(conn_port, state)
+
+        if pending:
+            owners = socket_owners(inode for _, _, _, inode in pending)
+            for host, conn_port, state, inode in pending:
+                pid = owners.get(inode)
+                key = pid if group == 'process' else (host, pid)
+                groups.setdefault(key, ConnectionGroup()).add(conn_port, state)
+
+        ranked = heapq.nlargest(top, groups.items(), key=lambda item: item[1].count)
+        names = {}
+        rows = []
+        for key, stats in ranked:
+            host, pid = (key, None) if group == 'host' else (None, key) if group == 'process' else key
+            label = []
+            if group != 'process':
+                label.append(self.host_label(host))
+            if group != 'host':
+                if pid not in names:
+                    names[pid] = process_name(pid)
+                label.append(names[pid])
+            rows.append((key, ' - '.join(label), stats.count, stats.top_ports(), stats.state_summary()))
+        return total, len(groups), rows
+
+    def host_label(self, host):
+        if not host:
+            return "N/A"
+        if not self.use_proc:
+            return host
+        try:
+            return decode_address(host)
+        except ValueError:
+            return host
@@ -0,0 +1,320 @@
+import threading
+import time
+
+import numpy as np
+import psutil
+
+from procfs import ProcfsReader, procfs_available
+from search import ProcessSearch
+
+PROCESS_GONE = (psutil.NoSuchProcess, psutil.ZombieProcess)
+# Допуск при сравнении времени запуска: /proc и psutil считают его из
+# одних счетчиков, но с разным округлением.
+CREATE_TIME_TOLERANCE = 0.1
+
+
+class ProcessEntry:
+    __slots__ = ('_proc', 'pid', 'create_time', 'name', 'username', 'cmdline', 'status',
+                 'memory_rss', 'cpu_total', 'cpu_percent', 'sampled_at')
+
+    def __init__(self, pid, create_time, proc=None):
+        self._proc = proc
+        self.pid = pid
+        self.create_time = create_time
+        self.name = ''
+        self.username = 'N/A'
+        self.cmdline = ''
+        self.status = ''
+        self.memory_rss = 0
+        self.cpu_total = None
+        self.cpu_percent = 0.0
+        self.sampled_at = None
+
+    @property
+    def proc(self):
+        # При чтении через /proc объект psutil создается только по запросу
+        # (детали процесса, завершение). Если PID уже занят другим
+        # процессом, время запуска не совпадет - это NoSuchProcess.
+        if self._proc is None:
+            proc = psutil.Process(self.pid)
+            if abs(proc.create_time() - self.create_time) > CREATE_TIME_TOLERANCE:
+                raise psutil.NoSuchProcess(self.pid, self.name)
+            self._proc = proc
+        return self._proc
+
+    @property
+    def key(self):
+        return (self.pid, self.create_time)
+
+
+class ProcessCache:
+    # Долгоживущий кэш psutil.Process, ключ - (pid, create_time). Между
+    # проходами хранится суммарное время CPU каждого процесса, поэтому
+    # CPU% считается по разнице, а не возвращает 0.0 при первом чтении.
+    # На Linux процессы читаются напрямую из /proc (ProcfsReader), psutil
+    # используется на остальных системах.
+    def __init__(self, use_procfs=None):
+        self.entries = {}
+        self.lock = threading.Lock()
+        self._by_pid = {}
+        if use_procfs is None:
+            use_procfs = procfs_available()
+        self.procfs = ProcfsReader() if use_procfs else None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, pid):
+        return self._by_pid.get(pid)
+
+    def _add(self, pid):
+        proc = psutil.Process(pid)
+        with proc.oneshot():
+            entry = ProcessEntry(pid, proc.create_time(), proc)
+            try:
+                entry.name = proc.name()
+            except psutil.AccessDenied:
+                entry.name = 'N/A'
+            try:
+                entry.username = proc.username() or 'N/A'
+            except (psutil.AccessDenied, KeyError):
+                entry.username = 'N/A'
+            try:
+                entry.cmdline = ' '.join(proc.cmdline())
+            except psutil.AccessDenied:
+                entry.cmdline = ''
+        return entry
+
+    def _sample(self, entry, now, wall_now):
+        proc = entry.proc
+        with proc.oneshot():
+            try:
+                cpu_times = proc.cpu_times()
+                cpu_total = cpu_times.user + cpu_times.system
+            except psutil.AccessDenied:
+                cpu_total = None
+            try:
+                entry.memory_rss = proc.memory_info().rss
+            except psutil.AccessDenied:
+                entry.memory_rss = 0
+            entry.status = proc.status()
+
+        self._update_cpu(entry, cpu_total, now, wall_now)
+
+    @staticmethod
+    def _update_cpu(entry, cpu_total, now, wall_now):
+        if cpu_total is None:
+            entry.cpu_percent = 0.0
+        elif entry.cpu_total is not None and now > entry.sampled_at:
+            entry.cpu_percent = max(cpu_total - entry.cpu_total, 0.0) / (now - entry.sampled_at) * 100
+        else:
+            lifetime = wall_now - entry.create_time
+            entry.cpu_percent = cpu_total / lifetime * 100 if lifetime > 0 else 0.0
+
+        entry.cpu_total = cpu_total
+        entry.sampled_at = now
+
+    def refresh(self):
+        with self.lock:
+            now = time.monotonic()
+            wall_now = time.time()
+            if self.procfs is not None:
+                by_pid = self._refresh_procfs(now, wall_now)
+            else:
+                by_pid = self._refresh_psutil(now, wall_now)
+
+            self._by_pid = by_pid
+            self.entries = {entry.key: entry for entry in by_pid.values()}
+            return list(self.entries.values())
+
+    def _refresh_procfs(self, now, wall_now):
+        reader = self.procfs
+        records = reader.sweep()
+        previous = self._by_pid
+        boot_time = reader.boot_time
+        clock_ticks = reader.clock_ticks
+        page_size = reader.page_size
+        update_cpu = self._update_cpu
+        by_pid = {}
+        for pid, start, ticks, rss, state, comm in zip(records.pid, records.start, records.ticks,
+                                                        records.rss, records.state, records.comm):
+            entry = previous.get(pid)
+            create_time = boot_time + start / clock_ticks
+            # Повторно использованный PID узнается по другому времени запуска.
+            if entry is None or abs(entry.create_time - create_time) > CREATE_TIME_TOLERANCE:
+                entry = ProcessEntry(pid, create_time)
+                cmdline = reader.cmdline(pid)
+                entry.name = reader.full_name(comm, cmdline)
+                entry.username = reader.username(pid)
+                entry.cmdline = ' '.join(cmdline)
+            entry.status = reader.status(state)
+            entry.memory_rss = rss * page_size
+            update_cpu(entry, ticks / clock_ticks, now, wall_now)
+            by_pid[pid] = entry
+        return by_pid
+
+    def _refresh_psutil(self, now, wall_now):
+        by_pid = {}
+        for pid in psutil.pids():
+            entry = self._by_pid.get(pid)
+            try:
+                if entry is not None and not entry.proc.is_running():
+                    entry = None
+                if entry is None:
+                    entry = self._add(pid)
+                self._sample(entry, now, wall_now)
+            except PROCESS_GONE:
+                continue
+            except psutil.Error:
+                continue
+            by_pid[pid] = entry
+        return by_pid
+
+
+TEXT_COLUMNS = ('name', 'status', 'user', 'cmdline')
+
+
+class ProcessSnapshot:
+    # Снимок процессов в колоночном виде. Для текстовых колонок сразу
+    # готовятся строки в нижнем регистре, отсортированный словарь значений
+    # (vocab) и номер значения в нем для каждой строки (sort_keys) - это
+    # одновременно ключ сортировки и индекс для поиска по префиксу.
+    __slots__ = ('keys', 'pid', 'name', 'cpu', 'memory', 'status', 'user', 'cmdline',
+                 'lower', 'vocab', 'sort_keys')
+
+    def __init__(self, keys, pid, name, cpu, memory, status, user, cmdline=None):
+        self.keys = keys
+        self.pid = pid
+        self.name = name
+        self.cpu = cpu
+        self.memory = memory
+        self.status = status
+        self.user = user
+        self.cmdline = cmdline if cmdline is not None else [''] * len(keys)
+        self.lower = {}
+        self.vocab = {}
+        self.sort_keys = {'pid': pid, 'cpu': cpu, 'memory': memory}
+        for column in TEXT_COLUMNS:
+            lowered = [str(value).lower() for value in getattr(self, column)]
+            self.lower[column] = lowered
+            if lowered:
+                vocab, codes = np.unique(np.array(lowered), return_inverse=True)
+            else:
+                vocab, codes = np.empty(0, str), np.empty(0, np.int64)
+            self.vocab[column] = vocab
+            self.sort_keys[column] = codes.astype(np.int64).ravel()
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def empty(cls):
+        return cls([], np.empty(0, np.int64), [], np.empty(0), np.empty(0), [], [])
+
+    @classmethod
+    def from_entries(cls, entries):
+        count = len(entries)
+        return cls(
+            [entry.key for entry in entries],
+            np.fromiter((entry.pid for entry in entries), np.int64, count),
+            [entry.name for entry in entries],
+            np.fromiter((entry.cpu_percent for entry in entries), np.float64, count),
+            np.fromiter((entry.memory_rss for entry in entries), np.float64, count) / 1024 / 1024,
+            [entry.status for entry in entries],
+            [entry.username for entry in entries],
+            [entry.cmdline for entry in entries]
+        )
+
+
+class ProcessTableModel:
+    # Колоночная модель для виртуальной таблицы процессов: данные хранятся
+    # массивами, а видимый порядок строк (после фильтра и сортировки) -
+    # отдельным массивом индексов. Строки форматируются только по запросу.
+    # Сортировка идет по заранее посчитанным ключам снимка (для текстовых
+    # колонок - номер строки в отсортированном словаре) через np.lexsort.
+    COLUMNS = ('pid', 'name', 'cpu', 'memory', 'status', 'user')
+    MAX_SORT_COLUMNS = 3
+
+    def __init__(self, sort_order=None):
+        self.snapshot = ProcessSnapshot.empty()
+        self.order = np.empty(0, np.intp)
+        self.sort_order = []
+        self.filter_text = ''
+        self.search = ProcessSearch()
+        self._positions = None
+        for column, reverse in sort_order or ():
+            if column in self.COLUMNS:
+                self.sort_order.append((column, bool(reverse)))
+
+    def __len__(self):
+        return len(self.order)
+
+    def load(self, snapshot):
+        self.snapshot = snapshot
+        self.rebuild()
+
+    def set_filter(self, text):
+        self.filter_text = text.strip()
+        self.rebuild()
+
+    def sort(self, column, reverse=False, append=False):
+        order = [(c, r) for c, r in self.sort_order if c != column] if append else []
+        order.append((column, reverse))
+        self.sort_order = order[-self.MAX_SORT_COLUMNS:]
+        self.rebuild()
+
+    def toggle_sort(self, column, append=False):
+        current = dict(self.sort_order)
+        if column in current and (append or self.sort_order[0][0] == column):
+            reverse = not current[column]
+            if append:
+                self.sort_order = [(c, reverse if c == column else r) for c, r in self.sort_order]
+                self.rebuild()
+                return
+        else:
+            reverse = False
+        self.sort(column, reverse, append)
+
+    def sort_direction(self, column):
+        for priority, (sort_column, reverse) in enumerate(self.sort_order):
+            if sort_column == column:
+                return priority, reverse
+        return None
+
+    def filtered_rows(self):
+        return self.search.match(self.snapshot, self.filter_text)
+
+    def rebuild(self):
+        rows = self.filtered_rows()
+
+        if self.sort_order and len(rows):
+            sort_keys = self.snapshot.sort_keys
+            keys = [sort_keys['pid'][rows]]
+            for column, reverse in reversed(self.sort_order):
+                key = sort_keys[column][rows]
+                keys.append(-key if reverse else key)
+            rows = rows[np.lexsort(keys)]
+
+        self.order = rows
+        self._positions = None
+
+    def key(self, index):
+        return self.snapshot.keys[self.order[index]]
+
+    def position(self, key):
+        if self._positions is None:
+            keys = self.snapshot.keys
+            self._positions = {keys[row]: index for index, row in enumerate(self.order)}
+        return self._positions.get(key)
+
+    def row(self, index):
+        snapshot = self.snapshot
+        i = self.order[index]
+        return (
+            int(snapshot.pid[i]),
+            snapshot.name[i],
+            f"{snapshot.cpu[i]:.1f}",
+            f"{snapshot.memory[i]:.1f}",
+            snapshot.status[i],
+            snapshot.user[i]
+        )
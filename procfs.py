@@ -0,0 +1,153 @@
+import os
+import sys
+from array import array
+
+import psutil
+
+try:
+    import pwd
+except ImportError:
+    pwd = None
+
+PROC = '/proc'
+# Те же названия, что у psutil.STATUS_*.
+STATUS_NAMES = {
+    b'R': 'running',
+    b'S': 'sleeping',
+    b'D': 'disk-sleep',
+    b'Z': 'zombie',
+    b'T': 'stopped',
+    b't': 'tracing-stop',
+    b'X': 'dead',
+    b'x': 'dead',
+    b'I': 'idle',
+    b'W': 'waking',
+    b'P': 'parked',
+    b'K': 'wake-kill',
+}
+BUFFER_SIZE = 4096
+
+
+def procfs_available():
+    return sys.platform.startswith('linux') and os.path.exists(f"{PROC}/self/stat")
+
+
+class ProcStatRecords:
+    # Результат одного прохода по /proc в колоночном виде: массивы array
+    # переиспользуются между проходами и не создают объекты на процесс.
+    def __init__(self):
+        self.pid = array('q')
+        self.start = array('q')
+        self.ticks = array('q')
+        self.rss = array('q')
+        self.state = []
+        self.comm = []
+
+    def __len__(self):
+        return len(self.pid)
+
+    def clear(self):
+        for column in (self.pid, self.start, self.ticks, self.rss):
+            del column[:]
+        self.state.clear()
+        self.comm.clear()
+
+
+class ProcfsReader:
+    # Чтение /proc/<pid>/stat за один проход по каталогу /proc в общий
+    # буфер. В stat уже есть состояние, время CPU, время запуска и RSS;
+    # status (владелец) и cmdline читаются только для новых процессов.
+    def __init__(self, root=PROC):
+        self.root = root
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+        self.page_size = os.sysconf('SC_PAGE_SIZE')
+        self.boot_time = psutil.boot_time()
+        self.records = ProcStatRecords()
+        self._buffer = bytearray(BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        self._users = {}
+
+    def read_file(self, path):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.readv(fd, [self._buffer])
+        finally:
+            os.close(fd)
+        return self._view[:size].tobytes()
+
+    def sweep(self):
+        records = self.records
+        records.clear()
+        pids, starts, ticks, rss = records.pid, records.start, records.ticks, records.rss
+        states, comms = records.state, records.comm
+        buffer, view = self._buffer, self._view
+        # Пути открываются относительно дескриптора /proc, без разбора
+        # полного пути ядром для каждого файла.
+        root_fd = os.open(self.root, os.O_RDONLY)
+        try:
+            for name in os.listdir(root_fd):
+                if not name.isdigit():
+                    continue
+                try:
+                    fd = os.open(name + '/stat', os.O_RDONLY, dir_fd=root_fd)
+                    try:
+                        size = os.readv(fd, [buffer])
+                    finally:
+                        os.close(fd)
+                except OSError:
+                    continue
+
+                # Имя процесса в скобках может содержать пробелы и скобки,
+                # поэтому поля разбираются после последней ')'. Имя и
+                # состояние остаются байтами - декодируются по требованию.
+                data = view[:size].tobytes()
+                close = data.rfind(b')')
+                fields = data[close + 2:].split(None, 23)
+                pids.append(int(name))
+                comms.append(data[data.find(b'(') + 1:close])
+                states.append(fields[0])
+                ticks.append(int(fields[11]) + int(fields[12]))
+                starts.append(int(fields[19]))
+                rss.append(int(fields[21]))
+        finally:
+            os.close(root_fd)
+        return records
+
+    def username(self, pid):
+        try:
+            data = self.read_file(f"{self.root}/{pid}/status")
+        except OSError:
+            return 'N/A'
+        start = data.find(b'\nUid:')
+        if start < 0:
+            return 'N/A'
+        uid = int(data[start + 5:data.find(b'\n', start + 1)].split()[0])
+        if uid not in self._users:
+            try:
+                self._users[uid] = pwd.getpwuid(uid).pw_name
+            except (KeyError, AttributeError):
+                self._users[uid] = str(uid)
+        return self._users[uid]
+
+    def cmdline(self, pid):
+        try:
+            with open(f"{self.root}/{pid}/cmdline", 'rb') as f:
+                data = f.read()
+        except OSError:
+            return []
+        return [part.decode('utf-8', 'replace') for part in data.rstrip(b'\0').split(b'\0') if part]
+
+    @staticmethod
+    def full_name(comm, cmdline):
+        # comm обрезается ядром до 15 символов; полное имя берется из
+        # cmdline, как это делает psutil.
+        comm = comm.decode('utf-8', 'replace')
+        if len(comm) >= 15 and cmdline:
+            exe = os.path.basename(cmdline[0])
+            if exe.startswith(comm):
+                return exe
+        return comm
+
+    @staticmethod
+    def status(state):
+        return STATUS_NAMES.get(state) or state.decode()
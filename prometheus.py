@@ -0,0 +1,261 @@
+import gzip
+import heapq
+import math
+import numbers
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from processes import ProcessCache
+
+PREFIX = 'system_monitor'
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+DEFAULT_PORT = 9105
+MB = 1024 * 1024
+
+# Поля показания верхнего уровня: (поле, метрика, множитель, описание).
+# Суммарные скорости (net, io) не публикуются - их дает sum() по
+# интерфейсам и дискам.
+SAMPLE_GAUGES = (
+    ('cpu', 'cpu_usage_percent', 1, "Загрузка CPU, %"),
+    ('mem', 'memory_usage_percent', 1, "Использование памяти, %"),
+    ('disk', 'disk_usage_percent', 1, "Заполнение корневого раздела, %"),
+    ('temp', 'cpu_temperature_celsius', 1, "Температура процессора, °C"),
+)
+SAMPLE_FIELDS = {field for field, _, _, _ in SAMPLE_GAUGES}
+SKIPPED_FIELDS = {'time', 'net', 'net_rx', 'net_tx', 'io', 'io_read', 'io_write', 'io_util', 'gpu_temp',
+                  'nics', 'disks', 'sensors', 'gpus'}
+NIC_GAUGES = (
+    ('rx_bytes', 'network_receive_bytes_per_second', 1, "Скорость приема, байт/с"),
+    ('tx_bytes', 'network_transmit_bytes_per_second', 1, "Скорость передачи, байт/с"),
+    ('rx_packets', 'network_receive_packets_per_second', 1, "Принято пакетов в секунду"),
+    ('tx_packets', 'network_transmit_packets_per_second', 1, "Отправлено пакетов в секунду"),
+    ('rx_errors', 'network_receive_errors_per_second', 1, "Ошибок приема в секунду"),
+    ('tx_errors', 'network_transmit_errors_per_second', 1, "Ошибок передачи в секунду"),
+    ('rx_drops', 'network_receive_drops_per_second', 1, "Отброшено входящих пакетов в секунду"),
+    ('tx_drops', 'network_transmit_drops_per_second', 1, "Отброшено исходящих пакетов в секунду"),
+    ('util', 'network_utilization_percent', 1, "Загрузка канала, %"),
+)
+DISK_GAUGES = (
+    ('read_iops', 'disk_read_iops', 1, "Операций чтения в секунду"),
+    ('write_iops', 'disk_write_iops', 1, "Операций записи в секунду"),
+    ('read_mb', 'disk_read_bytes_per_second', MB, "Скорость чтения, байт/с"),
+    ('write_mb', 'disk_write_bytes_per_second', MB, "Скорость записи, байт/с"),
+    ('latency', 'disk_io_latency_seconds', 0.001, "Средняя задержка операции, с"),
+    ('util', 'disk_utilization_percent', 1, "Загрузка устройства, %"),
+)
+
+
+def metric_name(name):
+    name = re.sub(r'[^a-zA-Z0-9_:]', '_', name)
+    return '_' + name if name[:1].isdigit() else name
+
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{escape_label(value)}"' for key, value in labels) + '}'
+
+
+def format_value(value):
+    if isinstance(value, numbers.Integral):
+        return str(int(value))
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+
+def is_number(value):
+    # numbers.Real включает и числа NumPy (np.int64, np.float32) из плагинов.
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+def accepts_encoding(header, encoding):
+    # Accept-Encoding: "gzip;q=0.5, br"; q=0 означает отказ от кодировки,
+    # явно названная кодировка важнее "*".
+    qualities = {}
+    for item in header.split(','):
+        name, _, params = item.strip().partition(';')
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+    return qualities.get(encoding, qualities.get('*', 0.0)) > 0
+
+
+class ExpositionBuilder:
+    def __init__(self):
+        self.lines = []
+
+    def family(self, name, help_text, samples):
+        # samples - пары (метки, значение); семейство без значений не пишется.
+        samples = [(labels, value) for labels, value in samples if is_number(value)]
+        if not samples:
+            return
+        full = f"{PREFIX}_{name}"
+        self.lines.append(f"# HELP {full} {help_text}")
+        self.lines.append(f"# TYPE {full} gauge")
+        for labels, value in samples:
+            self.lines.append(f"{full}{format_labels(labels)} {format_value(value)}")
+
+    def render(self):
+        return ('\n'.join(self.lines) + '\n').encode('utf-8') if self.lines else b''
+
+
+def render_metrics(sample, processes=(), top=10):
+    # Текст в формате Prometheus text exposition 0.0.4: последнее
+    # показание, скорости по интерфейсам и дискам, датчики и top-N
+    # процессов по CPU и по памяти.
+    builder = ExpositionBuilder()
+    if 'time' in sample:
+        builder.family('last_sample_timestamp_seconds', "Время последнего показания (Unix)",
+                       [((), sample['time'])])
+    for field, name, scale, help_text in SAMPLE_GAUGES:
+        # Без датчиков SensorReader.probe отдает temp=0 - это не показание.
+        if field == 'temp' and not sample.get('sensors'):
+            continue
+        if is_number(sample.get(field)):
+            builder.family(name, help_text, [((), sample[field] * scale)])
+
+    nics = sample.get('nics') or {}
+    for field, name, scale, help_text in NIC_GAUGES:
+        builder.family(name, help_text, [((('nic', nic),), rates[field] * scale)
+                                         for nic, rates in nics.items() if field in rates])
+    disks = sample.get('disks') or {}
+    for field, name, scale, help_text in DISK_GAUGES:
+        builder.family(name, help_text, [((('device', disk),), rates[field] * scale)
+                                         for disk, rates in disks.items() if field in rates])
+    builder.family('temperature_celsius', "Показания датчиков температуры, °C",
+                   [((('sensor', sensor),), value) for sensor, value in (sample.get('sensors') or {}).items()])
+    builder.family('gpu_temperature_celsius', "Температура GPU, °C",
+                   [((('gpu', gpu),), value) for gpu, value in (sample.get('gpus') or {}).items()])
+
+    # Поля датчиков из плагинов публикуются под своими именами.
+    for field, value in sample.items():
+        if field not in SKIPPED_FIELDS and field not in SAMPLE_FIELDS and is_number(value):
+            builder.family(metric_name(field), f"Датчик {field}", [((), value)])
+
+    if processes and top:
+        by_cpu = heapq.nlargest(top, processes, key=lambda entry: entry.cpu_percent)
+        by_memory = heapq.nlargest(top, processes, key=lambda entry: entry.memory_rss)
+        selected = list({entry.pid: entry for entry in by_cpu + by_memory}.values())
+        labels = [(('pid', entry.pid), ('name', entry.name), ('user', entry.username)) for entry in selected]
+        builder.family('process_cpu_percent', f"Загрузка CPU процессом, % (top {top} по CPU и памяти)",
+                       [(label, entry.cpu_percent) for label, entry in zip(labels, selected)])
+        builder.family('process_resident_memory_bytes', f"Резидентная память процесса, байт (top {top} по CPU и памяти)",
+                       [(label, entry.memory_rss) for label, entry in zip(labels, selected)])
+    return builder.render()
+
+
+class ExporterHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    exporter = None
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def respond(self, send_body):
+        path = self.path.split('?', 1)[0]
+        if path == '/metrics':
+            accepts_gzip = accepts_encoding(self.headers.get('Accept-Encoding', ''), 'gzip')
+            body, encoding = self.exporter.payload(accepts_gzip)
+            content_type = CONTENT_TYPE
+        elif path == '/':
+            body, encoding = b'<html><body><a href="/metrics">/metrics</a></body></html>\n', None
+            content_type = 'text/html; charset=utf-8'
+        else:
+            body, encoding = b'Not Found\n', None
+            content_type = 'text/plain; charset=utf-8'
+
+        self.send_response(200 if path in ('/', '/metrics') else 404)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsExporter:
+    # HTTP-эндпоинт /metrics для Prometheus. Текст ответа формируется один
+    # раз на тике сборщика (update подписан на MetricsCollector), запросы
+    # только отдают готовые байты, поэтому частота и число опросов не
+    # влияют на нагрузку. Сжатая копия готовится на тике, только если
+    # клиенты запрашивают gzip. Процессы для top-N читаются собственным
+    # ProcessCache не чаще process_interval секунд.
+    def __init__(self, host='127.0.0.1', port=DEFAULT_PORT, top=10, process_interval=5.0):
+        self.host = host
+        self.port = port
+        self.top = top
+        self.process_interval = process_interval
+        self.processes = ProcessCache() if top else None
+        self.process_entries = []
+        self.processes_at = None
+        self.server = None
+        self.thread = None
+        self.gzip_wanted = False
+        self._payload = (b'', None)
+        self._lock = threading.Lock()
+
+    @property
+    def address(self):
+        return self.server.server_address if self.server is not None else (self.host, self.port)
+
+    def start(self):
+        handler = type('Handler', (ExporterHandler,), {'exporter': self})
+        self.server = ThreadingHTTPServer((self.host, self.port), handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def update(self, sample):
+        now = time.monotonic()
+        if self.processes is not None and (self.processes_at is None or
+                                           now - self.processes_at >= self.process_interval):
+            try:
+                self.process_entries = self.processes.refresh()
+            except Exception as e:
+                print(f"Ошибка чтения процессов для экспорта: {e}")
+            self.processes_at = now
+
+        body = render_metrics(sample, self.process_entries, self.top)
+        compressed = gzip.compress(body, compresslevel=5) if self.gzip_wanted else None
+        with self._lock:
+            self._payload = (body, compressed)
+
+    def payload(self, accepts_gzip=False):
+        with self._lock:
+            body, compressed = self._payload
+        if accepts_gzip:
+            if compressed is not None:
+                return compressed, 'gzip'
+            # Первый такой запрос получает несжатый ответ, со следующего
+            # тика готовится и сжатая копия.
+            self.gzip_wanted = True
+        return body, None
@@ -0,0 +1,182 @@
+import heapq
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+
+import psutil
+
+
+def scan_roots():
+    roots = []
+    for part in psutil.disk_partitions():
+        if os.name == 'nt' and ('cdrom' in part.opts or not part.fstype):
+            continue
+        if part.mountpoint not in roots:
+            roots.append(part.mountpoint)
+    return roots
+
+
+class ScanStats:
+    __slots__ = ('dirs', 'files', 'bytes', 'errors', 'started', 'finished', 'cancelled')
+
+    def __init__(self):
+        self.dirs = 0
+        self.files = 0
+        self.bytes = 0
+        self.errors = 0
+        self.started = time.monotonic()
+        self.finished = None
+        self.cancelled = False
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.monotonic()) - self.started
+
+    def copy(self):
+        stats = ScanStats()
+        for name in self.__slots__:
+            setattr(stats, name, getattr(self, name))
+        return stats
+
+
+class ParallelWalker(ABC):
+    # Каталоги обходятся через os.scandir пулом потоков: каждый поток берет
+    # каталог из очереди, обрабатывает его в visit() и кладет подкаталоги
+    # обратно. Переход на другую файловую систему (st_dev отличается от
+    # корня) не выполняется. on_update раз в progress_interval секунд и по
+    # завершении получает snapshot().
+    def __init__(self, roots, workers=8, on_update=None, progress_interval=0.5):
+        self.roots = list(roots)
+        self.workers = workers
+        self.on_update = on_update
+        self.progress_interval = progress_interval
+        self.stats = ScanStats()
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and not self._done.is_set()
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def snapshot(self):
+        with self._lock:
+            return (self.stats.copy(),)
+
+    def run(self):
+        for root in self.roots:
+            try:
+                # На Windows DirEntry.stat() возвращает st_dev = 0, а каждый
+                # диск и так сканируется отдельным корнем.
+                self._queue.put((root, os.stat(root).st_dev if os.name != 'nt' else None))
+            except OSError:
+                self.stats.errors += 1
+
+        threads = [threading.Thread(target=self.worker, daemon=True) for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+
+        waiter = threading.Thread(target=self._queue.join, daemon=True)
+        waiter.start()
+        while waiter.is_alive():
+            waiter.join(self.progress_interval)
+            self.report()
+
+        for _ in threads:
+            self._queue.put(None)
+        with self._lock:
+            self.stats.finished = time.monotonic()
+            self.stats.cancelled = self._cancel.is_set()
+        self._done.set()
+        self.report()
+
+    def report(self):
+        if self.on_update is not None:
+            self.on_update(*self.snapshot())
+
+    def worker(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            try:
+                if not self._cancel.is_set():
+                    self.visit(*item)
+            finally:
+                self._queue.task_done()
+
+    def descend(self, entry, device):
+        if device is None or entry.stat(follow_symlinks=False).st_dev == device:
+            self._queue.put((entry.path, device))
+
+    @abstractmethod
+    def visit(self, path, device):
+        # Обработка одного каталога; подкаталоги передаются в descend().
+        pass
+
+
+class LargeFileScanner(ParallelWalker):
+    # Лучшие top файлов размером от min_size хранятся в куче ограниченного
+    # размера; on_update получает статистику и текущий топ.
+    def __init__(self, roots, min_size=100 * 1024 * 1024, top=50, **options):
+        super().__init__(roots, **options)
+        self.min_size = min_size
+        self.top = top
+        self._heap = []
+
+    def results(self):
+        with self._lock:
+            return sorted(self._heap, reverse=True)
+
+    def snapshot(self):
+        with self._lock:
+            return self.stats.copy(), sorted(self._heap, reverse=True)
+
+    def visit(self, path, device):
+        files = 0
+        total = 0
+        found = []
+        errors = 0
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            self.descend(entry, device)
+                        elif entry.is_file(follow_symlinks=False):
+                            size = entry.stat(follow_symlinks=False).st_size
+                            files += 1
+                            total += size
+                            if size >= self.min_size:
+                                found.append((size, entry.path))
+                    except OSError:
+                        errors += 1
+        except OSError:
+            errors += 1
+
+        with self._lock:
+            self.stats.dirs += 1
+            self.stats.files += files
+            self.stats.bytes += total
+            self.stats.errors += errors
+            for item in found:
+                if len(self._heap) < self.top:
+                    heapq.heappush(self._heap, item)
+                elif item > self._heap[0]:
+                    heapq.heapreplace(self._heap, item)
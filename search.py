@@ -0,0 +1,134 @@
+import re
+
+import numpy as np
+
+# user:postgres name:nginx status:run cmd:--config pid:42 cpu>5 mem>=100
+TOKEN_RE = re.compile(r'^(\w+)(:|>=|<=|!=|>|<|=)(.*)$')
+
+PREFIX_FIELDS = {
+    'name': 'name',
+    'user': 'user',
+    'status': 'status',
+}
+SUBSTRING_FIELDS = {
+    'cmd': 'cmdline',
+    'cmdline': 'cmdline',
+}
+NUMERIC_FIELDS = {
+    'pid': 'pid',
+    'cpu': 'cpu',
+    'mem': 'memory',
+    'memory': 'memory',
+}
+COMPARATORS = {
+    '>': np.greater,
+    '>=': np.greater_equal,
+    '<': np.less,
+    '<=': np.less_equal,
+    '=': np.equal,
+    ':': np.equal,
+    '!=': np.not_equal,
+}
+
+
+class Condition:
+    __slots__ = ('kind', 'field', 'op', 'value')
+
+    def __init__(self, kind, field, op, value):
+        self.kind = kind
+        self.field = field
+        self.op = op
+        self.value = value
+
+    def __eq__(self, other):
+        return (self.kind, self.field, self.op, self.value) == (other.kind, other.field, other.op, other.value)
+
+    def __hash__(self):
+        return hash((self.kind, self.field, self.op, self.value))
+
+    def narrows(self, other):
+        # Удлинение подстроки или префикса может только сузить выборку,
+        # для числовых условий годится лишь точное совпадение.
+        if self == other:
+            return True
+        return (self.kind in ('text', 'prefix', 'substring') and self.kind == other.kind
+                and self.field == other.field and self.value.startswith(other.value))
+
+    def apply(self, snapshot, rows):
+        if self.kind == 'number':
+            column = getattr(snapshot, self.field)
+            return rows[COMPARATORS[self.op](column[rows], self.value)]
+
+        if self.kind == 'prefix':
+            vocab = snapshot.vocab[self.field]
+            low = np.searchsorted(vocab, self.value, 'left')
+            high = np.searchsorted(vocab, self.value + '\uffff', 'left')
+            codes = snapshot.sort_keys[self.field][rows]
+            return rows[(codes >= low) & (codes < high)]
+
+        value = self.value
+        if self.kind == 'substring':
+            column = snapshot.lower[self.field]
+            return np.fromiter((row for row in rows if value in column[row]), np.intp)
+
+        names = snapshot.lower['name']
+        users = snapshot.lower['user']
+        cmdlines = snapshot.lower['cmdline']
+        return np.fromiter((row for row in rows
+                            if value in names[row] or value in cmdlines[row] or value in users[row]),
+                           np.intp)
+
+
+def parse_token(token):
+    match = TOKEN_RE.match(token)
+    if match:
+        field, op, value = match.group(1), match.group(2), match.group(3)
+        if op == ':' and field in PREFIX_FIELDS and value:
+            return Condition('prefix', PREFIX_FIELDS[field], op, value)
+        if op == ':' and field in SUBSTRING_FIELDS and value:
+            return Condition('substring', SUBSTRING_FIELDS[field], op, value)
+        if field in NUMERIC_FIELDS:
+            try:
+                return Condition('number', NUMERIC_FIELDS[field], op, float(value))
+            except ValueError:
+                pass
+    return Condition('text', None, None, token)
+
+
+def parse_query(text):
+    return tuple(parse_token(token) for token in text.lower().split())
+
+
+def query_narrows(query, previous):
+    if previous is None:
+        return False
+    return all(any(condition.narrows(old) for condition in query) for old in previous)
+
+
+class ProcessSearch:
+    # Хранит результат предыдущего запроса по текущему снимку: если новый
+    # запрос только уточняет старый (пользователь продолжает печатать),
+    # проверяются лишь строки, подошедшие в прошлый раз.
+    def __init__(self):
+        self.snapshot = None
+        self.query = None
+        self.rows = None
+
+    def match(self, snapshot, text):
+        query = parse_query(text)
+        if not query:
+            self.snapshot, self.query, self.rows = snapshot, query, None
+            return np.arange(len(snapshot), dtype=np.intp)
+
+        if snapshot is self.snapshot and self.rows is not None and query_narrows(query, self.query):
+            rows = self.rows
+        else:
+            rows = np.arange(len(snapshot), dtype=np.intp)
+
+        for condition in sorted(query, key=lambda c: c.kind in ('text', 'substring')):
+            if not len(rows):
+                break
+            rows = condition.apply(snapshot, rows)
+
+        self.snapshot, self.query, self.rows = snapshot, query, rows
+        return rows
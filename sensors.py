@@ -0,0 +1,169 @@
+import os
+import shutil
+import string
+import threading
+from collections import Counter
+from pathlib import Path
+
+import psutil
+
+try:
+    import GPUtil
+except ImportError:
+    GPUtil = None
+
+HWMON_ROOT = '/sys/class/hwmon'
+CPU_CHIPS = ('coretemp', 'k10temp', 'zenpower', 'cpu_thermal', 'soc_thermal', 'acpitz')
+CPU_LABELS = ('package id 0', 'tctl', 'tdie', 'cpu')
+
+
+def read_text(path, default=''):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return default
+
+
+class HwmonSensor:
+    __slots__ = ('chip', 'label', 'path', 'fd')
+
+    def __init__(self, chip, label, path):
+        self.chip = chip
+        self.label = label
+        self.path = path
+        self.fd = None
+
+    @property
+    def name(self):
+        return f"{self.chip}/{self.label}"
+
+    def read(self):
+        # Дескриптор открывается один раз, значение читается через pread
+        # с нулевого смещения - без повторных open/close на каждом опросе.
+        if self.fd is None:
+            self.fd = os.open(self.path, os.O_RDONLY)
+        return int(os.pread(self.fd, 32, 0)) / 1000
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+def unique_labels(labels, suffixes):
+    # Повторяющиеся метки дополняются суффиксом (номером канала), иначе
+    # показания перезаписывали бы друг друга в словаре по имени.
+    counts = Counter(labels)
+    return [f"{label} ({suffix})" if counts[label] > 1 else label
+            for label, suffix in zip(labels, suffixes)]
+
+
+def discover_hwmon(root=HWMON_ROOT):
+    sensors = []
+    root = Path(root)
+    if not root.is_dir():
+        return sensors
+
+    devices = [(device, read_text(device / 'name', device.name)) for device in sorted(root.iterdir())]
+    chips = Counter(chip for _, chip in devices)
+    for device, chip in devices:
+        # Одноименные чипы (два nvme, coretemp на каждом процессоре)
+        # различаются номером hwmon: nvme0, nvme1.
+        if chips[chip] > 1:
+            chip += ''.join(char for char in device.name if char.isdigit())
+        paths = sorted(device.glob('temp*_input'), key=lambda p: int(p.name[4:-6] or 0))
+        prefixes = [path.name[:-len('_input')] for path in paths]
+        labels = [read_text(device / f"{prefix}_label", prefix) for prefix in prefixes]
+        for path, label in zip(paths, unique_labels(labels, prefixes)):
+            sensors.append(HwmonSensor(chip, label, str(path)))
+    return sensors
+
+
+def primary_temperature(readings):
+    if not readings:
+        return None
+    # Номер hwmon, добавленный к одноименным чипам, при сравнении не учитывается.
+    for name, value in readings.items():
+        chip, label = name.split('/', 1)
+        if chip.rstrip(string.digits) in CPU_CHIPS and label.lower() in CPU_LABELS:
+            return value
+    for name, value in readings.items():
+        if name.split('/', 1)[0].rstrip(string.digits) in CPU_CHIPS:
+            return value
+    return max(readings.values())
+
+
+class SensorReader:
+    # Доступные источники определяются один раз при создании: файлы hwmon
+    # в sysfs (Linux), psutil.sensors_temperatures() на остальных системах
+    # и GPUtil, только если в системе есть nvidia-smi.
+    def __init__(self, hwmon_root=HWMON_ROOT):
+        self.lock = threading.Lock()
+        self.hwmon = discover_hwmon(hwmon_root)
+        self.use_psutil = not self.hwmon and hasattr(psutil, 'sensors_temperatures')
+        self.gpu_available = GPUtil is not None and shutil.which('nvidia-smi') is not None
+        self.failed = set()
+
+    @property
+    def backends(self):
+        backends = []
+        if self.hwmon:
+            backends.append('hwmon')
+        if self.use_psutil:
+            backends.append('psutil')
+        if self.gpu_available:
+            backends.append('nvidia-smi')
+        return backends
+
+    def read_temperatures(self):
+        readings = {}
+        with self.lock:
+            for sensor in self.hwmon:
+                if sensor.path in self.failed:
+                    continue
+                try:
+                    readings[sensor.name] = sensor.read()
+                except (OSError, ValueError):
+                    # Некоторые датчики отдают ошибку постоянно (выключенное
+                    # устройство) - больше их не опрашиваем.
+                    sensor.close()
+                    self.failed.add(sensor.path)
+
+        if self.use_psutil:
+            try:
+                for chip, entries in (psutil.sensors_temperatures() or {}).items():
+                    # Записи одноименных чипов psutil сводит в один список.
+                    channels = [f"temp{i + 1}" for i in range(len(entries))]
+                    labels = unique_labels([entry.label or channel for entry, channel in zip(entries, channels)],
+                                           channels)
+                    for label, entry in zip(labels, entries):
+                        readings[f"{chip}/{label}"] = entry.current
+            except Exception:
+                self.use_psutil = False
+        return readings
+
+    def read_gpus(self):
+        if not self.gpu_available:
+            return {}
+        try:
+            return {f"gpu{i}": float(gpu.temperature) for i, gpu in enumerate(GPUtil.getGPUs())}
+        except Exception:
+            self.gpu_available = False
+            return {}
+
+    def close(self):
+        with self.lock:
+            for sensor in self.hwmon:
+                sensor.close()
+
+    def probe(self):
+        readings = self.read_temperatures()
+        temp = primary_temperature(readings)
+        return {'temp': round(temp, 1) if temp is not None else 0, 'sensors': readings}
+
+    def probe_gpu(self):
+        readings = self.read_gpus()
+        if not readings:
+            return None
+        return {'gpu_temp': max(readings.values()), 'gpus': readings}
@@ -0,0 +1,259 @@
+import mmap
+import numbers
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+MAGIC = b'SMTS'
+VERSION = 1
+HEADER = struct.Struct('<4sHHI')
+SEGMENT_SUFFIX = '.seg'
+
+
+def sample_fields(sample):
+    # В сегменты попадают только скалярные поля. Разбивки по интерфейсам,
+    # дискам и датчикам (nics, disks, sensors) не сохраняются: их состав
+    # меняется (veth-интерфейсы контейнеров, горячее подключение дисков),
+    # и каждое изменение открывало бы новый сегмент. В истории остаются
+    # суммарные net*, io*, temp. Числа NumPy из плагинов (np.float32,
+    # np.int64) сохраняются так же, как их отдает экспорт Prometheus.
+    return tuple(sorted(
+        name for name, value in sample.items()
+        if name != 'time' and isinstance(value, numbers.Real) and not isinstance(value, bool)
+    ))
+
+
+class Segment:
+    # Файл сегмента: заголовок (magic, версия, число полей, размер заголовка,
+    # имена полей через '\n') и далее записи фиксированной длины из float64:
+    # время и значения полей в порядке заголовка.
+    def __init__(self, path):
+        self.path = Path(path)
+        start, _, seq = self.path.stem.partition('-')
+        self.start = int(start) / 1000
+        self.key = (int(start), int(seq or 0))
+        self._mmap = None
+        with open(self.path, 'rb') as f:
+            magic, version, count, header_size = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{self.path}: неизвестный формат сегмента")
+            names = f.read(header_size - HEADER.size).rstrip(b'\0').decode('utf-8')
+        self.fields = tuple(names.split('\n')) if count else ()
+        self.header_size = header_size
+        self.dtype = segment_dtype(self.fields)
+
+    def __len__(self):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return 0
+        return max(size - self.header_size, 0) // self.dtype.itemsize
+
+    def read(self):
+        # Отображение файла переиспользуется между чтениями и создается
+        # заново, только если текущий сегмент успел дорасти за его границу.
+        count = len(self)
+        if not count:
+            return np.empty(0, self.dtype)
+        size = self.header_size + count * self.dtype.itemsize
+        if self._mmap is None or len(self._mmap) < size:
+            self.close()
+            with open(self.path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return np.frombuffer(self._mmap, self.dtype, count, self.header_size)
+
+    def close(self):
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # На отображение еще ссылаются выданные массивы - оно
+                # закроется, когда они будут освобождены.
+                pass
+            self._mmap = None
+
+
+def segment_dtype(fields):
+    return np.dtype([('time', '<f8')] + [(name, '<f8') for name in fields])
+
+
+def segment_header(fields):
+    names = '\n'.join(fields).encode('utf-8')
+    header_size = HEADER.size + len(names)
+    header_size += -header_size % 8
+    return HEADER.pack(MAGIC, VERSION, len(fields), header_size) + names.ljust(header_size - HEADER.size, b'\0')
+
+
+class TimeSeriesStore:
+    # Хранилище истории метрик: только дозапись, один сегмент на
+    # segment_seconds (по умолчанию сутки) или до смены набора полей.
+    # Старые сегменты удаляются по retention_days.
+    def __init__(self, directory, retention_days=7, segment_seconds=86400, flush_interval=10):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.retention_days = retention_days
+        self.segment_seconds = segment_seconds
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self._file = None
+        self._fields = None
+        self._record = None
+        self._segment_end = 0
+        self._last_flush = 0
+        self._last_retention = 0
+        self._segments = {}
+
+    def _open_segment(self, timestamp, fields):
+        self._close_segment()
+        start_ms = int(timestamp * 1000)
+        # Номер дописывается и к первому файлу, чтобы имена с одним временем
+        # сортировались по порядку создания.
+        seq = 0
+        path = self.directory / f"{start_ms:015d}-{seq:04d}{SEGMENT_SUFFIX}"
+        while path.exists():
+            seq += 1
+            path = self.directory / f"{start_ms:015d}-{seq:04d}{SEGMENT_SUFFIX}"
+
+        self._file = open(path, 'wb')
+        self._file.write(segment_header(fields))
+        self._file.flush()
+        self._fields = fields
+        self._record = struct.Struct('<' + 'd' * (len(fields) + 1))
+        self._segment_end = (timestamp // self.segment_seconds + 1) * self.segment_seconds
+
+    def _close_segment(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def append(self, sample):
+        timestamp = sample['time']
+        fields = sample_fields(sample)
+        with self.lock:
+            if self._file is None or fields != self._fields or timestamp >= self._segment_end:
+                self._open_segment(timestamp, fields)
+
+            self._file.write(self._record.pack(timestamp, *[sample[name] for name in fields]))
+
+            now = time.monotonic()
+            if now - self._last_flush >= self.flush_interval:
+                self._file.flush()
+                self._last_flush = now
+            if now - self._last_retention >= 3600:
+                self._last_retention = now
+                self._apply_retention()
+
+    def flush(self):
+        with self.lock:
+            if self._file is not None:
+                self._file.flush()
+                self._last_flush = time.monotonic()
+
+    def close(self):
+        with self.lock:
+            self._close_segment()
+            for segment in self._segments.values():
+                segment.close()
+            self._segments.clear()
+
+    def _apply_retention(self):
+        if not self.retention_days:
+            return
+        cutoff = time.time() - self.retention_days * 86400
+        current = self._file.name if self._file is not None else None
+        for path in self.directory.glob('*' + SEGMENT_SUFFIX):
+            try:
+                if str(path) != current and path.stat().st_mtime < cutoff:
+                    segment = self._segments.pop(path, None)
+                    if segment is not None:
+                        segment.close()
+                    path.unlink()
+            except OSError as e:
+                print(f"Ошибка удаления сегмента {path}: {e}")
+
+    def segments(self):
+        # Сегменты кэшируются вместе с отображениями файлов; порядок - по
+        # времени начала и номеру, а не по имени файла.
+        with self.lock:
+            paths = set(self.directory.glob('*' + SEGMENT_SUFFIX))
+            for path in list(self._segments):
+                if path not in paths:
+                    self._segments.pop(path).close()
+            for path in paths - self._segments.keys():
+                try:
+                    self._segments[path] = Segment(path)
+                except (OSError, ValueError, struct.error) as e:
+                    print(f"Ошибка чтения сегмента {path}: {e}")
+            return sorted(self._segments.values(), key=lambda segment: segment.key)
+
+    def fields(self, start=None, end=None):
+        # Объединение полей сегментов, пересекающихся с интервалом; читаются
+        # только заголовки.
+        segments = self.segments()
+        names = {}
+        for i, segment in enumerate(segments):
+            if end is not None and segment.start > end:
+                break
+            if start is not None and i + 1 < len(segments) and segments[i + 1].start <= start:
+                continue
+            names.update(dict.fromkeys(segment.fields))
+        return list(names)
+
+    def iter_chunks(self, start=None, end=None, fields=None, chunk_size=65536):
+        self.flush()
+        segments = self.segments()
+        for i, segment in enumerate(segments):
+            if end is not None and segment.start > end:
+                break
+            if start is not None and i + 1 < len(segments) and segments[i + 1].start <= start:
+                continue
+
+            records = segment.read()
+            if not len(records):
+                continue
+            times = records['time']
+            mask = np.ones(len(records), dtype=bool)
+            if start is not None:
+                mask &= times >= start
+            if end is not None:
+                mask &= times <= end
+            indices = np.flatnonzero(mask)
+            if not len(indices):
+                continue
+
+            names = fields if fields is not None else segment.fields
+            for offset in range(0, len(indices), chunk_size):
+                rows = indices[offset:offset + chunk_size]
+                if rows[-1] - rows[0] + 1 == len(rows):
+                    part = records[rows[0]:rows[-1] + 1]
+                else:
+                    part = records[rows]
+                chunk = {'time': part['time']}
+                for name in names:
+                    if name in segment.fields:
+                        chunk[name] = part[name]
+                    else:
+                        chunk[name] = np.full(len(part), np.nan)
+                yield chunk
+
+    def query(self, start=None, end=None, fields=None):
+        chunks = list(self.iter_chunks(start, end, fields))
+        if not chunks:
+            names = fields or ()
+            return {name: np.empty(0) for name in ('time',) + tuple(names)}
+
+        if fields is None:
+            names = list(dict.fromkeys(name for chunk in chunks for name in chunk))
+        else:
+            names = ['time'] + list(fields)
+        result = {}
+        for name in names:
+            result[name] = np.concatenate([
+                chunk[name] if name in chunk else np.full(len(chunk['time']), np.nan)
+                for chunk in chunks
+            ])
+        return result
@@ -0,0 +1,27 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from alerts import AlertEngine, AlertRule
+
+
+class AlertEngineTest(unittest.TestCase):
+    def test_missing_field_resolves_firing_alert(self):
+        engine = AlertEngine([AlertRule('nic_busy', 'nics.*.util', 90)])
+        events = []
+        engine.subscribe(events.append)
+
+        engine.evaluate({'time': 1.0, 'nics': {'eth0': {'util': 95.0}, 'eth1': {'util': 10.0}}})
+        self.assertEqual([(event.field, event.state) for event in events], [('nics.eth0.util', 'firing')])
+
+        engine.evaluate({'time': 2.0, 'nics': {'eth1': {'util': 10.0}}})
+        self.assertEqual([(event.field, event.state) for event in events[1:]], [('nics.eth0.util', 'resolved')])
+        self.assertEqual(events[1].value, 95.0)
+        self.assertEqual(events[1].time, 2.0)
+        self.assertEqual(engine.active, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+class TreeviewReconciler:
+    # Синхронизирует ttk.Treeview с набором строк по ключу: добавляет новые
+    # строки, удаляет исчезнувшие и меняет только изменившиеся ячейки, так
+    # что выделение и позиция прокрутки сохраняются между обновлениями.
+    def __init__(self, tree, columns):
+        self.tree = tree
+        self.columns = tuple(columns)
+        self.items = {}
+        self.values = {}
+        self.keys = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def key_for_item(self, item):
+        return self.keys.get(item)
+
+    def reconcile(self, rows, ordered=False):
+        # ordered=True - порядок строк в дереве приводится к порядку rows
+        # (перемещаются только строки, стоящие не на своем месте).
+        tree = self.tree
+        inserted = updated = 0
+
+        removed = [key for key in self.items if key not in rows]
+        for key in removed:
+            item = self.items.pop(key)
+            self.values.pop(key, None)
+            self.keys.pop(item, None)
+            if tree.exists(item):
+                tree.delete(item)
+
+        for key, values in rows.items():
+            item = self.items.get(key)
+            if item is None:
+                item = tree.insert('', 'end', values=values)
+                self.items[key] = item
+                self.values[key] = values
+                self.keys[item] = key
+                inserted += 1
+                continue
+
+            old_values = self.values[key]
+            if old_values == values:
+                continue
+
+            for column, old, new in zip(self.columns, old_values, values):
+                if old != new:
+                    tree.set(item, column, new)
+            self.values[key] = values
+            updated += 1
+
+        if ordered:
+            current = list(tree.get_children(''))
+            for index, key in enumerate(rows):
+                item = self.items[key]
+                if current[index] != item:
+                    tree.move(item, '', index)
+                    current.remove(item)
+                    current.insert(index, item)
+
+        return inserted, len(removed), updated
+
+    def clear(self):
+        for item in self.items.values():
+            if self.tree.exists(item):
+                self.tree.delete(item)
+        self.items.clear()
+        self.values.clear()
+        self.keys.clear()
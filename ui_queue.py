@@ -0,0 +1,70 @@
+import threading
+from collections import OrderedDict
+
+
+class UIUpdateQueue:
+    # Очередь между фоновыми потоками и главным циклом Tk. Обновления
+    # хранятся по ключу виджета: новое обновление заменяет ещё не
+    # применённое старое, поэтому за один проход применяется только
+    # последний кадр для каждого виджета.
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.dropped = 0
+        self.merged = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def put(self, key, func, *args):
+        with self._lock:
+            if key in self._items:
+                del self._items[key]
+                self.merged += 1
+            elif len(self._items) >= self.maxsize:
+                self._items.popitem(last=False)
+                self.dropped += 1
+            self._items[key] = (func, args)
+
+    def drain(self):
+        with self._lock:
+            items = list(self._items.values())
+            self._items.clear()
+        return items
+
+
+class TkUpdatePump:
+    def __init__(self, root, queue, interval=50):
+        self.root = root
+        self.queue = queue
+        self.interval = interval
+        self.running = False
+        self._after_id = None
+
+    def start(self):
+        self.running = True
+        self._after_id = self.root.after(self.interval, self.pump)
+
+    def stop(self):
+        self.running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def pump(self):
+        self._after_id = None
+        if not self.running:
+            return
+
+        for func, args in self.queue.drain():
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"Ошибка обновления интерфейса: {e}")
+
+        self._after_id = self.root.after(self.interval, self.pump)
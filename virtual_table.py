@@ -0,0 +1,150 @@
+from tkinter import ttk
+
+
+class VirtualTable:
+    # ttk.Treeview, в котором существует только столько элементов, сколько
+    # строк помещается на экране. Данные берутся из модели (__len__, row(i),
+    # key(i), position(key)), а прокрутка лишь меняет смещение в модели.
+    def __init__(self, parent, model, columns, height=20):
+        self.model = model
+        self.columns = tuple(columns)
+        self.offset = 0
+        self.visible = height
+        self.selected_key = None
+        self.items = []
+        self.shown = []
+        self._programmatic = ()
+
+        self.tree = ttk.Treeview(parent, columns=self.columns, show='headings',
+                                 height=height, selectmode='browse')
+        self.scrollbar = ttk.Scrollbar(parent, orient='vertical', command=self.on_scrollbar)
+
+        self.tree.bind('<Configure>', self.on_configure)
+        self.tree.bind('<<TreeviewSelect>>', self.on_select)
+        self.tree.bind('<MouseWheel>', self.on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll(-3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll(3))
+        self.tree.bind('<Up>', lambda e: self.move_selection(-1))
+        self.tree.bind('<Down>', lambda e: self.move_selection(1))
+        self.tree.bind('<Prior>', lambda e: self.move_selection(-self.visible))
+        self.tree.bind('<Next>', lambda e: self.move_selection(self.visible))
+        self.tree.bind('<Home>', lambda e: self.move_selection(-len(self.model)))
+        self.tree.bind('<End>', lambda e: self.move_selection(len(self.model)))
+
+        self.resize_pool(height)
+
+    def resize_pool(self, count):
+        count = max(count, 1)
+        while len(self.items) < count:
+            item = self.tree.insert('', 'end', values=())
+            self.tree.detach(item)
+            self.items.append(item)
+            self.shown.append(None)
+        while len(self.items) > count:
+            self.tree.delete(self.items.pop())
+            self.shown.pop()
+        self.visible = count
+
+    def on_configure(self, event):
+        style = ttk.Style()
+        row_height = int(style.lookup('Treeview', 'rowheight') or 20)
+        header = row_height
+        if self.items:
+            bbox = self.tree.bbox(self.items[0])
+            if bbox:
+                header, row_height = bbox[1], bbox[3]
+        count = max((event.height - header) // max(row_height, 1), 1)
+        if count != self.visible:
+            self.resize_pool(count)
+            self.refresh()
+
+    def clamp_offset(self):
+        self.offset = max(0, min(self.offset, len(self.model) - self.visible))
+
+    def refresh(self):
+        self.clamp_offset()
+        total = len(self.model)
+        selected_item = None
+
+        for i, item in enumerate(self.items):
+            index = self.offset + i
+            if index < total:
+                values = self.model.row(index)
+                if self.shown[i] != values:
+                    if self.shown[i] is None:
+                        self.tree.move(item, '', i)
+                    self.tree.item(item, values=values)
+                    self.shown[i] = values
+                if self.selected_key is not None and self.model.key(index) == self.selected_key:
+                    selected_item = item
+            elif self.shown[i] is not None:
+                self.tree.detach(item)
+                self.shown[i] = None
+
+        selection = self.tree.selection()
+        if selected_item is not None:
+            if selection != (selected_item,):
+                self._programmatic = (selected_item,)
+                self.tree.selection_set(selected_item)
+        elif selection:
+            self._programmatic = ()
+            self.tree.selection_remove(selection)
+
+        if total:
+            self.scrollbar.set(self.offset / total, min((self.offset + self.visible) / total, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll(self, delta):
+        self.offset += delta
+        self.refresh()
+        return 'break'
+
+    def on_mousewheel(self, event):
+        return self.scroll(-3 if event.delta > 0 else 3)
+
+    def on_scrollbar(self, action, value, unit=None):
+        if action == 'moveto':
+            self.offset = int(float(value) * len(self.model))
+        elif action == 'scroll':
+            step = self.visible if unit == 'pages' else 1
+            self.offset += int(value) * step
+        self.refresh()
+
+    def on_select(self, event=None):
+        selection = self.tree.selection()
+        if selection == self._programmatic:
+            return
+        self._programmatic = ()
+        if not selection or selection[0] not in self.items:
+            return
+        index = self.offset + self.items.index(selection[0])
+        if index < len(self.model):
+            self.selected_key = self.model.key(index)
+
+    def move_selection(self, delta):
+        total = len(self.model)
+        if not total:
+            return 'break'
+
+        position = self.model.position(self.selected_key) if self.selected_key is not None else None
+        if position is None:
+            position = self.offset if delta > 0 else self.offset + self.visible - 1
+        else:
+            position += delta
+        position = max(0, min(position, total - 1))
+
+        self.selected_key = self.model.key(position)
+        if position < self.offset:
+            self.offset = position
+        elif position >= self.offset + self.visible:
+            self.offset = position - self.visible + 1
+        self.refresh()
+        return 'break'
+
+    def select_row(self, item):
+        if item in self.items:
+            index = self.offset + self.items.index(item)
+            if index < len(self.model):
+                self.selected_key = self.model.key(index)
+                self.refresh()